@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -63,9 +63,9 @@ def init_app():
         else:
             time_period = C.TIME_PERIOD
 
-        data = Data(
-            data_spec_file=C.DATA_SPEC_FILE,
-        ).read_all_data(days=time_period)
+        data_reader = Data(data_spec_file=C.DATA_SPEC_FILE)
+        data = data_reader.read_all_data(days=time_period)
+        data_reader.start_cache_refresh(days=time_period)
 
         # Import Dash applications.
         err_msg = "Application not loaded, no data available."
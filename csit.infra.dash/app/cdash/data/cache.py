@@ -0,0 +1,314 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local on-disk cache of parquets stored in S3 compatible storage.
+"""
+
+import os
+import json
+import fcntl
+import logging
+import boto3
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from time import time
+from typing import Optional
+
+from ..utils.constants import Constants as C
+
+
+class ParquetCache:
+    """Keeps local copies of parquet objects stored in S3.
+
+    The objects are stored as <cache_dir>/<bucket>/<key>, so the local paths
+    keep the hive partitions. The index maps S3 path of each cached object
+    to its last_modified timestamp, an object is downloaded only if it is
+    not in the index or its last_modified differs.
+
+    The cache directory can be shared by more processes, the
+    synchronization with S3 is guarded by a lock file.
+    """
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.lock"
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize the cache, create the cache directory if needed.
+
+        :param cache_dir: Path to the local directory to keep the data in.
+        :type cache_dir: str
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._index_file = os.path.join(self._cache_dir, self.INDEX_FILE)
+        self._lock_file = os.path.join(self._cache_dir, self.LOCK_FILE)
+
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=C.AWS_ENDPOINT_URL if C.AWS_ENDPOINT_URL else None,
+            config=Config(max_pool_connections=C.MAX_POOL_SIZE)
+        )
+
+    @staticmethod
+    def partition_prefix(
+            path: str,
+            partition: str,
+            partition_name: str
+        ) -> str:
+        """Return S3 prefix of one partition of the data set.
+
+        :param path: S3 path to the data set (e.g. s3://bucket/prefix).
+        :param partition: Name of the partition column.
+        :param partition_name: Value of the partition column.
+        :type path: str
+        :type partition: str
+        :type partition_name: str
+        :returns: S3 prefix (e.g. s3://bucket/prefix/test_type=mrr/).
+        :rtype: str
+        """
+        return f"{path.rstrip('/')}/{partition}={partition_name}/"
+
+    def _local_path(self, path: str) -> str:
+        """Return the local path of S3 object or prefix.
+
+        :param path: S3 path (e.g. s3://bucket/key).
+        :type path: str
+        :returns: Path in the cache directory.
+        :rtype: str
+        """
+        return os.path.join(self._cache_dir, path[len("s3://"):])
+
+    def _load_index(self) -> dict:
+        """Read the index, empty if it does not exist or is not readable.
+
+        :returns: S3 paths of cached objects mapped to their last_modified.
+        :rtype: dict
+        """
+        try:
+            with open(self._index_file, "r") as file_read:
+                return json.load(file_read)
+        except (IOError, ValueError):
+            return dict()
+
+    def _save_index(self, index: dict) -> None:
+        """Write the index, atomically replacing the previous one.
+
+        :param index: S3 paths of cached objects mapped to their
+            last_modified.
+        :type index: dict
+        """
+        tmp_file = f"{self._index_file}.{os.getpid()}"
+        with open(tmp_file, "w") as file_write:
+            json.dump(index, file_write)
+        os.replace(tmp_file, self._index_file)
+
+    @contextmanager
+    def _lock(self, blocking: bool=True):
+        """Hold the lock of the cache directory.
+
+        :param blocking: If False and the lock is held by someone else,
+            do not wait for it.
+        :type blocking: bool
+        :returns: True if the lock is held, False otherwise.
+        :rtype: Iterator[bool]
+        """
+        with open(self._lock_file, "w") as lock_file:
+            flags = fcntl.LOCK_EX
+            if not blocking:
+                flags |= fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _list_objects(
+            self,
+            prefix: str,
+            last_modified_begin: Optional[datetime]=None
+        ) -> dict:
+        """List parquet objects under the S3 prefix with last_modified.
+
+        :param prefix: S3 prefix (e.g. s3://bucket/prefix/).
+        :param last_modified_begin: Ignore objects modified before.
+        :type prefix: str
+        :type last_modified_begin: datetime, optional
+        :returns: S3 paths of the objects mapped to their last_modified.
+        :rtype: dict
+        """
+        bucket, _, key_prefix = prefix[len("s3://"):].partition("/")
+        objects = dict()
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix):
+            for obj in page.get("Contents", list()):
+                if not obj["Key"].endswith("parquet") or obj["Size"] == 0:
+                    continue
+                if last_modified_begin and \
+                        obj["LastModified"] < last_modified_begin:
+                    continue
+                objects[f"s3://{bucket}/{obj['Key']}"] = \
+                    obj["LastModified"].isoformat()
+        return objects
+
+    def _download(self, path: str) -> None:
+        """Download S3 object into the cache directory.
+
+        The object is downloaded into a temporary file first, so the local
+        copy is never incomplete.
+
+        :param path: S3 path of the object.
+        :type path: str
+        """
+        local_path = self._local_path(path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        bucket, _, key = path[len("s3://"):].partition("/")
+        tmp_path = f"{local_path}.{os.getpid()}.tmp"
+        self._client.download_file(bucket, key, tmp_path)
+        os.replace(tmp_path, local_path)
+
+    def sync(
+            self,
+            prefix: str,
+            last_modified_begin: Optional[datetime]=None,
+            blocking: bool=True
+        ) -> Optional[list]:
+        """Download new and changed objects under the prefix, remove
+        the local copies of objects not present in S3 anymore.
+
+        :param prefix: S3 prefix (e.g. s3://bucket/prefix/).
+        :param last_modified_begin: Ignore (and remove from cache) objects
+            modified before.
+        :param blocking: If False and the cache is being synchronized by
+            someone else, return None without waiting.
+        :type prefix: str
+        :type last_modified_begin: datetime, optional
+        :type blocking: bool
+        :returns: Local paths of the objects under the prefix, None if not
+            synchronized.
+        :rtype: list
+        """
+        start = time()
+        with self._lock(blocking=blocking) as locked:
+            if not locked:
+                return None
+            objects = self._list_objects(prefix, last_modified_begin)
+            index = self._load_index()
+            new_objects = [
+                path for path, last_modified in objects.items()
+                if index.get(path) != last_modified
+                or not os.path.isfile(self._local_path(path))
+            ]
+            old_objects = list()
+            try:
+                with ThreadPoolExecutor(max_workers=C.MAX_POOL_SIZE) as pool:
+                    downloads = pool.map(self._download, new_objects)
+                    for path, _ in zip(new_objects, downloads):
+                        index[path] = objects[path]
+                old_objects = [
+                    path for path in index
+                    if path.startswith(prefix) and path not in objects
+                ]
+                for path in old_objects:
+                    try:
+                        os.remove(self._local_path(path))
+                    except FileNotFoundError:
+                        pass
+                    index.pop(path)
+            finally:
+                self._save_index(index)
+        logging.debug(
+            f"\nSynchronization of cache {prefix} took: {time() - start}\n"
+            f"Downloaded: {len(new_objects)}, removed: {len(old_objects)}, "
+            f"cached: {len(objects)}\n"
+        )
+        return [self._local_path(path) for path in sorted(objects)]
+
+    def read(
+            self,
+            path: str,
+            partition: str,
+            partition_name: str,
+            columns: Optional[list]=None,
+            last_modified_begin: Optional[datetime]=None,
+            schema: Optional[pa.Schema]=None
+        ) -> pd.DataFrame:
+        """Synchronize one partition of the data set and read it from
+        the local copy.
+
+        The result is the same as from awswrangler.s3.read_parquet with
+        dataset=True and dtype_backend="pyarrow", the partition columns are
+        categories.
+
+        :param path: S3 path to the data set (e.g. s3://bucket/prefix).
+        :param partition: Name of the partition column.
+        :param partition_name: Value of the partition column to read.
+        :param columns: Names of columns to read from the file(s).
+        :param last_modified_begin: Ignore objects modified before.
+        :param schema: Schema to use when reading data from the parquet.
+        :type path: str
+        :type partition: str
+        :type partition_name: str
+        :type columns: list, optional
+        :type last_modified_begin: datetime, optional
+        :type schema: pyarrow.Schema, optional
+        :returns: Pandas DataFrame, empty if there are no objects.
+        :rtype: DataFrame
+        """
+        files = self.sync(
+            self.partition_prefix(path, partition, partition_name),
+            last_modified_begin=last_modified_begin
+        )
+        if not files:
+            return pd.DataFrame()
+
+        base_dir = self._local_path(path.rstrip("/"))
+        partition_cols = [
+            item.split("=", 1)[0]
+            for item in os.path.relpath(files[0], base_dir).split(os.sep)[:-1]
+        ]
+        partitioning = ds.partitioning(
+            pa.schema([(name, pa.string()) for name in partition_cols]),
+            flavor="hive"
+        )
+        if schema is not None:
+            schema = pa.schema(
+                [fld for fld in schema if fld.name not in partition_cols] +
+                list(partitioning.schema)
+            )
+        dataset = ds.dataset(
+            files,
+            schema=schema,
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=base_dir
+        )
+        if columns:
+            columns = [
+                col for col in columns if col not in partition_cols
+            ] + partition_cols
+        df = dataset.to_table(columns=columns).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+        for name in partition_cols:
+            df[name] = df[name].astype(str).astype("category")
+        return df
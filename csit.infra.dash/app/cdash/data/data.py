@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -23,12 +23,15 @@ import pyarrow as pa
 
 from yaml import load, FullLoader, YAMLError
 from datetime import datetime, timedelta
-from time import time
+from threading import Thread
+from time import sleep, time
 from pytz import UTC
 from awswrangler.exceptions import EmptyDataFrame, NoFilesFound
+from botocore.exceptions import BotoCoreError, ClientError
 from pyarrow.lib import ArrowInvalid, ArrowNotImplementedError
 
 from ..utils.constants import Constants as C
+from .cache import ParquetCache
 
 
 # If True, pyarrow.Schema is generated. See also condition in the method
@@ -66,6 +69,9 @@ class Data:
             "coverage": pd.DataFrame()
         }
 
+        # Local copy of parquets, None if disabled:
+        self._cache = ParquetCache(C.CACHE_DIR) if C.CACHE_DIR else None
+
         # Read from files:
         try:
             with open(self._data_spec_file, "r") as file_read:
@@ -336,6 +342,106 @@ class Data:
 
         return df
 
+    def _create_dataframe_from_cache(
+            self,
+            data_set: dict,
+            columns=None,
+            days=None,
+            schema=None
+        ) -> pd.DataFrame:
+        """Read parquets through the local cache and returns Pandas
+        DataFrame. Only objects not in the cache are downloaded from S3.
+
+        :param data_set: The data set specification from data.yaml.
+        :param columns: Names of columns to read from the file(s).
+        :param days: Number of days to filter.
+        :param schema: Path to schema to use when reading data from the parquet.
+        :type data_set: dict
+        :type columns: List[str], optional
+        :type days: integer, optional
+        :type schema: string
+        :returns: Pandas DataFrame or None if the cache cannot be used.
+        :rtype: DataFrame
+        """
+        start = time()
+        if days:
+            last_modified_begin = datetime.now(tz=UTC) - timedelta(days=days)
+        else:
+            last_modified_begin = None
+        try:
+            df = self._cache.read(
+                path=data_set["path"],
+                partition=data_set["partition"],
+                partition_name=data_set["partition_name"],
+                columns=columns,
+                last_modified_begin=last_modified_begin,
+                schema=schema
+            )
+        except (BotoCoreError, ClientError, OSError, ArrowInvalid,
+                ArrowNotImplementedError) as err:
+            logging.error(
+                f"Reading of data from cache FAILED, reading from S3.\n"
+                f"{repr(err)}"
+            )
+            return None
+
+        df.info(verbose=True, memory_usage="deep")
+        logging.debug(
+            f"\nCreation of dataframe {data_set['path']} from cache took: "
+            f"{time() - start}\n"
+        )
+        return df
+
+    def _refresh_cache(self, days: int=None) -> None:
+        """Periodically download new parquets into the local cache.
+
+        Runs forever, intended to be the target of a daemon thread.
+        If the cache is being synchronized by another process, the data set
+        is skipped in this period.
+
+        :param days: Number of days to filter. If None, all data is kept.
+        :type days: int
+        """
+        while True:
+            sleep(C.CACHE_REFRESH_PERIOD)
+            for data_set in self._data_spec:
+                if days and data_set["data_type"] in ("trending", "statistics"):
+                    last_modified_begin = \
+                        datetime.now(tz=UTC) - timedelta(days=days)
+                else:
+                    last_modified_begin = None
+                try:
+                    self._cache.sync(
+                        ParquetCache.partition_prefix(
+                            data_set["path"],
+                            data_set["partition"],
+                            data_set["partition_name"]
+                        ),
+                        last_modified_begin=last_modified_begin,
+                        blocking=False
+                    )
+                except (BotoCoreError, ClientError, OSError) as err:
+                    logging.error(f"Refresh of cache FAILED.\n{repr(err)}")
+
+    def start_cache_refresh(self, days: int=None) -> None:
+        """Start the periodic refresh of the local cache in a background
+        thread, so it does not block handling of requests. The refreshed
+        parquets are used by the next start of the application.
+
+        Nothing is started if the cache or the refresh is disabled.
+
+        :param days: Number of days to filter. If None, all data is kept.
+        :type days: int
+        """
+        if self._cache is None or C.CACHE_REFRESH_PERIOD <= 0:
+            return
+        Thread(
+            target=self._refresh_cache,
+            args=(days, ),
+            name="cache-refresh",
+            daemon=True
+        ).start()
+
     def read_all_data(self, days: int=None) -> dict:
         """Read all data necessary for all applications.
 
@@ -391,13 +497,22 @@ class Data:
                 return
 
             # Read data:
-            data = Data._create_dataframe_from_parquet(
-                path=data_set["path"],
-                partition_filter=partition_filter,
-                columns=data_set.get("columns", None),
-                days=time_period,
-                schema=schema
-            )
+            data = None
+            if self._cache is not None:
+                data = self._create_dataframe_from_cache(
+                    data_set=data_set,
+                    columns=data_set.get("columns", None),
+                    days=time_period,
+                    schema=schema
+                )
+            if data is None:
+                data = Data._create_dataframe_from_parquet(
+                    path=data_set["path"],
+                    partition_filter=partition_filter,
+                    columns=data_set.get("columns", None),
+                    days=time_period,
+                    schema=schema
+                )
             if data_set["data_type"] in ("iterative", "coverage"):
                 if not data.empty:
                     data["release"] = data_set["release"]
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -14,6 +14,7 @@
 """Plotly Dash HTML layout override.
 """
 
+import numpy as np
 import pandas as pd
 import dash_bootstrap_components as dbc
 
@@ -25,7 +26,7 @@ from dash import Input, Output, State
 
 from ..utils.constants import Constants as C
 from ..utils.utils import gen_new_url, navbar_trending, get_topo_arch
-from ..utils.anomalies import classify_anomalies
+from ..utils.anomalies import classify_anomalies_batch
 from ..utils.url_processing import url_decode
 from .tables import table_summary
 
@@ -89,9 +90,6 @@ class Layout:
                 replace("2n-", "")
             return f"{suite.split('-')[0]}-{lst_tst[-1]}"
 
-        def _get_rindex(array: list, itm: any) -> int:
-            return len(array) - 1 - array[::-1].index(itm)
-
         tst_info = {
             "job": list(),
             "build": list(),
@@ -103,6 +101,7 @@ class Layout:
             "regressions": list(),
             "progressions": list()
         }
+        jobs_series = list()
         for job in self._jobs:
             # Create lists of failed tests:
             df_job = data_trending.loc[(data_trending["job"] == job)]
@@ -127,10 +126,9 @@ class Layout:
                 l_failed = list()
             tst_info["failed"].append(sorted(l_failed))
 
-            # Create lists of regressions and progressions:
-            l_reg = list()
-            l_prog = list()
-
+            # Collect series to search for regressions and progressions,
+            # (name, x axis, values) for each:
+            series = list()
             tests = df_job["test_id"].unique()
             for test in tests:
                 tst_data = df_job.loc[(
@@ -144,44 +142,20 @@ class Layout:
                     if tst_data.empty:
                         continue
                     x_axis = tst_data["start_time"].tolist()
-                    try:
-                        anomalies, _, _ = classify_anomalies({
-                            k: v for k, v in zip(
-                                x_axis,
-                                tst_data["result_ndr_lower_rate_value"].tolist()
-                            )
-                        })
-                    except ValueError:
-                        continue
-                    if "progression" in anomalies:
-                        l_prog.append((
-                            _create_test_name(test).replace("-ndrpdr", "-ndr"),
-                            x_axis[_get_rindex(anomalies, "progression")]
-                        ))
-                    if "regression" in anomalies:
-                        l_reg.append((
-                            _create_test_name(test).replace("-ndrpdr", "-ndr"),
-                            x_axis[_get_rindex(anomalies, "regression")]
-                        ))
-                    try:
-                        anomalies, _, _ = classify_anomalies({
-                            k: v for k, v in zip(
-                                x_axis,
-                                tst_data["result_pdr_lower_rate_value"].tolist()
-                            )
-                        })
-                    except ValueError:
-                        continue
-                    if "progression" in anomalies:
-                        l_prog.append((
-                            _create_test_name(test).replace("-ndrpdr", "-pdr"),
-                            x_axis[_get_rindex(anomalies, "progression")]
-                        ))
-                    if "regression" in anomalies:
-                        l_reg.append((
-                            _create_test_name(test).replace("-ndrpdr", "-pdr"),
-                            x_axis[_get_rindex(anomalies, "regression")]
-                        ))
+                    name = _create_test_name(test)
+                    # Missing NDR is a failure, counted as zero.
+                    series.append((
+                        name.replace("-ndrpdr", "-ndr"),
+                        x_axis,
+                        tst_data["result_ndr_lower_rate_value"].\
+                            fillna(0.0).to_numpy(dtype=float)
+                    ))
+                    series.append((
+                        name.replace("-ndrpdr", "-pdr"),
+                        x_axis,
+                        tst_data["result_pdr_lower_rate_value"].\
+                            to_numpy(dtype=float)
+                    ))
                 else:  # mrr, hoststack, soak
                     if "soak" in test:
                         val = "result_critical_rate_lower_rate_value"
@@ -192,24 +166,35 @@ class Layout:
                     tst_data = tst_data.dropna(subset=[val, ])
                     if tst_data.empty:
                         continue
-                    x_axis = tst_data["start_time"].tolist()
-                    try:
-                        anomalies, _, _ = classify_anomalies({
-                            k: v for k, v in zip(x_axis, tst_data[val].tolist())
-                        })
-                    except ValueError:
-                        continue
-                    if "progression" in anomalies:
-                        l_prog.append((
-                            _create_test_name(test),
-                            x_axis[_get_rindex(anomalies, "progression")]
-                        ))
-                    if "regression" in anomalies:
-                        l_reg.append((
-                            _create_test_name(test),
-                            x_axis[_get_rindex(anomalies, "regression")]
-                        ))
+                    series.append((
+                        _create_test_name(test),
+                        tst_data["start_time"].tolist(),
+                        tst_data[val].to_numpy(dtype=float)
+                    ))
+            jobs_series.append(series)
+
+        # Classify all series at once, padded by NaN to the same length:
+        all_series = [itm for series in jobs_series for itm in series]
+        width = max((itm[2].size for itm in all_series), default=0)
+        samples = np.full((len(all_series), width), np.nan)
+        for idx, (_, _, values) in enumerate(all_series):
+            samples[idx, :values.size] = values
+        anomalies, _, _ = classify_anomalies_batch(
+            samples, processes=C.ANOMALY_PROCESSES
+        )
 
+        # Create lists of regressions and progressions (the last ones):
+        row = 0
+        for series in jobs_series:
+            l_reg = list()
+            l_prog = list()
+            for name, x_axis, _ in series:
+                for anomaly, l_anomaly in \
+                        (("progression", l_prog), ("regression", l_reg)):
+                    indices = np.flatnonzero(anomalies[row] == anomaly)
+                    if indices.size:
+                        l_anomaly.append((name, x_axis[indices[-1]]))
+                row += 1
             tst_info["regressions"].append(
                 sorted(l_reg, key=lambda k: k[1], reverse=True))
             tst_info["progressions"].append(
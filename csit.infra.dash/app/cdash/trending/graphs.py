@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -15,6 +15,7 @@
 """
 
 import logging
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 
@@ -23,30 +24,27 @@ from datetime import datetime
 from pytz import UTC
 
 from ..utils.constants import Constants as C
-from ..utils.utils import get_color, get_hdrh_latencies
+from ..utils.utils import get_color, get_hdrh_latencies, get_topo_arch, \
+    get_drv_name
 from ..utils.anomalies import classify_anomalies
 
 
-def select_trending_data(data: pd.DataFrame, itm: dict) -> pd.DataFrame:
-    """Select the data for graphs from the provided data frame.
+def _trending_key(itm: dict) -> tuple:
+    """Get the key of the selected test, as used in the index of trending
+    data.
 
-    :param data: Data frame with data for graphs.
     :param itm: Item (in this case job name) which data will be selected from
         the input data frame.
-    :type data: pandas.DataFrame
     :type itm: dict
-    :returns: A data frame with selected data.
-    :rtype: pandas.DataFrame
+    :returns: Test type, topology and architecture, NIC, driver, frame size,
+        core, test and test type from the test name, or None if the item does
+        not specify the test.
+    :rtype: tuple
     """
 
     phy = itm["phy"].rsplit("-", maxsplit=2)
     if len(phy) == 3:
         topo_arch, nic, drv = phy
-        if drv in C.DRVS_NOT_IN_NAME:
-            drv = ""
-        else:
-            drv += "-"
-            drv = drv.replace("_", "-")
     else:
         return None
 
@@ -58,37 +56,187 @@ def select_trending_data(data: pd.DataFrame, itm: dict) -> pd.DataFrame:
         test_type = "soak"
     elif itm["area"] == "hoststack":
         test_type = "hoststack"
-    df = data.loc[(
-        (data["test_type"] == test_type) &
-        (data["passed"] == True)
-    )]
-    df = df[df.job.str.endswith(topo_arch)]
     core = str() if itm["dut"] == "trex" else itm["core"]
     ttype = "ndrpdr" if itm["testtype"] in ("ndr", "pdr") else itm["testtype"]
-    df = df[df.test_id.str.contains(
-        f"^.*[.|-]{nic}.*{itm['framesize']}-{core}-{drv}{itm['test']}-{ttype}$",
-        regex=True
-    )]
+    return (
+        test_type, topo_arch, nic, drv, itm["framesize"], core, itm["test"],
+        ttype
+    )
+
+
+def index_trending_data(data: pd.DataFrame) -> dict:
+    """Index the passed tests in the data frame by the parameters the tests
+    are selected by.
+
+    The job and test_id of each distinct test are parsed only once, in the
+    same way as the structure of tests for the control panel is built, so a
+    selection of a test does not need to scan the whole data frame.
+
+    :param data: Data frame with trending data.
+    :type data: pandas.DataFrame
+    :returns: Keys as returned by _trending_key mapped to the positions of
+        the rows in the data frame, sorted by start time.
+    :rtype: dict
+    """
+
+    passed = np.flatnonzero(
+        (data["passed"] == True).to_numpy(dtype=bool, na_value=False)
+    )
+    start_times = data["start_time"].to_numpy()
+    groups = data.iloc[passed].groupby(
+        ["test_type", "job", "test_id"],
+        sort=False,
+        observed=True
+    ).indices
+
+    positions = dict()
+    for (test_type, job, test_id), idx in groups.items():
+        tbed = get_topo_arch(job.split("-"))
+        lst_test = test_id.split(".")
+        if len(lst_test) < 2:
+            continue
+        suite = lst_test[-2].replace("2n1l-", "").replace("1n1l-", "").\
+            replace("2n-", "")
+        nic = suite.split("-")[0]
+        driver, test = get_drv_name(lst_test[-1], tbed)
+        lst_test = test.split("-")
+        if len(lst_test) < 3:
+            continue
+        key = (
+            test_type, tbed, nic, driver, lst_test[0], lst_test[1],
+            "-".join(lst_test[2:-1]), lst_test[-1]
+        )
+        positions.setdefault(key, list()).append(passed[idx])
+
+    index = dict()
+    for key, lst_pos in positions.items():
+        pos = np.concatenate(lst_pos)
+        index[key] = pos[np.argsort(start_times[pos], kind="stable")]
+    return index
+
+
+def select_trending_data(
+        data: pd.DataFrame,
+        itm: dict,
+        index: dict=None
+    ) -> pd.DataFrame:
+    """Select the data for graphs from the provided data frame.
+
+    :param data: Data frame with data for graphs.
+    :param itm: Item (in this case job name) which data will be selected from
+        the input data frame.
+    :param index: Index of the data frame as returned by index_trending_data.
+        If None, the whole data frame is searched.
+    :type data: pandas.DataFrame
+    :type itm: dict
+    :type index: dict
+    :returns: A data frame with selected data.
+    :rtype: pandas.DataFrame
+    """
+
+    key = _trending_key(itm)
+    if key is None:
+        return None
+    test_type, topo_arch, nic, drv, framesize, core, test, ttype = key
+
+    if index is not None:
+        df = data.iloc[index.get(key, list())].reset_index(drop=True)
+    else:
+        if drv in C.DRVS_NOT_IN_NAME:
+            drv = ""
+        else:
+            drv += "-"
+            drv = drv.replace("_", "-")
+        df = data.loc[(
+            (data["test_type"] == test_type) &
+            (data["passed"] == True)
+        )]
+        df = df[df.job.str.endswith(topo_arch)]
+        df = df[df.test_id.str.contains(
+            f"^.*[.|-]{nic}.*{framesize}-{core}-{drv}{test}-{ttype}$",
+            regex=True
+        )]
+        if not df.empty:
+            df = df.sort_values(by="start_time", ignore_index=True)
 
     if "host" in itm:
-        ret_df = None
-        for _, row in df.iterrows():
-            for host in itm["host"]:
-                if host in row["hosts"]:
-                    if ret_df is None:
-                        ret_df = pd.DataFrame([row], columns=df.columns)
-                    else:
-                        ret_df = pd.concat(
-                            [ret_df, pd.DataFrame([row], columns=df.columns)],
-                            ignore_index=True,
-                            copy=False
-                        )
+        df = df[[
+            any(host in hosts for host in itm["host"])
+            for hosts in df["hosts"]
+        ]]
+        if df.empty:
+            return None
+        df = df.reset_index(drop=True)
+
+    return df
+
+
+def _strings(values: pd.Series) -> np.ndarray:
+    """Convert the values to strings, as they are formatted in f-strings.
+
+    :param values: Values to convert.
+    :type values: pandas.Series
+    :returns: Array of strings (object dtype), to be concatenated with other
+        strings and arrays of strings.
+    :rtype: numpy.ndarray
+    """
+    return np.array([f"{val}" for val in values.tolist()], dtype=object)
+
+
+def _numbers(values, nf: float=1.0, divide: bool=False) -> np.ndarray:
+    """Format the numbers as integers with thousands separators.
+
+    :param values: Numbers to format, missing values are formatted as nan.
+    :param nf: The factor the numbers are multiplied by.
+    :param divide: If True, the numbers are divided by the factor instead.
+    :type values: pandas.Series or list
+    :type nf: float
+    :type divide: bool
+    :returns: Array of strings (object dtype).
+    :rtype: numpy.ndarray
+    """
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=float, na_value=nan)
     else:
-        ret_df = df
-    
-    if ret_df is not None and not ret_df.empty:
-        ret_df.sort_values(by="start_time", ignore_index=True, inplace=True)
-    return ret_df
+        values = np.asarray(values, dtype=float)
+    values = values / nf if divide else values * nf
+    return np.array([f"{val:,.0f}" for val in values.tolist()], dtype=object)
+
+
+def _trials(values: pd.Series, nf: float) -> np.ndarray:
+    """Format lists of trial results, separated by semicolons.
+
+    :param values: Lists of trial results.
+    :param nf: The factor the results are multiplied by.
+    :type values: pandas.Series
+    :type nf: float
+    :returns: Array of strings (object dtype), ": " followed by the results,
+        or empty strings if there are no results.
+    :rtype: numpy.ndarray
+    """
+    return np.array([
+        (": " + "; ".join(f"{itm * nf:,.0f}" for itm in lst)) if lst else ""
+        for lst in values.tolist()
+    ], dtype=object)
+
+
+def _hosts(df: pd.DataFrame) -> np.ndarray:
+    """Format the hosts the tests were run on, for the hover texts.
+
+    :param df: Data frame with test data.
+    :type df: pandas.DataFrame
+    :returns: Array of strings (object dtype), empty if hosts are not known.
+    :rtype: numpy.ndarray
+    """
+    if "hosts" not in df.columns:
+        return np.full(len(df), str(), dtype=object)
+    hosts = list()
+    for lst in df["hosts"].tolist():
+        try:
+            hosts.append(f"<br>hosts: {', '.join(lst)}")
+        except TypeError:
+            hosts.append(str())
+    return np.array(hosts, dtype=object)
 
 
 def graph_trending(
@@ -96,7 +244,8 @@ def graph_trending(
         sel: dict,
         layout: dict,
         normalize: bool=False,
-        trials: bool=False
+        trials: bool=False,
+        index: dict=None
     ) -> tuple:
     """Generate the trending graph(s) - MRR, NDR, PDR and for PDR also Latences
     (result_latency_forward_pdr_50_avg).
@@ -107,11 +256,13 @@ def graph_trending(
     :param normalize: If True, the data is normalized to CPU frequency
         Constants.NORM_FREQUENCY.
     :param trials: If True, MRR trials are displayed in the trending graph.
+    :param index: Index of the data as returned by index_trending_data.
     :type data: pandas.DataFrame
     :type sel: dict
     :type layout: dict
     :type normalize: bool
     :type: trials: bool
+    :type index: dict
     :returns: Trending graph(s)
     :rtype: tuple(plotly.graph_objects.Figure, plotly.graph_objects.Figure)
     """
@@ -148,180 +299,182 @@ def graph_trending(
         if df.empty:
             return list(), list()
 
-        hover = list()
-        customdata = list()
-        customdata_samples = list()
         name_lst = name.split("-")
-        for _, row in df.iterrows():
-            h_tput, h_band, h_lat, h_tput_trials, h_band_trials = \
-                str(), str(), str(), str(), str()
-            if ttype in ("mrr", "mrr-bandwidth"):
-                h_tput = (
-                    f"tput avg [{row['result_receive_rate_rate_unit']}]: "
-                    f"{row['result_receive_rate_rate_avg'] * nf:,.0f}<br>"
-                    f"tput stdev [{row['result_receive_rate_rate_unit']}]: "
-                    f"{row['result_receive_rate_rate_stdev'] * nf:,.0f}<br>"
-                )
-                if pd.notna(row["result_receive_rate_bandwidth_avg"]):
-                    h_band = (
-                        f"bandwidth avg "
-                        f"[{row['result_receive_rate_bandwidth_unit']}]: "
-                        f"{row['result_receive_rate_bandwidth_avg'] * nf:,.0f}"
-                        "<br>"
-                        f"bandwidth stdev "
-                        f"[{row['result_receive_rate_bandwidth_unit']}]: "
-                        f"{row['result_receive_rate_bandwidth_stdev']* nf:,.0f}"
-                        "<br>"
-                    )
-                if trials:
-                    h_tput_trials = (
-                        f"tput trials "
-                        f"[{row['result_receive_rate_rate_unit']}]: "
-                    )
-                    for itm in row["result_receive_rate_rate_values"]:
-                        h_tput_trials += f"{itm * nf:,.0f}; "
-                    h_tput_trials = h_tput_trials[:-2] + "<br>"
-                    if pd.notna(row["result_receive_rate_bandwidth_avg"]):
-                        h_band_trials = (
-                            f"bandwidth trials "
-                            f"[{row['result_receive_rate_bandwidth_unit']}]: "
-                        )
-                        for itm in row["result_receive_rate_bandwidth_values"]:
-                            h_band_trials += f"{itm * nf:,.0f}; "
-                        h_band_trials = h_band_trials[:-2] + "<br>"
-
-            elif ttype in ("ndr", "ndr-bandwidth"):
-                h_tput = (
-                    f"tput [{row['result_ndr_lower_rate_unit']}]: "
-                    f"{row['result_ndr_lower_rate_value'] * nf:,.0f}<br>"
-                )
-                if pd.notna(row["result_ndr_lower_bandwidth_value"]):
-                    h_band = (
-                        f"bandwidth [{row['result_ndr_lower_bandwidth_unit']}]:"
-                        f" {row['result_ndr_lower_bandwidth_value'] * nf:,.0f}"
-                        "<br>"
-                    )
-            elif ttype in ("pdr", "pdr-bandwidth", "latency"):
-                h_tput = (
-                    f"tput [{row['result_pdr_lower_rate_unit']}]: "
-                    f"{row['result_pdr_lower_rate_value'] * nf:,.0f}<br>"
-                )
-                if pd.notna(row["result_pdr_lower_bandwidth_value"]):
-                    h_band = (
-                        f"bandwidth [{row['result_pdr_lower_bandwidth_unit']}]:"
-                        f" {row['result_pdr_lower_bandwidth_value'] * nf:,.0f}"
-                        "<br>"
-                    )
-                if pd.notna(row["result_latency_forward_pdr_50_avg"]):
-                    h_lat = (
-                        f"latency "
-                        f"[{row['result_latency_forward_pdr_50_unit']}]: "
-                        f"{row['result_latency_forward_pdr_50_avg'] / nf:,.0f}"
-                        "<br>"
-                    )
-            elif ttype in ("hoststack-cps", "hoststack-rps",
-                           "hoststack-cps-bandwidth",
-                           "hoststack-rps-bandwidth", "hoststack-latency"):
-                h_tput = (
-                    f"tput [{row['result_rate_unit']}]: "
-                    f"{row['result_rate_value'] * nf:,.0f}<br>"
-                )
-                h_band = (
-                    f"bandwidth [{row['result_bandwidth_unit']}]: "
-                    f"{row['result_bandwidth_value'] * nf:,.0f}<br>"
-                )
-                h_lat = (
-                    f"latency [{row['result_latency_unit']}]: "
-                    f"{row['result_latency_value'] / nf:,.0f}<br>"
-                )
-            elif ttype in ("hoststack-bps", ):
-                h_band = (
-                    f"bandwidth [{row['result_bandwidth_unit']}]: "
-                    f"{row['result_bandwidth_value'] * nf:,.0f}<br>"
-                )
-            elif ttype in ("soak", "soak-bandwidth"):
-                h_tput = (
-                    f"tput [{row['result_critical_rate_lower_rate_unit']}]: "
-                    f"{row['result_critical_rate_lower_rate_value'] * nf:,.0f}"
-                    "<br>"
-                )
-                if pd.notna(row["result_critical_rate_lower_bandwidth_value"]):
-                    bv = row['result_critical_rate_lower_bandwidth_value']
-                    h_band = (
-                        "bandwidth "
-                        f"[{row['result_critical_rate_lower_bandwidth_unit']}]:"
-                        f" {bv * nf:,.0f}"
-                        "<br>"
-                    )
-            try:
-                hosts = f"<br>hosts: {', '.join(row['hosts'])}"
-            except (KeyError, TypeError):
-                hosts = str()
-
-            for drv in C.DRIVERS:
-                if drv in name_lst:
-                    split_idx = name_lst.index(drv) + 1
-                    break
-            else:
-                split_idx = 5
-            hover_itm = (
-                f"dut: {name_lst[0]}<br>"
-                f"infra: {'-'.join(name_lst[1:split_idx])}<br>"
-                f"test: {'-'.join(name_lst[split_idx:])}<br>"
-                f"date: {row['start_time'].strftime('%Y-%m-%d %H:%M:%S')}<br>"
-                f"{h_tput}{h_tput_trials}{h_band}{h_band_trials}{h_lat}"
-                f"{row['dut_type']}-ref: {row['dut_version']}<br>"
-                f"csit-ref: {row['job']}/{row['build']}"
-                f"{hosts}"
+        for drv in C.DRIVERS:
+            if drv in name_lst:
+                split_idx = name_lst.index(drv) + 1
+                break
+        else:
+            split_idx = 5
+        # Through DatetimeIndex, as pyarrow strftime adds fractions to %S:
+        dates = "date: " + pd.DatetimeIndex(
+            df["start_time"].to_numpy()
+        ).strftime("%Y-%m-%d %H:%M:%S").to_numpy(dtype=object) + "<br>"
+        refs = (
+            _strings(df["dut_type"]) + "-ref: " +
+            _strings(df["dut_version"]) + "<br>csit-ref: " +
+            _strings(df["job"]) + "/" + _strings(df["build"])
+        )
+        hosts = _hosts(df)
+
+        h_tput = h_band = h_lat = h_tput_trials = h_band_trials = str()
+        if ttype in ("mrr", "mrr-bandwidth"):
+            unit = _strings(df["result_receive_rate_rate_unit"])
+            h_tput = (
+                "tput avg [" + unit + "]: " +
+                _numbers(df["result_receive_rate_rate_avg"], nf) +
+                "<br>tput stdev [" + unit + "]: " +
+                _numbers(df["result_receive_rate_rate_stdev"], nf) + "<br>"
             )
-            hover.append(hover_itm)
-            if ttype == "latency":
-                customdata_samples.append(get_hdrh_latencies(row, name))
-                customdata.append({"name": name})
-            else:
-                customdata_samples.append(
-                    {"name": name, "show_telemetry": True}
+            has_band = df["result_receive_rate_bandwidth_avg"].notna()
+            b_unit = _strings(df["result_receive_rate_bandwidth_unit"])
+            h_band = np.where(
+                has_band,
+                "bandwidth avg [" + b_unit + "]: " +
+                _numbers(df["result_receive_rate_bandwidth_avg"], nf) +
+                "<br>bandwidth stdev [" + b_unit + "]: " +
+                _numbers(df["result_receive_rate_bandwidth_stdev"], nf) +
+                "<br>",
+                str()
+            )
+            if trials:
+                h_tput_trials = "tput trials [" + unit + "]" + _trials(
+                    df["result_receive_rate_rate_values"], nf
+                ) + "<br>"
+                h_band_trials = np.where(
+                    has_band,
+                    "bandwidth trials [" + b_unit + "]" + _trials(
+                        df["result_receive_rate_bandwidth_values"], nf
+                    ) + "<br>",
+                    str()
                 )
-                customdata.append({"name": name})
+        elif ttype in ("ndr", "ndr-bandwidth"):
+            h_tput = (
+                "tput [" + _strings(df["result_ndr_lower_rate_unit"]) +
+                "]: " + _numbers(df["result_ndr_lower_rate_value"], nf) +
+                "<br>"
+            )
+            h_band = np.where(
+                df["result_ndr_lower_bandwidth_value"].notna(),
+                "bandwidth [" +
+                _strings(df["result_ndr_lower_bandwidth_unit"]) + "]: " +
+                _numbers(df["result_ndr_lower_bandwidth_value"], nf) + "<br>",
+                str()
+            )
+        elif ttype in ("pdr", "pdr-bandwidth", "latency"):
+            h_tput = (
+                "tput [" + _strings(df["result_pdr_lower_rate_unit"]) +
+                "]: " + _numbers(df["result_pdr_lower_rate_value"], nf) +
+                "<br>"
+            )
+            h_band = np.where(
+                df["result_pdr_lower_bandwidth_value"].notna(),
+                "bandwidth [" +
+                _strings(df["result_pdr_lower_bandwidth_unit"]) + "]: " +
+                _numbers(df["result_pdr_lower_bandwidth_value"], nf) + "<br>",
+                str()
+            )
+            h_lat = np.where(
+                df["result_latency_forward_pdr_50_avg"].notna(),
+                "latency [" +
+                _strings(df["result_latency_forward_pdr_50_unit"]) + "]: " +
+                _numbers(df["result_latency_forward_pdr_50_avg"], nf, True) +
+                "<br>",
+                str()
+            )
+        elif ttype in ("hoststack-cps", "hoststack-rps",
+                       "hoststack-cps-bandwidth",
+                       "hoststack-rps-bandwidth", "hoststack-latency"):
+            h_tput = (
+                "tput [" + _strings(df["result_rate_unit"]) + "]: " +
+                _numbers(df["result_rate_value"], nf) + "<br>"
+            )
+            h_band = (
+                "bandwidth [" + _strings(df["result_bandwidth_unit"]) +
+                "]: " + _numbers(df["result_bandwidth_value"], nf) + "<br>"
+            )
+            h_lat = (
+                "latency [" + _strings(df["result_latency_unit"]) + "]: " +
+                _numbers(df["result_latency_value"], nf, True) + "<br>"
+            )
+        elif ttype in ("hoststack-bps", ):
+            h_band = (
+                "bandwidth [" + _strings(df["result_bandwidth_unit"]) +
+                "]: " + _numbers(df["result_bandwidth_value"], nf) + "<br>"
+            )
+        elif ttype in ("soak", "soak-bandwidth"):
+            h_tput = (
+                "tput [" +
+                _strings(df["result_critical_rate_lower_rate_unit"]) + "]: " +
+                _numbers(df["result_critical_rate_lower_rate_value"], nf) +
+                "<br>"
+            )
+            h_band = np.where(
+                df["result_critical_rate_lower_bandwidth_value"].notna(),
+                "bandwidth [" +
+                _strings(df["result_critical_rate_lower_bandwidth_unit"]) +
+                "]: " + _numbers(
+                    df["result_critical_rate_lower_bandwidth_value"], nf
+                ) + "<br>",
+                str()
+            )
+        hover = (
+            f"dut: {name_lst[0]}<br>"
+            f"infra: {'-'.join(name_lst[1:split_idx])}<br>"
+            f"test: {'-'.join(name_lst[split_idx:])}<br>" + dates +
+            h_tput + h_tput_trials + h_band + h_band_trials + h_lat + refs +
+            hosts
+        )
+
+        if ttype == "latency":
+            customdata_samples = [
+                get_hdrh_latencies(row, name) for row in
+                df[df.columns.intersection(C.LAT_HDRH)].to_dict("records")
+            ]
+        else:
+            customdata_samples = [
+                {"name": name, "show_telemetry": True} for _ in range(len(df))
+            ]
+        customdata = [{"name": name} for _ in range(len(df))]
 
         x_axis = df["start_time"].tolist()
+        y_data = df[C.VALUE[ttype]].to_numpy(dtype=float)
         if "latency" in ttype:
-            y_data = [(v / nf) for v in df[C.VALUE[ttype]].tolist()]
+            y_data = y_data / nf
         else:
-            y_data = [(v * nf) for v in df[C.VALUE[ttype]].tolist()]
+            y_data = y_data * nf
         units = df[C.UNIT[ttype]].unique().tolist()
 
         try:
             anomalies, trend_avg, trend_stdev = classify_anomalies(
-                {k: v for k, v in zip(x_axis, y_data)}
+                {k: v for k, v in zip(x_axis, y_data.tolist())},
+                key=(ttype, name, nf)
             )
         except ValueError as err:
             logging.error(err)
             return list(), list()
 
-        hover_trend = list()
-        for avg, stdev, (_, row) in zip(trend_avg, trend_stdev, df.iterrows()):
-            try:
-                hosts = f"<br>hosts: {', '.join(row['hosts'])}"
-            except (KeyError, TypeError):
-                hosts = str()
-            hover_itm = (
-                f"dut: {name_lst[0]}<br>"
-                f"infra: {'-'.join(name_lst[1:5])}<br>"
-                f"test: {'-'.join(name_lst[5:])}<br>"
-                f"date: {row['start_time'].strftime('%Y-%m-%d %H:%M:%S')}<br>"
-                f"trend [{row[C.UNIT[ttype]]}]: {avg:,.0f}<br>"
-                f"stdev [{row[C.UNIT[ttype]]}]: {stdev:,.0f}<br>"
-                f"{row['dut_type']}-ref: {row['dut_version']}<br>"
-                f"csit-ref: {row['job']}/{row['build']}"
-                f"{hosts}"
+        # If more samples have the same start time, there are less trend
+        # values than samples.
+        nr_trend = len(trend_avg)
+        t_unit = _strings(df[C.UNIT[ttype]].iloc[:nr_trend])
+        hover_trend = (
+            f"dut: {name_lst[0]}<br>"
+            f"infra: {'-'.join(name_lst[1:5])}<br>"
+            f"test: {'-'.join(name_lst[5:])}<br>" + dates[:nr_trend] +
+            "trend [" + t_unit + "]: " + _numbers(trend_avg) + "<br>" +
+            "stdev [" + t_unit + "]: " + _numbers(trend_stdev) + "<br>" +
+            refs[:nr_trend] + hosts[:nr_trend]
+        )
+        if ttype == "latency":
+            hover_trend = np.char.replace(
+                hover_trend.astype(str), "[pps]", "[us]"
             )
-            if ttype == "latency":
-                hover_itm = hover_itm.replace("[pps]", "[us]")
-            hover_trend.append(hover_itm)
 
+        scatter = go.Scattergl \
+            if len(df) >= C.TREND_SCATTERGL_MIN_SAMPLES else go.Scatter
         traces = [
-            go.Scatter(  # Samples
+            scatter(  # Samples
                 x=x_axis,
                 y=y_data,
                 name=name,
@@ -337,7 +490,7 @@ def graph_trending(
                 legendgroup=name,
                 customdata=customdata_samples
             ),
-            go.Scatter(  # Trend line
+            scatter(  # Trend line
                 x=x_axis,
                 y=trend_avg,
                 name=name,
@@ -378,7 +531,7 @@ def graph_trending(
                     hover.append(hover_itm)
             anomaly_color.extend([0.0, 0.5, 1.0])
             traces.append(
-                go.Scatter(
+                scatter(
                     x=anomaly_x,
                     y=anomaly_y,
                     mode="markers",
@@ -448,14 +601,19 @@ def graph_trending(
         x_axis = df["start_time"].tolist()
         y_data = df[C.VALUE[ttype].replace("avg", "values")].tolist()
 
-        for idx_trial in range(10):
-            y_axis = list()
-            for idx_run in range(len(x_axis)):
-                try:
-                    y_axis.append(y_data[idx_run][idx_trial] * nf)
-                except (IndexError, TypeError, ValueError):
-                    y_axis.append(nan)
-            traces.append(go.Scatter(
+        # Trials of each run in columns, nan if the run has less trials:
+        y_trials = np.full((10, len(y_data)), nan)
+        for idx_run, values in enumerate(y_data):
+            try:
+                values = np.asarray(values[:10], dtype=float)
+            except (TypeError, ValueError):
+                continue
+            y_trials[:len(values), idx_run] = values * nf
+        scatter = go.Scattergl \
+            if len(x_axis) >= C.TREND_SCATTERGL_MIN_SAMPLES else go.Scatter
+
+        for y_axis in y_trials:
+            traces.append(scatter(
                 x=x_axis,
                 y=y_axis,
                 name=name,
@@ -478,7 +636,7 @@ def graph_trending(
     start_times = list()
     y_units = set()
     for idx, itm in enumerate(sel):
-        df = select_trending_data(data, itm)
+        df = select_trending_data(data, itm, index)
         if df is None or df.empty:
             continue
         start_times.append(df["start_time"][0])
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -37,7 +37,8 @@ from ..utils.utils import show_tooltip, label, sync_checklists, gen_new_url, \
     generate_options, get_list_group_items, navbar_trending, get_topo_arch, \
     show_trending_graph_data, get_drv_name
 from ..utils.url_processing import url_decode
-from .graphs import graph_trending, select_trending_data, graph_tm_trending
+from .graphs import graph_trending, select_trending_data, graph_tm_trending, \
+    index_trending_data
 
 
 # Control panel partameters and their default values.
@@ -172,6 +173,9 @@ class Layout:
                     tst_params["test-type"].append(row["test_type"].upper())
         self._spec_tbs = tbs
 
+        # Index of tests, so the selection does not scan all data:
+        self._index = index_trending_data(self._data)
+
         # Read from files:
         self._html_layout = str()
         self._graph_layout = None
@@ -1218,7 +1222,7 @@ class Layout:
                     on_draw[0] = True
                     if telemetry:
                         tm = TelemetryData(store_sel)
-                        tm.from_dataframe(self._data)
+                        tm.from_dataframe(self._data, self._index)
                         tm_data = tm.to_json()
                         tm.from_json(tm_data)
                         tm_panels = telemetry
@@ -1449,7 +1453,7 @@ class Layout:
                     store_sel = list()
             elif trigger.type == "telemetry-btn":
                 if trigger.idx in ("open", "back"):
-                    tm.from_dataframe(self._data)
+                    tm.from_dataframe(self._data, self._index)
                     tm_data = tm.to_json()
                     tm_user["unique_metrics"] = tm.unique_metrics
                     tm_user["selected_metrics"] = list()
@@ -1569,7 +1573,8 @@ class Layout:
                             store_sel,
                             self._graph_layout,
                             bool(ctrl_panel.get("cl-normalize-val")),
-                            bool(ctrl_panel.get("cl-show-trials"))
+                            bool(ctrl_panel.get("cl-show-trials")),
+                            self._index
                         )
                         if graphs and graphs[0]:
                             store["trending-graphs"] = graphs
@@ -1822,7 +1827,9 @@ class Layout:
             if trigger.type == "plot-btn-download":
                 data = list()
                 for itm in store["selected-tests"]:
-                    sel_data = select_trending_data(self._data, itm)
+                    sel_data = select_trending_data(
+                        self._data, itm, self._index
+                    )
                     if sel_data is None:
                         continue
                     data.append(sel_data)
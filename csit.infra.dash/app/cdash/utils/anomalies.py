@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -14,12 +14,48 @@
 """Functions used by Dash applications to detect anomalies.
 """
 
+import numpy as np
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from numpy import isnan
 
-from ..jumpavg import classify
+from ..jumpavg import ClassifyState, classify
+from ..utils.constants import Constants as C
+
+
+# Classification states of recently seen series, the least recent first.
+_CLASSIFY_STATES = OrderedDict()
 
 
-def classify_anomalies(data):
+def _classify(bare_data: list, key) -> list:
+    """Classify the data, reuse the stored state of the series if any.
+
+    Nightly runs only append samples to a series, so with a stored state,
+    only the new samples need to be classified.
+    If the data does not extend the stored state, it is classified again.
+
+    :param bare_data: Samples to classify.
+    :param key: Hashable identification of the series, or None.
+    :type bare_data: list
+    :type key: Hashable
+    :returns: List of groups.
+    :rtype: list
+    """
+    if key is None or C.MAX_CLASSIFY_STATES < 1:
+        return classify(bare_data).group_list
+    # Popped, so that a concurrent call for the same key does not share it.
+    state = _CLASSIFY_STATES.pop(key, None)
+    if state is None:
+        state = ClassifyState()
+    group_list = state.update(bare_data).group_list
+    _CLASSIFY_STATES[key] = state
+    while len(_CLASSIFY_STATES) > C.MAX_CLASSIFY_STATES:
+        _CLASSIFY_STATES.popitem(last=False)
+    return group_list
+
+
+def classify_anomalies(data, key=None):
     """Process the data and return anomalies and trending values.
 
     Gather data into groups with average as trend value.
@@ -27,7 +63,10 @@ def classify_anomalies(data):
     the first value of changed average as a regression, or a progression.
 
     :param data: Full data set with unavailable samples replaced by nan.
+    :param key: If not None, identification of the series, used to keep
+        the classification state for incremental updates.
     :type data: OrderedDict
+    :type key: Hashable
     :returns: Classification and trend values
     :rtype: 3-tuple, list of strings, list of floats and list of floats
     """
@@ -35,7 +74,7 @@ def classify_anomalies(data):
     # Use 0.0 to cause that being reported as a severe regression.
     bare_data = [0.0 if isnan(sample) else sample for sample in data.values()]
     # TODO: Make BitCountingGroupList a subclass of list again?
-    group_list = classify(bare_data).group_list
+    group_list = _classify(bare_data, key)
     group_list.reverse()  # Just to use .pop() for FIFO.
     classification = list()
     avgs = list()
@@ -67,3 +106,87 @@ def classify_anomalies(data):
         stdevs.append(stdv)
         values_left -= 1
     return classification, avgs, stdevs
+
+
+def _classify_row(values: np.ndarray) -> tuple:
+    """Classify samples of one series, return group lengths and comments.
+
+    This is the part of the batch classification which cannot be vectorized,
+    it runs in worker processes if a pool is used.
+
+    :param values: Samples to classify, no NaN.
+    :type values: numpy.ndarray
+    :returns: Lengths and comments of the groups, None if classify failed.
+    :rtype: tuple(list of int, list of str) or None
+    """
+    try:
+        group_list = classify(values.tolist())
+    except ValueError:
+        return None
+    return (
+        [len(group.run_list) for group in group_list],
+        [group.comment for group in group_list]
+    )
+
+
+def classify_anomalies_batch(data, processes: int = 0) -> tuple:
+    """Classify many series at once, return anomalies and trending values.
+
+    The input is a 2-D array, one row per test and one column per build,
+    NaN marking builds without a sample of the test. Contrary
+    to classify_anomalies (where NaN is a failed sample, counted as 0.0),
+    missing samples are not classified, so rows of different lengths
+    can be padded by NaN.
+
+    Grouping of samples (jumpavg classify) is done per row, optionally
+    in a pool of worker processes. Group averages and stdevs
+    are computed by NumPy, and broadcast to all samples in the group.
+
+    :param data: Samples, tests x builds, NaN for missing.
+    :param processes: Number of worker processes, no pool if less than 2.
+    :type data: numpy.ndarray or list of lists
+    :type processes: int
+    :returns: Classification ("regression", "progression", "normal",
+        empty string for missing samples and for rows failed to classify),
+        trend averages and trend stdevs (NaN for missing), each of them
+        of the same shape as the input.
+    :rtype: 3-tuple of numpy.ndarray
+    :raises ValueError: If the data is not 2-D.
+    """
+    data = np.asarray(data, dtype=float)
+    if data.ndim != 2:
+        raise ValueError(f"Expected 2-D data, got shape {data.shape}.")
+    present = ~np.isnan(data)
+    rows = [data[idx][present[idx]] for idx in range(data.shape[0])]
+    todo = [idx for idx, row in enumerate(rows) if row.size]
+    if processes > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(
+                _classify_row, [rows[idx] for idx in todo],
+                chunksize=max(1, len(todo) // (4 * processes))
+            ))
+    else:
+        results = [_classify_row(rows[idx]) for idx in todo]
+
+    classification = np.full(data.shape, "", dtype="<U11")
+    avgs = np.full(data.shape, np.nan)
+    stdevs = np.full(data.shape, np.nan)
+    for idx, result in zip(todo, results):
+        if result is None:
+            continue
+        row = rows[idx]
+        lengths = np.array(result[0])
+        starts = np.cumsum(lengths) - lengths
+        group_idx = np.repeat(np.arange(lengths.size), lengths)
+        group_avg = np.add.reduceat(row, starts) / lengths
+        deviations = row - group_avg[group_idx]
+        group_stdev = np.sqrt(
+            np.add.reduceat(deviations * deviations, starts) / lengths
+        )
+        labels = np.full(row.size, "normal", dtype="<U11")
+        labels[starts] = result[1]
+        columns = np.flatnonzero(present[idx])
+        classification[idx, columns] = labels
+        avgs[idx, columns] = group_avg[group_idx]
+        stdevs[idx, columns] = group_stdev[group_idx]
+    return classification, avgs, stdevs
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -175,6 +175,23 @@ class Constants:
     # TIME_PERIOD = MAX_TIME_PERIOD - is the default value
     TIME_PERIOD = get_int_from_env("TIME_PERIOD", MAX_TIME_PERIOD)  # [days]
 
+    # Directory with local copies of the parquets read from S3, so a restart
+    # downloads only new objects. Empty string disables the local cache.
+    CACHE_DIR = get_str_from_env("CACHE_DIR", "")
+
+    # Period of downloading new parquets to the local cache in a background
+    # thread. Zero disables the periodic refresh.
+    CACHE_REFRESH_PERIOD = get_int_from_env("CACHE_REFRESH_PERIOD", 3600)  # [s]
+
+    # Maximal number of per-test jumpavg classification states kept in memory,
+    # so that anomalies are only re-classified for newly added samples.
+    # Zero disables keeping the states.
+    MAX_CLASSIFY_STATES = get_int_from_env("MAX_CLASSIFY_STATES", 512)
+
+    # Number of worker processes used when classifying anomalies of many tests
+    # at once (e.g. in news). Values below 2 mean no worker processes.
+    ANOMALY_PROCESSES = get_int_from_env("ANOMALY_PROCESSES", 0)
+
     ############################################################################
     # General, application wide, layout affecting constants.
 
@@ -530,6 +547,12 @@ class Constants:
     # Layout of plot.ly graphs.
     TREND_GRAPH_LAYOUT_FILE = "cdash/trending/layout.yaml"
 
+    # Series with at least this number of samples are drawn using WebGL
+    # (plotly Scattergl) instead of SVG.
+    TREND_SCATTERGL_MIN_SAMPLES = get_int_from_env(
+        "TREND_SCATTERGL_MIN_SAMPLES", 1000
+    )
+
     # Default name of downloaded file with selected data.
     TREND_DOWNLOAD_FILE_NAME = "trending_data.csv"
     TELEMETRY_DOWNLOAD_FILE_NAME = "telemetry_data.csv"
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -43,11 +43,21 @@ class TelemetryData:
         self._unique_metrics_labels = pd.DataFrame()
         self._selected_metrics_labels = pd.DataFrame()
 
-    def from_dataframe(self, in_data: pd.DataFrame=pd.DataFrame()) -> None:
+    def from_dataframe(
+            self,
+            in_data: pd.DataFrame=pd.DataFrame(),
+            index: dict=None
+        ) -> None:
         """Read the input from pandas DataFrame.
 
         This method must be called at the beginning to create all data
         structures.
+
+        :param in_data: Input data.
+        :param index: Index of the input data as returned by
+            index_trending_data.
+        :type in_data: pandas.DataFrame
+        :type index: dict
         """
 
         if in_data.empty:
@@ -58,7 +68,7 @@ class TelemetryData:
         # Create a dataframe with metrics for selected tests:
         lst_items = list()
         for itm in self._tests:
-            sel_data = select_trending_data(in_data, itm)
+            sel_data = select_trending_data(in_data, itm, index)
             if sel_data is not None and not sel_data.empty:
                 sel_data["test_name"] = itm["id"]
                 lst_items.append(sel_data)
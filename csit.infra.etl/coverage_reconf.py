@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -16,16 +16,24 @@
 """ETL script running on top of the s3://"""
 
 from datetime import datetime, timedelta
-from json import load
+from hashlib import sha1
+from io import BytesIO
+from itertools import groupby, islice
+from json import dumps, load, loads
 from os import environ
+from tempfile import TemporaryDirectory
 from pytz import utc
 
 import awswrangler as wr
-from awswrangler.exceptions import EmptyDataFrame
+import pyarrow as pa
+import pyarrow.parquet as pq
 from awsglue.context import GlueContext
 from boto3 import session
 from pyspark.context import SparkContext
-from pyspark.sql.functions import col, lit, regexp_replace
+from pyspark.sql.functions import (
+    col, element_at, input_file_name, lit, regexp_replace, split
+)
+from pyspark.sql.pandas.types import to_arrow_schema
 from pyspark.sql.types import StructType
 
 
@@ -48,6 +56,9 @@ LAST_MODIFIED_END=utc.localize(
     )
 )
 LAST_MODIFIED_BEGIN=LAST_MODIFIED_END - timedelta(1)
+MANIFEST_PATH=f"s3://{S3_DOCS_BUCKET}/csit/parquet/manifest"
+MANIFEST_KEEP_DAYS=90
+BATCH_ROWS=10000
 
 
 def flatten_frame(nested_sdf):
@@ -96,24 +107,23 @@ def process_json_to_dataframe(schema_name, paths):
     with open(f"coverage_{schema_name}.json", "r", encoding="UTF-8") as f_schema:
         schema = StructType.fromJson(load(f_schema))
 
-    # create empty DF out of schemas
-    sdf = spark.createDataFrame([], schema)
-
     # filter list
     filtered = [path for path in paths if schema_name in path]
+    print(f"Reading {len(filtered)} paths.")
 
-    # select
-    for path in filtered:
-        print(path)
-
-        sdf_loaded = spark \
+    # select all paths in one scan, job and build are parsed from
+    # the file name, s3://<bucket>/<prefix>/<job>/<build>/...
+    if filtered:
+        path_parts = split(input_file_name(), "/")
+        sdf = spark \
             .read \
             .option("multiline", "true") \
             .schema(schema) \
-            .json(path) \
-            .withColumn("job", lit(path.split("/")[4])) \
-            .withColumn("build", lit(path.split("/")[5]))
-        sdf = sdf.unionByName(sdf_loaded, allowMissingColumns=True)
+            .json(filtered) \
+            .withColumn("job", element_at(path_parts, 5)) \
+            .withColumn("build", element_at(path_parts, 6))
+    else:
+        sdf = spark.createDataFrame([], schema)
 
     # drop rows with all nulls and drop rows with null in critical frames
     sdf = sdf.na.drop(how="all")
@@ -125,12 +135,137 @@ def process_json_to_dataframe(schema_name, paths):
     return sdf
 
 
+def manifest_load(path, boto3_session):
+    """Loads the manifest of already ingested builds.
+
+    :param path: S3 path to the manifest JSON.
+    :param boto3_session: Session with access to the path.
+    :type path: str
+    :type boto3_session: boto3.session.Session
+    :returns: Mapping from ingestion window (ISO date of its end)
+        to the list of builds ingested in it, as "<job>/<build>".
+    :rtype: dict
+    """
+    if not wr.s3.does_object_exist(path, boto3_session=boto3_session):
+        return dict()
+    buffer = BytesIO()
+    wr.s3.download(path=path, local_file=buffer, boto3_session=boto3_session)
+    return loads(buffer.getvalue().decode("UTF-8"))
+
+
+def manifest_save(path, manifest, boto3_session):
+    """Stores the manifest, without windows older than MANIFEST_KEEP_DAYS.
+
+    :param path: S3 path to the manifest JSON.
+    :param manifest: Mapping as returned by manifest_load.
+    :param boto3_session: Session with access to the path.
+    :type path: str
+    :type manifest: dict
+    :type boto3_session: boto3.session.Session
+    """
+    oldest = (LAST_MODIFIED_END - timedelta(MANIFEST_KEEP_DAYS)).date()
+    manifest = {
+        window: builds for window, builds in manifest.items()
+        if window >= oldest.isoformat()
+    }
+    wr.s3.upload(
+        local_file=BytesIO(dumps(manifest, indent=1).encode("UTF-8")),
+        path=path,
+        boto3_session=boto3_session
+    )
+
+
+def path_build(path):
+    """Returns the build the file belongs to.
+
+    :param path: S3 path, s3://<bucket>/<prefix>/<job>/<build>/...
+    :type path: str
+    :returns: Job and build, as "<job>/<build>".
+    :rtype: str
+    """
+    return "/".join(path.split("/")[4:6])
+
+
+def write_parquet_incremental(
+        sdf, path, partition_cols, file_name, boto3_session
+    ):
+    """Appends Spark DataFrame to S3 parquet dataset, streaming the rows.
+
+    Rows are sorted by partition columns, test_id and start_time, and
+    fetched to the driver one Spark partition at a time. They are
+    converted to Arrow in batches of BATCH_ROWS rows, each batch is one
+    row group, so the whole frame is never collected in driver memory.
+    There is one file per dataset partition, existing files are kept,
+    except a file with the same name (a rerun after a failure).
+
+    :param sdf: Spark DataFrame to write.
+    :param path: S3 path to the dataset.
+    :param partition_cols: Columns to partition the dataset by.
+    :param file_name: Name of the written files.
+    :param boto3_session: Session with access to the path.
+    :type sdf: DataFrame
+    :type path: str
+    :type partition_cols: list
+    :type file_name: str
+    :type boto3_session: boto3.session.Session
+    :returns: Number of written rows.
+    :rtype: int
+    """
+    file_schema = pa.schema([
+        field for field in to_arrow_schema(sdf.schema)
+        if field.name not in partition_cols
+    ])
+    rows = sdf \
+        .orderBy(*partition_cols, "test_id", "start_time") \
+        .toLocalIterator()
+    written = 0
+    with TemporaryDirectory() as tmp_dir:
+        local_file = f"{tmp_dir}/{file_name}"
+        partitions = groupby(
+            rows, key=lambda row: tuple(row[name] for name in partition_cols)
+        )
+        for values, partition_rows in partitions:
+            with pq.ParquetWriter(
+                    local_file, file_schema, compression="snappy"
+                ) as writer:
+                while True:
+                    batch = [
+                        row.asDict()
+                        for row in islice(partition_rows, BATCH_ROWS)
+                    ]
+                    if not batch:
+                        break
+                    writer.write_table(
+                        pa.Table.from_pylist(batch, schema=file_schema),
+                        row_group_size=BATCH_ROWS
+                    )
+                    written += len(batch)
+            partition_path = "/".join(
+                f"{name}={value}" for name, value in zip(partition_cols, values)
+            )
+            wr.s3.upload(
+                local_file=local_file,
+                path=f"{path}/{partition_path}/{file_name}",
+                boto3_session=boto3_session
+            )
+    return written
+
+
 # create SparkContext and GlueContext
 spark_context = SparkContext.getOrCreate()
 spark_context.setLogLevel("WARN")
 glue_context = GlueContext(spark_context)
 spark = glue_context.spark_session
 
+try:
+    boto3_session = session.Session(
+        aws_access_key_id=environ["OUT_AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=environ["OUT_AWS_SECRET_ACCESS_KEY"],
+        region_name=environ["OUT_AWS_DEFAULT_REGION"]
+    )
+except KeyError:
+    boto3_session = session.Session()
+
 # files of interest
 paths = wr.s3.list_objects(
     path=PATH,
@@ -143,33 +278,32 @@ paths = wr.s3.list_objects(
 
 filtered_paths = [path for path in paths if "report-coverage-2606" in path]
 
-out_sdf = process_json_to_dataframe("reconf", filtered_paths)
+# skip builds already ingested in this window (e.g. by a rerun)
+manifest_path = f"{MANIFEST_PATH}/coverage_reconf_rls2606.json"
+manifest = manifest_load(manifest_path, boto3_session)
+window = LAST_MODIFIED_END.date().isoformat()
+ingested = set(manifest.get(window, list()))
+new_paths = [
+    path for path in filtered_paths if path_build(path) not in ingested
+]
+builds = sorted(set(path_build(path) for path in new_paths))
+
+out_sdf = process_json_to_dataframe("reconf", new_paths)
 out_sdf.printSchema()
 out_sdf = out_sdf \
     .withColumn("year", lit(datetime.now().year)) \
     .withColumn("month", lit(datetime.now().month)) \
-    .withColumn("day", lit(datetime.now().day)) \
-    .repartition(1)
+    .withColumn("day", lit(datetime.now().day))
 
-try:
-    boto3_session = session.Session(
-        aws_access_key_id=environ["OUT_AWS_ACCESS_KEY_ID"],
-        aws_secret_access_key=environ["OUT_AWS_SECRET_ACCESS_KEY"],
-        region_name=environ["OUT_AWS_DEFAULT_REGION"]
-    )
-except KeyError:
-    boto3_session = session.Session()
-
-try:
-    wr.s3.to_parquet(
-        df=out_sdf.toPandas(),
+if builds:
+    digest = sha1("\n".join(builds).encode("UTF-8")).hexdigest()[:16]
+    written = write_parquet_incremental(
+        out_sdf,
         path=f"s3://{S3_DOCS_BUCKET}/csit/parquet/coverage_rls2606",
-        dataset=True,
         partition_cols=["test_type", "year", "month", "day"],
-        compression="snappy",
-        use_threads=True,
-        mode="overwrite_partitions",
+        file_name=f"reconf-{window}-{digest}.snappy.parquet",
         boto3_session=boto3_session
     )
-except EmptyDataFrame:
-    pass
+    print(f"Written {written} rows from {len(builds)} builds.")
+    manifest[window] = sorted(ingested.union(builds))
+    manifest_save(manifest_path, manifest, boto3_session)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ETL script running on top of the localhost, without Spark or Glue.
+
+Same processing as in the Spark scripts (schema from the same JSON files,
+job and build from the path, dropping incomplete rows, flattening),
+implemented with pyarrow, so it can run (and be timed) anywhere.
+
+The directory is expected to mirror the S3 layout below the prefix,
+<path>/<job>/<build>/..., for files not following the layout
+job is "local" and build is "unknown" (as in local.py).
+"""
+
+import gzip
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from json import load
+from pathlib import Path
+from time import monotonic
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+PATH="/app/tests"
+SUFFIX="info.json"
+IGNORE_SUFFIX=[
+    "suite.info.json",
+    "setup.info.json",
+    "teardown.info.json",
+    "suite.output.info.json",
+    "setup.output.info.json",
+    "teardown.output.info.json"
+]
+DROP_SUBSET=[
+    "dut_type", "dut_version",
+    "passed",
+    "test_name_long", "test_name_short",
+    "test_type",
+    "version"
+]
+BATCH_ROWS=10000
+SIMPLE_TYPES={
+    "string": pa.string(),
+    "integer": pa.int32(),
+    "long": pa.int64(),
+    "double": pa.float64(),
+    "boolean": pa.bool_(),
+    "timestamp": pa.timestamp("us", tz="UTC"),
+}
+
+
+def arrow_type(spark_type):
+    """Converts type from Spark JSON schema into pyarrow type.
+
+    :param spark_type: Type as in the JSON schema files.
+    :type spark_type: str or dict
+    :returns: Equivalent pyarrow type.
+    :rtype: pyarrow.DataType
+    """
+    if isinstance(spark_type, str):
+        return SIMPLE_TYPES[spark_type]
+    if spark_type["type"] == "array":
+        return pa.list_(arrow_type(spark_type["elementType"]))
+    return pa.struct([
+        pa.field(field["name"], arrow_type(field["type"]))
+        for field in spark_type["fields"]
+    ])
+
+
+def schema_load(prefix, option):
+    """Loads the JSON schema used by Spark scripts, as pyarrow schema.
+
+    Job and build are strings, as the Spark scripts parse them from path.
+
+    :param prefix: File name prefix, e.g. "trending".
+    :param option: File name suffix for the DataFrame schema.
+    :type prefix: str
+    :type option: str
+    :returns: Schema for the loaded rows.
+    :rtype: pyarrow.Schema
+    """
+    with open(f"{prefix}_{option}.json", "r", encoding="UTF-8") as f_schema:
+        spark_schema = load(f_schema)
+    fields = list()
+    for field in arrow_type(spark_schema):
+        if field.name in ("job", "build"):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+def parse_timestamps(value, data_type):
+    """Converts timestamp strings in (nested) value into datetimes.
+
+    :param value: Value loaded from JSON.
+    :param data_type: Pyarrow type the value should have.
+    :type value: object
+    :type data_type: pyarrow.DataType
+    :returns: Value with timestamps converted.
+    :rtype: object
+    """
+    if value is None:
+        return None
+    if pa.types.is_timestamp(data_type):
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+        return value
+    if pa.types.is_struct(data_type) and isinstance(value, dict):
+        for field in data_type:
+            if field.name in value:
+                value[field.name] = parse_timestamps(
+                    value[field.name], field.type
+                )
+    if pa.types.is_list(data_type) and isinstance(value, list):
+        return [parse_timestamps(item, data_type.value_type) for item in value]
+    return value
+
+
+def read_row(path, root, schema):
+    """Reads one JSON file into a row dict, including job and build.
+
+    :param path: Path to the (possibly gzipped) JSON file.
+    :param root: Directory the job and build are relative to.
+    :param schema: Schema of the rows, used for timestamp conversion.
+    :type path: Path
+    :type root: Path
+    :type schema: pyarrow.Schema
+    :returns: The row.
+    :rtype: dict
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="UTF-8") as f_in:
+        row = load(f_in)
+    parts = path.relative_to(root).parts
+    if len(parts) > 2:
+        row["job"], row["build"] = parts[0], parts[1]
+    else:
+        row["job"], row["build"] = "local", "unknown"
+    for field in schema:
+        if field.name in row:
+            row[field.name] = parse_timestamps(row[field.name], field.type)
+    return row
+
+
+def flatten_table(table):
+    """Unnest table in case there are nested structured columns.
+
+    Names are joined by underscore, as in flatten_frame of Spark scripts.
+
+    :param table: Table with possibly nested columns.
+    :type table: pyarrow.Table
+    :returns: Table without struct columns.
+    :rtype: pyarrow.Table
+    """
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table.rename_columns(
+        [name.replace(".", "_") for name in table.column_names]
+    )
+
+
+def process_json_to_table(prefix, schema_name, paths, root):
+    """Processes JSON files to pyarrow table, as Spark scripts do.
+
+    :param prefix: Schema file name prefix, e.g. "trending".
+    :param schema_name: Schema name.
+    :param paths: Local paths to process.
+    :param root: Directory the job and build are relative to.
+    :type prefix: str
+    :type schema_name: str
+    :type paths: list
+    :type root: Path
+    :returns: Flat table.
+    :rtype: pyarrow.Table
+    """
+    schema = schema_load(prefix, schema_name)
+    rows = list()
+    for path in paths:
+        if schema_name not in str(path):
+            continue
+        row = read_row(path, root, schema)
+        # rows with all nulls have also nulls in critical fields
+        if any(row.get(name) is None for name in DROP_SUBSET):
+            continue
+        rows.append(row)
+    table = pa.Table.from_pylist(rows, schema=schema)
+    return flatten_table(table)
+
+
+def main():
+    """Parse arguments, process local files, write parquet, print timing."""
+    parser = ArgumentParser(description="Local pyarrow ETL.")
+    parser.add_argument("--path", default=PATH, help="Directory to scan.")
+    parser.add_argument(
+        "--prefix", default="trending", help="Schema file name prefix."
+    )
+    parser.add_argument(
+        "--schemas", nargs="+", default=["mrr", "ndrpdr", "soak"],
+        help="Schema names to process."
+    )
+    parser.add_argument(
+        "--output", default="local.parquet",
+        help="Output dataset directory, empty to skip writing."
+    )
+    args = parser.parse_args()
+    root = Path(args.path)
+    paths = list()
+    for pattern in (f"**/*{SUFFIX}", f"**/*{SUFFIX}.gz"):
+        for file in root.glob(pattern):
+            name = file.name[:-3] if file.suffix == ".gz" else file.name
+            if name not in IGNORE_SUFFIX:
+                paths.append(file)
+    now = datetime.now()
+    for schema_name in args.schemas:
+        time_start = monotonic()
+        table = process_json_to_table(args.prefix, schema_name, paths, root)
+        duration = monotonic() - time_start
+        print(
+            f"{schema_name}: {table.num_rows} rows, "
+            f"{table.num_columns} columns in {duration:.3f} s"
+        )
+        if not args.output or not table.num_rows:
+            continue
+        table = table \
+            .append_column("year", pa.array([now.year] * table.num_rows)) \
+            .append_column("month", pa.array([now.month] * table.num_rows)) \
+            .append_column("day", pa.array([now.day] * table.num_rows)) \
+            .sort_by([("test_id", "ascending"), ("start_time", "ascending")])
+        # row groups sorted as written by the Spark scripts
+        pq.write_to_dataset(
+            table,
+            root_path=args.output,
+            partition_cols=["test_type", "year", "month", "day"],
+            compression="snappy",
+            row_group_size=BATCH_ROWS,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -128,6 +128,14 @@ class Constants:
     # OpenVPP testing directory location at topology nodes
     REMOTE_FW_DIR = "/tmp/openvpp-testing"
 
+    # Whether to deploy framework to nodes by sending only changed files.
+    # If true, framework cleanup keeps the directory as REMOTE_FW_CACHE_DIR
+    # for the next setup to start from.
+    FRAMEWORK_DELTA_SYNC = get_optimistic_bool_from_env("FRAMEWORK_DELTA_SYNC")
+
+    # Where framework cleanup keeps the directory for delta sync.
+    REMOTE_FW_CACHE_DIR = "/tmp/openvpp-testing.cache"
+
     # shell scripts location
     RESOURCES_LIB_SH = "resources/libraries/bash"
 
@@ -294,6 +302,23 @@ class Constants:
     # ASTF usually needs a different value for the delay.
     PERF_TRIAL_ASTF_DELAY = get_float_from_env("PERF_TRIAL_ASTF_DELAY", 0.112)
 
+    # Local directory for storing MLRsearch measurement databases,
+    # one file per test. A complete search warm starts the next run
+    # of the same test, an interrupted search is resumed by the next run.
+    # Empty value (default) disables both, each search starts cold.
+    PERF_MLRSEARCH_STATE_DIR = get_str_from_env("PERF_MLRSEARCH_STATE_DIR", "")
+
+    # Stored MLRsearch state older than this is ignored [s].
+    PERF_MLRSEARCH_STATE_MAX_AGE = get_float_from_env(
+        "PERF_MLRSEARCH_STATE_MAX_AGE", 604800.0
+    )
+
+    # Identification of the build the state is stored by (Jenkins build tag).
+    # Only a search interrupted in the same build (and DUT version) is resumed.
+    PERF_MLRSEARCH_STATE_BUILD = get_str_from_env(
+        ("PERF_MLRSEARCH_STATE_BUILD", "BUILD_TAG"), ""
+    )
+
     # Number of data frames in TPUT transaction, used both by TCP and UDP.
     # The value should be 33 to keep historic continuity for UDP TPUT tests,
     # but we are limited by TRex window of 48 KiB, so for 9000B tests
@@ -315,6 +340,24 @@ class Constants:
     # Global "kill switch" for CRC checking during runtime.
     FAIL_ON_CRC_MISMATCH = get_pessimistic_bool_from_env("FAIL_ON_CRC_MISMATCH")
 
+    # Local directory for caching VPP API files between Robot processes.
+    # Empty value disables the cache, files are downloaded for each process.
+    PAPI_CACHE_DIR = get_str_from_env("PAPI_CACHE_DIR", "/tmp/csit-papi-cache")
+
+    # How many VPP builds to keep in the PAPI cache, least recently used
+    # entries are evicted.
+    PAPI_CACHE_SIZE = get_int_from_env("PAPI_CACHE_SIZE", 4)
+
+    # Whether to forward PAPI sockets in-process over paramiko transport.
+    # If false (or if it fails), background ssh process is used instead.
+    PAPI_NATIVE_FORWARDING = get_optimistic_bool_from_env(
+        "PAPI_NATIVE_FORWARDING"
+    )
+
+    # Whether to read VPP stats by a long-lived remote agent.
+    # If false (or if it fails), the PAPI provider is executed for each read.
+    PAPI_STATS_AGENT = get_optimistic_bool_from_env("PAPI_STATS_AGENT")
+
     # Default IP4 prefix length (if not defined in topology file)
     DEFAULT_IP4_PREFIX_LENGTH = "24"
 
@@ -63,30 +63,31 @@ class CoreDumpUtil:
         :param nodes: Nodes in the topology.
         :type nodes: dict
         """
-        for node in nodes.values():
-            # Any binary which normally would not be dumped is dumped anyway,
-            # but only if the "core_pattern" kernel sysctl is set to either a
-            # pipe handler or a fully qualified path. (For more details on this
-            # limitation, see CVE-2006-2451.) This mode is appropriate when
-            # administrators are attempting to debug problems in a normal
-            # environment, and either have a core dump pipe handler that knows
-            # to treat privileged core dumps with care, or specific directory
-            # defined for catching core dumps. If a core dump happens without a
-            # pipe handler or fully qualified path, a message will be emitted to
-            # syslog warning about the lack of a correct setting.
-            SysctlUtil.set_sysctl_value(node, u"fs.suid_dumpable", 2)
-
-            # Specify a core dumpfile pattern name (for the output filename).
-            # %p    pid
-            # %u    uid (in initial user namespace)
-            # %g    gid (in initial user namespace)
-            # %s    signal number
-            # %t    UNIX time of dump
-            # %h    hostname
-            # %e    executable filename (may be shortened)
-            SysctlUtil.set_sysctl_value(
-                node, u"kernel.core_pattern", Constants.KERNEL_CORE_PATTERN
-            )
+        # Any binary which normally would not be dumped is dumped anyway,
+        # but only if the "core_pattern" kernel sysctl is set to either a
+        # pipe handler or a fully qualified path. (For more details on this
+        # limitation, see CVE-2006-2451.) This mode is appropriate when
+        # administrators are attempting to debug problems in a normal
+        # environment, and either have a core dump pipe handler that knows
+        # to treat privileged core dumps with care, or specific directory
+        # defined for catching core dumps. If a core dump happens without a
+        # pipe handler or fully qualified path, a message will be emitted to
+        # syslog warning about the lack of a correct setting.
+        # The "kernel.core_pattern" specifies a core dumpfile pattern name
+        # (for the output filename).
+        # %p    pid
+        # %u    uid (in initial user namespace)
+        # %g    gid (in initial user namespace)
+        # %s    signal number
+        # %t    UNIX time of dump
+        # %h    hostname
+        # %e    executable filename (may be shortened)
+        SysctlUtil.set_sysctl_values_on_nodes(
+            nodes, {
+                u"fs.suid_dumpable": 2,
+                u"kernel.core_pattern": Constants.KERNEL_CORE_PATTERN,
+            }
+        )
 
         self._corekeeper_configured = True
 
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -18,7 +18,7 @@ from random import choice
 from robot.libraries.BuiltIn import BuiltIn
 
 from resources.libraries.python.Constants import Constants
-from resources.libraries.python.ssh import exec_cmd_no_error
+from resources.libraries.python.ssh import exec_cmd_on_nodes
 from resources.libraries.python.topology import Topology, NodeType
 
 __all__ = [u"CpuUtils"]
@@ -70,15 +70,20 @@ class CpuUtils:
                - cpu architecture
                - cpu layout
 
+        Both commands are executed in one SSH call, on all nodes in parallel.
+
         :param nodes: DICT__nodes from Topology.DICT__nodes.
         :type nodes: dict
         :raises RuntimeError: If an ssh command retrieving cpu information
             fails.
         """
-        for node in nodes.values():
-            stdout, _ = exec_cmd_no_error(node, u"uname -m")
-            node[u"arch"] = stdout.strip()
-            stdout, _ = exec_cmd_no_error(node, u"lscpu -p")
+        results = exec_cmd_on_nodes(
+            nodes, u"uname -m && lscpu -p",
+            message=u"Failed to retrieve cpu information."
+        )
+        for key, node in nodes.items():
+            arch, _, stdout = results[key].stdout.partition(u"\n")
+            node[u"arch"] = arch.strip()
             node[u"cpuinfo"] = list()
             for line in stdout.split(u"\n"):
                 if line and line[0] != u"#":
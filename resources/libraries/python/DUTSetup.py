@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -16,13 +16,48 @@
 from time import sleep
 from robot.api import logger
 
-from resources.libraries.python.ssh import exec_cmd, exec_cmd_no_error
+from resources.libraries.python.ssh import exec_cmd, exec_cmd_no_error, \
+    exec_cmd_on_nodes
 from resources.libraries.python.topology import NodeType, Topology
 
 
 class DUTSetup:
     """Contains methods for setting up DUTs."""
 
+    @staticmethod
+    def _service_command(service, action):
+        """Return command applying action to service, container or not.
+
+        The command detects container by itself, so the same command
+        can be executed on multiple nodes at once.
+
+        :param service: Service unit name.
+        :param action: The systemctl (or supervisorctl) action, e.g. stop.
+        :type service: str
+        :type action: str
+        :returns: Command to execute with sudo.
+        :rtype: str
+        """
+        return (
+            f"bash -c 'if [ -f /.dockerenv ]; then supervisorctl {action} "
+            f"{service}; else systemctl {action} {service}; fi'"
+        )
+
+    @staticmethod
+    def _service_logs_command(service):
+        """Return command printing service unit logs, no-op in container.
+
+        :param service: Service unit name.
+        :type service: str
+        :returns: Command to execute with sudo.
+        :rtype: str
+        """
+        return (
+            f"bash -c '[ -f /.dockerenv ] || journalctl --no-pager "
+            f"_SYSTEMD_INVOCATION_ID=$(systemctl show -p InvocationID "
+            f"--value {service})'"
+        )
+
     @staticmethod
     def get_service_logs(node, service):
         """Get specific service unit logs from node.
@@ -53,9 +88,11 @@ class DUTSetup:
         :type nodes: dict
         :type service: str
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                DUTSetup.get_service_logs(node, service)
+        exec_cmd_on_nodes(
+            nodes, DUTSetup._service_logs_command(service), timeout=30,
+            sudo=True, node_type=NodeType.DUT,
+            message=f"Failed to get logs from unit {service}"
+        )
 
     @staticmethod
     def restart_service(node, service):
@@ -87,9 +124,12 @@ class DUTSetup:
         :type nodes: dict
         :type service: str
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                DUTSetup.restart_service(node, service)
+        exec_cmd_on_nodes(
+            nodes, DUTSetup._service_command(service, u"restart"),
+            timeout=180, sudo=True, node_type=NodeType.DUT,
+            message=f"Failed to restart service {service}"
+        )
+        DUTSetup.get_service_logs_on_all_duts(nodes, service)
 
     @staticmethod
     def start_service(node, service):
@@ -121,9 +161,12 @@ class DUTSetup:
         :type nodes: dict
         :type service: str
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                DUTSetup.start_service(node, service)
+        exec_cmd_on_nodes(
+            nodes, DUTSetup._service_command(service, u"restart"),
+            timeout=180, sudo=True, node_type=NodeType.DUT,
+            message=f"Failed to start service {service}"
+        )
+        DUTSetup.get_service_logs_on_all_duts(nodes, service)
 
     @staticmethod
     def stop_service(node, service):
@@ -155,9 +198,12 @@ class DUTSetup:
         :type nodes: dict
         :type service: str
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                DUTSetup.stop_service(node, service)
+        DUTSetup.get_service_logs_on_all_duts(nodes, service)
+        exec_cmd_on_nodes(
+            nodes, DUTSetup._service_command(service, u"stop"),
+            timeout=180, sudo=True, node_type=NodeType.DUT,
+            message=f"Failed to stop service {service}"
+        )
 
     @staticmethod
     def kill_program(node, program, namespace=None):
@@ -237,12 +283,16 @@ class DUTSetup:
         :type nodes: dict
         :returns: PIDs
         :rtype: dict
+        :raises RuntimeError: If it is not possible to get the PID on any DUT.
         """
-        pids = dict()
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                pids[node[u"host"]] = DUTSetup.get_pid(node, u"vpp")
-        return pids
+        results = exec_cmd_on_nodes(
+            nodes, u"pidof vpp", retries=3, node_type=NodeType.DUT,
+            message=u"No vpp PID found"
+        )
+        return {
+            result.host: [int(pid) for pid in result.stdout.split()]
+            for result in results.values()
+        }
 
     @staticmethod
     def get_virtfn_pci_addr(node, pf_pci_addr, vf_id):
@@ -557,10 +607,9 @@ class DUTSetup:
         :type nodes: dict
         :type module: str
         :type force_load: bool
+        :raises RuntimeError: If module is not loaded or failed to load.
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                DUTSetup.verify_kernel_module(node, module, force_load)
+        DUTSetup._verify_kernel_module_on_nodes(nodes, module, force_load)
 
     @staticmethod
     def verify_uio_driver_on_all_duts(nodes):
@@ -569,11 +618,43 @@ class DUTSetup:
 
         :param nodes: DUT nodes.
         :type nodes: dict
+        :raises RuntimeError: If module failed to load.
         """
-        for node in nodes.values():
-            if node[u"type"] == NodeType.DUT:
-                uio_driver = Topology.get_uio_driver(node)
-                DUTSetup.verify_kernel_module(node, uio_driver, force_load=True)
+        DUTSetup._verify_kernel_module_on_nodes(
+            nodes, Topology.get_uio_driver, force_load=True
+        )
+
+    @staticmethod
+    def _verify_kernel_module_on_nodes(nodes, module, force_load):
+        """Verify (and load if requested) kernel module on all DUTs in parallel.
+
+        :param nodes: DUT nodes.
+        :param module: Module to verify, or callable returning it for a node.
+        :param force_load: If True then try to load module.
+        :type nodes: dict
+        :type module: str or Callable[[dict], str]
+        :type force_load: bool
+        :raises RuntimeError: If module is not loaded or failed to load.
+        """
+        get_module = module if callable(module) else lambda _: module
+        results = exec_cmd_on_nodes(
+            nodes, lambda node: f"grep -w {get_module(node)} /proc/modules",
+            timeout=30, node_type=NodeType.DUT, check=False
+        )
+        missing = {
+            key: nodes[key] for key, result in results.items()
+            if not result.passed
+        }
+        if not missing:
+            return
+        if not force_load:
+            raise RuntimeError(
+                f"Kernel module is not loaded on: {u', '.join(missing)}"
+            )
+        exec_cmd_on_nodes(
+            missing, lambda node: f"modprobe {get_module(node)}", timeout=30,
+            sudo=True, message=u"Failed to load kernel module"
+        )
 
     @staticmethod
     def load_kernel_module(node, module):
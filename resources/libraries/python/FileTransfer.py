@@ -0,0 +1,546 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Library for bulk file transfers between Robot machine and nodes.
+
+Data is streamed as a gzip compressed (on the fastest level) tar archive
+through stdin or stdout of a remote tar command, so no temporary files
+are created on either side, and no separate copy and extract steps happen.
+
+Pushing a directory supports delta sync. Content manifests
+(path to hash and executable bit) are computed on both sides,
+the remote one by the very same function executed by remote python3.
+Only new or changed files are sent, files missing locally are deleted
+from the node. If the delta sync fails (e.g. because of files not owned
+by the SSH user), the remote directory is deleted and everything is sent.
+"""
+
+import gzip
+import inspect
+import io
+import json
+import os
+import tarfile
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import monotonic
+
+from robot.api import logger
+
+from resources.libraries.python.ssh import SSH, exec_cmd
+
+
+__all__ = [
+    u"TransferReport",
+    u"compute_manifest",
+    u"fetch_paths",
+    u"push_directory_to_nodes",
+]
+
+
+EXCLUDED_TOP = (u"env", u"tmp")
+"""Top level directories never transferred nor deleted on nodes."""
+EXCLUDED_NAMES = (
+    u".git", u".gitignore", u".gitattributes", u".gitmodules", u".gitreview",
+    u"__pycache__", u"*.pyc", u"output*.xml",
+)
+"""Patterns of file or directory names never transferred nor deleted."""
+DELETE_LIST = u".csit-delete-list"
+"""Archive member listing (NUL separated) paths to delete on the node."""
+CHUNK_SIZE = 1024 * 1024
+"""How many bytes to read at once."""
+
+
+def compute_manifest(root, excluded_top=EXCLUDED_TOP,
+                     excluded_names=EXCLUDED_NAMES):
+    """Return content manifest of a directory tree.
+
+    Symbolic links are not followed, their target is recorded instead
+    of content hash. Unreadable and special files are skipped.
+    Only the executable bit of file mode is recorded,
+    as the other bits depend on umask of the extracting user.
+
+    This function is also executed by python3 on nodes,
+    so it has to be self-contained and compatible with older Python.
+
+    :param root: Directory to compute the manifest for.
+    :param excluded_top: Names of top level items to skip.
+    :param excluded_names: Glob patterns of item names to skip anywhere.
+    :type root: str
+    :type excluded_top: Iterable[str]
+    :type excluded_names: Iterable[str]
+    :returns: Mapping from relative path to hash and executable flag.
+    :rtype: Dict[str, Tuple[str, bool]]
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name,reimported
+    import fnmatch
+    import functools
+    import hashlib
+    import os
+    import stat
+
+    manifest = dict()
+    for dir_path, dir_names, file_names in os.walk(root):
+        kept_dirs = list()
+        for name in sorted(dir_names + file_names):
+            path = os.path.join(dir_path, name)
+            rel_path = os.path.relpath(path, root)
+            if rel_path in excluded_top:
+                continue
+            if any(fnmatch.fnmatch(name, pat) for pat in excluded_names):
+                continue
+            if os.path.islink(path):
+                manifest[rel_path] = (u"link:" + os.readlink(path), False)
+                continue
+            if name in dir_names:
+                kept_dirs.append(name)
+                continue
+            try:
+                mode = os.stat(path).st_mode
+                if not stat.S_ISREG(mode):
+                    continue
+                digest = hashlib.sha256()
+                with open(path, u"rb") as file_in:
+                    read = functools.partial(file_in.read, 1 << 20)
+                    for chunk in iter(read, b""):
+                        digest.update(chunk)
+            except OSError:
+                continue
+            manifest[rel_path] = (
+                digest.hexdigest(), bool(mode & stat.S_IXUSR)
+            )
+        dir_names[:] = kept_dirs
+    return manifest
+
+
+def _remote_manifest_script():
+    """Return python source printing manifest of directory given in argv.
+
+    :returns: Python code to feed to remote python3 stdin.
+    :rtype: str
+    """
+    return (
+        f"EXCLUDED_TOP = {EXCLUDED_TOP!r}\n"
+        f"EXCLUDED_NAMES = {EXCLUDED_NAMES!r}\n"
+        f"{inspect.getsource(compute_manifest)}\n"
+        f"import json, sys\n"
+        f"json.dump(compute_manifest(sys.argv[1]), sys.stdout)\n"
+    )
+
+
+@dataclass
+class TransferReport:
+    """Statistics of pushing a directory to one node."""
+
+    host: str
+    """Host of the node."""
+    files_total: int = 0
+    """Number of files (and links) in the local directory."""
+    bytes_total: int = 0
+    """Size of the local directory content in bytes."""
+    files_sent: int = 0
+    """Number of new or changed files sent."""
+    files_deleted: int = 0
+    """Number of files deleted on the node."""
+    bytes_sent: int = 0
+    """Size of the files sent, before compression."""
+    bytes_wire: int = 0
+    """Size of the compressed archive sent over SSH."""
+    full: bool = False
+    """True if all files were sent (delta disabled, failed or first sync)."""
+    fallback: str = u""
+    """Why delta sync was abandoned, empty if it was not."""
+    duration: float = 0.0
+    """Wall time in seconds spent on the node."""
+    error: str = u""
+    """Description of the failure, empty on success."""
+
+    @property
+    def bytes_saved(self):
+        """Return how many bytes less went over the wire than the raw tree.
+
+        :returns: Bytes saved by delta sync and compression.
+        :rtype: int
+        """
+        return self.bytes_total - self.bytes_wire
+
+    def describe(self):
+        """Return one line summary suitable for logging.
+
+        :returns: Human readable summary.
+        :rtype: str
+        """
+        if self.error:
+            return f"Transfer to {self.host} failed: {self.error}"
+        kind = u"full" if self.full else u"delta"
+        if self.fallback:
+            kind = f"full after {self.fallback}"
+        return (
+            f"Transfer ({kind}) to {self.host}: sent {self.files_sent} of "
+            f"{self.files_total} files, deleted {self.files_deleted}, "
+            f"{self.bytes_wire} B on wire instead of {self.bytes_total} B "
+            f"({self.bytes_saved} B saved) in {self.duration:.2f}s."
+        )
+
+
+class _ChannelWriter:
+    """Minimal binary file object writing to channel, counting bytes."""
+
+    def __init__(self, chan):
+        """Store the channel, start counting.
+
+        :param chan: Channel with a remote command reading stdin.
+        :type chan: paramiko.Channel
+        """
+        self.chan = chan
+        self.count = 0
+
+    def write(self, data):
+        """Send all data to the channel.
+
+        :param data: Bytes to send.
+        :type data: bytes
+        :returns: Number of bytes written.
+        :rtype: int
+        """
+        self.chan.sendall(data)
+        self.count += len(data)
+        return len(data)
+
+    def flush(self):
+        """Nothing to flush, data is sent immediately."""
+
+
+def _finish_channel(chan, cmd):
+    """Wait for the remote command to finish, raise if it failed.
+
+    :param chan: Channel with the command.
+    :param cmd: The command, used in the error message.
+    :type chan: paramiko.Channel
+    :type cmd: str
+    :raises RuntimeError: If the command returned non-zero code.
+    """
+    ret_code = chan.recv_exit_status()
+    stderr = b""
+    while chan.recv_stderr_ready():
+        stderr += chan.recv_stderr(CHUNK_SIZE)
+    chan.close()
+    if ret_code != 0:
+        raise RuntimeError(
+            f"Command failed: '{cmd}'\nRC: {ret_code}\n"
+            f"{stderr.decode(u'utf-8', errors=u'ignore')}"
+        )
+
+
+def _get_remote_manifest(ssh, remote_dir, timeout):
+    """Compute manifest of the remote directory by remote python3.
+
+    :param ssh: Connected SSH instance.
+    :param remote_dir: Directory on the node.
+    :param timeout: Timeout in seconds for channel operations.
+    :type ssh: SSH
+    :type remote_dir: str
+    :type timeout: int
+    :returns: Remote manifest, as compute_manifest returns.
+    :rtype: Dict[str, Tuple[str, bool]]
+    :raises RuntimeError: If remote python3 failed.
+    """
+    cmd = f"python3 - {remote_dir}"
+    chan = ssh.open_command_channel(cmd, timeout=timeout)
+    chan.sendall(_remote_manifest_script().encode(u"utf-8"))
+    chan.shutdown_write()
+    chunks = list()
+    while 1:
+        chunk = chan.recv(CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    _finish_channel(chan, cmd)
+    manifest = json.loads(b"".join(chunks))
+    return {path: tuple(value) for path, value in manifest.items()}
+
+
+def _send_archive(ssh, local_dir, remote_dir, to_send, to_delete, timeout):
+    """Stream compressed archive of given files into remote tar.
+
+    Paths to delete are put into the archive as a special member,
+    the remote command deletes them after extraction.
+
+    :param ssh: Connected SSH instance.
+    :param local_dir: Local directory the paths are relative to.
+    :param remote_dir: Directory on the node to extract into.
+    :param to_send: Relative paths of files to send.
+    :param to_delete: Relative paths of files to delete on the node.
+    :param timeout: Timeout in seconds for channel operations.
+    :type ssh: SSH
+    :type local_dir: str
+    :type remote_dir: str
+    :type to_send: List[str]
+    :type to_delete: List[str]
+    :type timeout: int
+    :returns: Number of bytes sent over the channel.
+    :rtype: int
+    :raises RuntimeError: If remote tar or deletion failed.
+    """
+    cmd = (
+        f"mkdir -p {remote_dir} && cd {remote_dir} && tar -xzf - && "
+        f"xargs -0 -r rm -f -- < {DELETE_LIST} && rm -f {DELETE_LIST}"
+    )
+    chan = ssh.open_command_channel(cmd, timeout=timeout)
+    writer = _ChannelWriter(chan)
+    with gzip.GzipFile(fileobj=writer, mode=u"wb", compresslevel=1) as gz_out:
+        with tarfile.open(fileobj=gz_out, mode=u"w|") as tar:
+            for rel_path in to_send:
+                tar.add(
+                    os.path.join(local_dir, rel_path), arcname=rel_path,
+                    recursive=False
+                )
+            data = u"\0".join(to_delete).encode(u"utf-8")
+            info = tarfile.TarInfo(DELETE_LIST)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    chan.shutdown_write()
+    _finish_channel(chan, cmd)
+    return writer.count
+
+
+def _size_of(local_dir, paths):
+    """Return total size of the paths (not following links) in bytes.
+
+    :param local_dir: Local directory the paths are relative to.
+    :param paths: Relative paths.
+    :type local_dir: str
+    :type paths: Iterable[str]
+    :returns: Total size.
+    :rtype: int
+    """
+    return sum(
+        os.lstat(os.path.join(local_dir, path)).st_size for path in paths
+    )
+
+
+def _push_to_node(node, local_dir, remote_dir, local_manifest, delta, timeout):
+    """Synchronize remote directory with the local one, return statistics.
+
+    This runs in a worker thread, so nothing is logged.
+
+    :param node: Node to push to.
+    :param local_dir: Local directory to push.
+    :param remote_dir: Directory on the node to synchronize.
+    :param local_manifest: Precomputed manifest of local_dir.
+    :param delta: Whether to attempt delta sync.
+    :param timeout: Timeout in seconds for each remote operation.
+    :type node: dict
+    :type local_dir: str
+    :type remote_dir: str
+    :type local_manifest: Dict[str, Tuple[str, bool]]
+    :type delta: bool
+    :type timeout: int
+    :returns: Transfer statistics.
+    :rtype: TransferReport
+    """
+    start = monotonic()
+    report = TransferReport(host=node[u"host"])
+    report.files_total = len(local_manifest)
+    report.bytes_total = _size_of(local_dir, local_manifest)
+    ssh = SSH()
+    try:
+        ssh.connect(node)
+        if delta:
+            try:
+                remote_manifest = _get_remote_manifest(ssh, remote_dir, timeout)
+                to_send = [
+                    path for path, value in local_manifest.items()
+                    if remote_manifest.get(path) != value
+                ]
+                to_delete = sorted(set(remote_manifest) - set(local_manifest))
+                report.bytes_wire = _send_archive(
+                    ssh, local_dir, remote_dir, to_send, to_delete, timeout
+                )
+                report.files_sent = len(to_send)
+                report.files_deleted = len(to_delete)
+                report.bytes_sent = _size_of(local_dir, to_send)
+                report.full = not remote_manifest
+            except (RuntimeError, OSError, ValueError) as exc:
+                report.fallback = f"delta sync failure {exc!r}"
+        if not delta or report.fallback:
+            exec_cmd(
+                node, f"sudo rm -rf {remote_dir}", timeout=timeout,
+                log_stdout_err=False
+            )
+            report.bytes_wire = _send_archive(
+                ssh, local_dir, remote_dir, list(local_manifest), list(),
+                timeout
+            )
+            report.files_sent = len(local_manifest)
+            report.files_deleted = 0
+            report.bytes_sent = report.bytes_total
+            report.full = True
+    except Exception as exc:  # pylint: disable=broad-except
+        # Any exception in a thread has to be reported via the result.
+        report.error = repr(exc)
+    report.duration = monotonic() - start
+    return report
+
+
+def push_directory_to_nodes(
+        nodes, local_dir, remote_dir, delta=True, timeout=600):
+    """Make remote_dir on all nodes match local_dir, in parallel.
+
+    Excluded items (see EXCLUDED_TOP and EXCLUDED_NAMES)
+    are neither sent nor deleted.
+    Statistics for each node are logged (also to console).
+
+    :param nodes: Nodes to push to, e.g. from topology.
+    :param local_dir: Local directory to push.
+    :param remote_dir: Directory on the nodes to synchronize.
+    :param delta: If False, remote directory is recreated from scratch.
+    :param timeout: Timeout in seconds for each remote operation.
+    :type nodes: dict
+    :type local_dir: str
+    :type remote_dir: str
+    :type delta: bool
+    :type timeout: int
+    :returns: Transfer statistics, keyed as the nodes argument.
+    :rtype: Dict[str, TransferReport]
+    :raises RuntimeError: If transfer failed on any node.
+    """
+    start = monotonic()
+    local_manifest = compute_manifest(local_dir)
+    logger.debug(
+        f"Manifest of {len(local_manifest)} files computed in "
+        f"{monotonic() - start}s."
+    )
+    with ThreadPoolExecutor(max_workers=len(nodes) or 1) as executor:
+        futures = {
+            key: executor.submit(
+                _push_to_node, node, local_dir, remote_dir, local_manifest,
+                delta, timeout
+            )
+            for key, node in nodes.items()
+        }
+        reports = {key: future.result() for key, future in futures.items()}
+    for report in reports.values():
+        logger.console(report.describe())
+        logger.info(report.describe())
+    failed = [key for key, report in reports.items() if report.error]
+    if failed:
+        raise RuntimeError(
+            f"Failed to push {local_dir} to: {u', '.join(failed)}"
+        )
+    return reports
+
+
+def _check_member(member, base_dir):
+    """Raise if archive member would be extracted outside base directory.
+
+    Same checks as the "data" extraction filter does, for Python versions
+    without extraction filters. Leading slashes are stripped from the name.
+
+    :param member: Archive member to check, its name may be changed.
+    :param base_dir: Real path of the directory to extract into.
+    :type member: tarfile.TarInfo
+    :type base_dir: str
+    :raises RuntimeError: If the member is a device, or it (or its link
+        target) would end up outside base_dir.
+    """
+    def outside(path):
+        """Return whether the path resolves to outside of base_dir.
+
+        :param path: Path to check.
+        :type path: str
+        :returns: True if the real path is not under base_dir.
+        :rtype: bool
+        """
+        path = os.path.realpath(path)
+        return os.path.commonpath([base_dir, path]) != base_dir
+
+    member.name = member.name.lstrip(u"/")
+    target = os.path.join(base_dir, member.name)
+    if member.isdev() or outside(target):
+        raise RuntimeError(f"Refused archive member: {member.name!r}")
+    if member.issym():
+        if os.path.isabs(member.linkname) or outside(
+                os.path.join(os.path.dirname(target), member.linkname)):
+            raise RuntimeError(f"Refused archive link: {member.name!r}")
+    elif member.islnk():
+        if outside(os.path.join(base_dir, member.linkname.lstrip(u"/"))):
+            raise RuntimeError(f"Refused archive link: {member.name!r}")
+
+
+def _extract_archive(tar, local_dir):
+    """Extract all members of a (streamed) archive into local directory.
+
+    The archive comes from a node, so members with absolute or parent paths,
+    links pointing outside local_dir and device files are refused.
+    The "data" extraction filter is used if available,
+    the same checks are done by _check_member otherwise.
+
+    :param tar: Archive opened for reading.
+    :param local_dir: Local directory to extract into.
+    :type tar: tarfile.TarFile
+    :type local_dir: str
+    :raises RuntimeError: If a member would be extracted outside local_dir.
+    """
+    if hasattr(tarfile, u"data_filter"):
+        try:
+            tar.extractall(local_dir, filter=u"data")
+        except tarfile.FilterError as err:
+            raise RuntimeError(f"Refused archive member: {err}") from err
+        return
+    base_dir = os.path.realpath(local_dir)
+    for member in tar:
+        _check_member(member, base_dir)
+        tar.extract(member, base_dir)
+
+
+def fetch_paths(node, remote_paths, local_dir, excludes=(), timeout=600):
+    """Download remote paths (globs allowed) into local directory.
+
+    Remote tar output is extracted on the fly, absolute remote paths
+    end up relative to local_dir (so /a/b is saved as local_dir/a/b).
+
+    :param node: Node to download from.
+    :param remote_paths: Remote files, directories or bash globs.
+    :param local_dir: Local directory to extract into.
+    :param excludes: Glob patterns to exclude.
+    :param timeout: Timeout in seconds for channel operations.
+    :type node: dict
+    :type remote_paths: Iterable[str]
+    :type local_dir: str
+    :type excludes: Iterable[str]
+    :type timeout: int
+    :returns: Number of bytes received over the channel.
+    :rtype: int
+    :raises RuntimeError: If remote tar fails or connection fails,
+        or if the archive has a member to be extracted outside local_dir.
+    """
+    start = monotonic()
+    options = u" ".join(f"--exclude={pattern}" for pattern in excludes)
+    inner_cmd = f"tar -czf - {options} {u' '.join(remote_paths)}"
+    # Bash expands the globs, quoting prevents early expansion by ssh shell.
+    cmd = f"bash -c '{inner_cmd}'"
+    ssh = SSH()
+    ssh.connect(node)
+    chan = ssh.open_command_channel(cmd, timeout=timeout)
+    reader = chan.makefile(u"rb")
+    with tarfile.open(fileobj=reader, mode=u"r|gz") as tar:
+        _extract_archive(tar, local_dir)
+    received = reader.tell() if hasattr(reader, u"tell") else 0
+    _finish_channel(chan, cmd)
+    logger.debug(
+        f"Fetched {remote_paths} from {node[u'host']} in "
+        f"{monotonic() - start}s."
+    )
+    return received
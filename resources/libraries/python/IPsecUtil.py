@@ -593,7 +593,7 @@ class IPsecUtil:
             anti_replay_window_size=IPSEC_REPLAY_WINDOW_DEFAULT,
         )
         args = dict(entry=sad_entry)
-        with PapiSocketExecutor(node, is_async=True) as papi_exec:
+        with PapiSocketExecutor(node) as papi_exec:
             for i in range(n_entries):
                 args["entry"]["sad_id"] = int(sad_id) + i
                 args["entry"]["spi"] = int(spi) + i
@@ -609,7 +609,7 @@ class IPsecUtil:
                 )
                 history = bool(not 1 < i < n_entries - 2)
                 papi_exec.add(cmd, history=history, **args)
-            papi_exec.get_replies(err_msg)
+            papi_exec.get_results(err_msg)
 
     @staticmethod
     def vpp_ipsec_set_ip_route(
@@ -680,7 +680,7 @@ class IPsecUtil:
             f" on interface {interface} on host {node['host']}"
         )
 
-        with PapiSocketExecutor(node, is_async=True) as papi_exec:
+        with PapiSocketExecutor(node) as papi_exec:
             for i in range(n_tunnels):
                 tunnel_dst_addr = tunnel_dst + i * addr_incr
                 args1["prefix"] = IPUtil.create_prefix_object(
@@ -711,7 +711,7 @@ class IPsecUtil:
                         tunnel_dst_addr
                     )
                     papi_exec.add(cmd3, history=history, **args3)
-            papi_exec.get_replies(err_msg)
+            papi_exec.get_results(err_msg)
 
     @staticmethod
     def vpp_ipsec_add_spd(node: dict, spd_id: int) -> None:
@@ -1058,7 +1058,7 @@ class IPsecUtil:
             "Failed to add entry to Security Policy Database"
             f" {spd_id} on host {node['host']}"
         )
-        with PapiSocketExecutor(node, is_async=True) as papi_exec:
+        with PapiSocketExecutor(node) as papi_exec:
             IPsecUtil._vpp_ipsec_add_spd_entry_internal(
                 papi_exec,
                 spd_id,
@@ -1073,7 +1073,7 @@ class IPsecUtil:
                 rport_range,
                 is_ipv6,
             )
-            papi_exec.get_replies(err_msg)
+            papi_exec.get_results(err_msg)
 
     @staticmethod
     def vpp_ipsec_add_spd_entries(
@@ -1142,7 +1142,7 @@ class IPsecUtil:
             "Failed to add entry to Security Policy Database"
             f" {spd_id} on host {node['host']}"
         )
-        with PapiSocketExecutor(node, is_async=True) as papi_exec:
+        with PapiSocketExecutor(node) as papi_exec:
             for _ in range(n_entries):
                 IPsecUtil._vpp_ipsec_add_spd_entry_internal(
                     papi_exec,
@@ -1158,7 +1158,7 @@ class IPsecUtil:
                     rport_range,
                     is_ipv6,
                 )
-            papi_exec.get_replies(err_msg)
+            papi_exec.get_results(err_msg)
 
     @staticmethod
     def _ipsec_create_loopback_dut1_papi(
@@ -1934,7 +1934,7 @@ class InterfaceUtil:
             for ifc in node[u"interfaces"].values():
                 if ifc[u"vpp_sw_index"] is not None:
                     papi_exec.add(cmd, sw_if_index=ifc[u"vpp_sw_index"])
-            details = papi_exec.get_details(err_msg)
+            details = [d for res in papi_exec.get_results(err_msg) for d in res]
         return sorted(details, key=lambda k: k[u"sw_if_index"])
 
     @staticmethod
@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -27,4 +27,4 @@ from .goal_result import GoalResult
 from .multiple_loss_ratio_search import MultipleLossRatioSearch
 from .pep3140 import Pep3140Dict
 from .search_goal import SearchGoal
-from .trial_measurement import AbstractMeasurer, MeasurementResult
+from .trial_measurement import AbstractMeasurer, MeasurementResult, MeasurerPool
@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -13,14 +13,17 @@
 
 """Module defining MeasurementDatabase class."""
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Tuple
 
+from .dataclass import secondary_field
 from .discrete_load import DiscreteLoad
 from .discrete_result import DiscreteResult
 from .load_stats import LoadStats
 from .relevant_bounds import RelevantBounds
 from .target_spec import TargetSpec
+from .trial_measurement import MeasurementResult
 from .trimmed_stat import TrimmedStat
 
 
@@ -39,15 +42,43 @@ class MeasurementDatabase:
     strictly smaller than the relevant upper bound.
     This way any higher loads with good results are ignored,
     so relevant bound give conservative estimate of SUT true performance.
+
+    The individual results are also kept (in the order they were added),
+    so the database can be exported (see to_dict) and the results
+    imported later (see results_from_dict), e.g. to resume a search
+    or to warm start a search with the same goals.
+
+    As relevant bounds are queried (for every selector) in every main loop
+    iteration, the classification of loads is kept indexed.
+    For each target, there are sorted lists of (float) loads
+    that are lower bounds and upper bounds (for both estimates).
+    The index is updated lazily, when a target is queried,
+    only loads with results added since the previous query
+    (for that target) are classified again,
+    the rest of the query is just a bisection.
+    Relevant bounds are cached until a new result is added.
     """
 
     targets: Tuple[TargetSpec] = None
     """Targets to track stats for."""
     load_to_stats: Dict[DiscreteLoad, LoadStats] = None
-    """Mapping from loads to stats."""
+    """Mapping from loads to stats, in the order of first addition."""
+    results: List[DiscreteResult] = None
+    """Results added so far, in the order of addition."""
+    # Derived fields, indexing the stats.
+    float_to_stats: Dict[float, LoadStats] = secondary_field()
+    """Mapping from float form of loads to stats."""
+    target_to_lowers: Dict[TargetSpec, List[float]] = secondary_field()
+    """For each target, sorted loads classified as lower bound."""
+    target_to_uppers: Dict[TargetSpec, List[float]] = secondary_field()
+    """For each target, sorted loads classified as upper bound."""
+    target_to_position: Dict[TargetSpec, int] = secondary_field()
+    """For each target, number of results the index already reflects."""
+    target_to_bounds: Dict[TargetSpec, RelevantBounds] = secondary_field()
+    """Cache of relevant bounds, valid if the target position is current."""
 
     def __post_init__(self) -> None:
-        """Check and sort initial values.
+        """Check initial values and index them.
 
         If no stats yet, initialize empty ones.
 
@@ -57,11 +88,33 @@ class MeasurementDatabase:
             raise ValueError(f"Database needs targets: {self.targets!r}")
         if not self.load_to_stats:
             self.load_to_stats = {}
-        self._sort()
+        if not self.results:
+            self.results = []
+        self.float_to_stats = {}
+        self.target_to_lowers = {target: [] for target in self.targets}
+        self.target_to_uppers = {target: [] for target in self.targets}
+        self.target_to_position = {}
+        self.target_to_bounds = {}
+        for load_stats in self.load_to_stats.values():
+            self.float_to_stats[float(load_stats)] = load_stats
+        for target in self.targets:
+            self._classify(target, self.float_to_stats)
+            self.target_to_position[target] = len(self.results)
+
+    def _classify(self, target: TargetSpec, loads: Iterable[float]) -> None:
+        """Update the index of the target for the given (changed) loads.
 
-    def _sort(self) -> None:
-        """Sort keys from low to high load."""
-        self.load_to_stats = dict(sorted(self.load_to_stats.items()))
+        :param target: The target to classify the loads for.
+        :param loads: Float forms of the loads to classify again.
+        :type target: TargetSpec
+        :type loads: Iterable[float]
+        """
+        lowers = self.target_to_lowers[target]
+        uppers = self.target_to_uppers[target]
+        for load in loads:
+            opt, pes = self.float_to_stats[load].estimates(target)
+            _set_membership(lowers, load, opt and pes)
+            _set_membership(uppers, load, not (opt or pes))
 
     def __getitem__(self, key: DiscreteLoad) -> LoadStats:
         """Allow access to stats as if self was load_to_stats.
@@ -85,13 +138,47 @@ class MeasurementDatabase:
         discrete_load = result.discrete_load.hashable()
         if not discrete_load.is_round:
             raise ValueError(f"Not round load: {discrete_load!r}")
-        if discrete_load not in self.load_to_stats:
-            self.load_to_stats[discrete_load] = LoadStats.new_empty(
+        load_stats = self.load_to_stats.get(discrete_load)
+        if load_stats is None:
+            load_stats = LoadStats.new_empty(
                 load=discrete_load,
                 targets=self.targets,
             )
-            self._sort()
-        self.load_to_stats[discrete_load].add(result)
+            self.load_to_stats[discrete_load] = load_stats
+            self.float_to_stats[float(discrete_load)] = load_stats
+        load_stats.add(result)
+        self.results.append(result)
+
+    def to_dict(self) -> dict:
+        """Return JSON serializable form of the results added so far.
+
+        Only primary quantities of the results are stored,
+        stats are recomputed when the results are added to a new database.
+
+        :returns: Results in a form suitable for results_from_dict.
+        :rtype: dict
+        """
+        names = [item.name for item in fields(MeasurementResult)]
+        return dict(
+            results=[
+                {name: getattr(result, name) for name in names}
+                for result in self.results
+            ]
+        )
+
+    @staticmethod
+    def results_from_dict(data: dict) -> List[MeasurementResult]:
+        """Return results stored by to_dict.
+
+        The results do not have discrete loads, as rounding depends
+        on the search config, which may differ from the exporting one.
+
+        :param data: Results as returned by to_dict.
+        :type data: dict
+        :returns: The results, in the original order.
+        :rtype: List[MeasurementResult]
+        """
+        return [MeasurementResult(**item) for item in data["results"]]
 
     def get_relevant_bounds(self, target: TargetSpec) -> RelevantBounds:
         """Return None or a valid trimmed stat, for the two relevant bounds.
@@ -101,8 +188,8 @@ class MeasurementDatabase:
         If some value is not available, None is returned instead.
         The returned stats are trimmed to the argument target.
 
-        The implementation starts from low loads
-        and the search stops at lowest upper bound,
+        The relevant upper bound is the lowest load in the index,
+        the relevant lower bound is found by bisection below it,
         thus conforming to the conservative definition of relevant bounds.
 
         :param target: Target to classify loads when finding bounds.
@@ -110,17 +197,42 @@ class MeasurementDatabase:
         :returns: Relevant lower bound, relevant upper bound.
         :rtype: RelevantBounds
         """
+        position = self.target_to_position[target]
+        if position == len(self.results) and target in self.target_to_bounds:
+            return self.target_to_bounds[target]
+        if position < len(self.results):
+            changed = self.results[position:]
+            self._classify(target, {result.intended_load for result in changed})
+            self.target_to_position[target] = len(self.results)
+        lowers = self.target_to_lowers[target]
+        uppers = self.target_to_uppers[target]
         lower_bound, upper_bound = None, None
-        for load_stats in self.load_to_stats.values():
-            opt, pes = load_stats.estimates(target)
-            if opt != pes:
-                continue
-            if not opt:
-                upper_bound = load_stats
-                break
-            lower_bound = load_stats
-        if lower_bound:
-            lower_bound = TrimmedStat.for_target(lower_bound, target)
-        if upper_bound:
+        index = len(lowers)
+        if uppers:
+            upper_bound = self.float_to_stats[uppers[0]]
             upper_bound = TrimmedStat.for_target(upper_bound, target)
-        return RelevantBounds(clo=lower_bound, chi=upper_bound)
+            index = bisect_left(lowers, uppers[0])
+        if index:
+            lower_bound = self.float_to_stats[lowers[index - 1]]
+            lower_bound = TrimmedStat.for_target(lower_bound, target)
+        bounds = RelevantBounds(clo=lower_bound, chi=upper_bound)
+        self.target_to_bounds[target] = bounds
+        return bounds
+
+
+def _set_membership(loads: List[float], load: float, member: bool) -> None:
+    """Insert the load to or remove it from the sorted list, as needed.
+
+    :param loads: Sorted list of loads to edit in place.
+    :param load: The load to insert or remove.
+    :param member: Whether the load should be in the list.
+    :type loads: List[float]
+    :type load: float
+    :type member: bool
+    """
+    index = bisect_left(loads, load)
+    present = index < len(loads) and loads[index] == load
+    if member and not present:
+        loads.insert(index, load)
+    elif present and not member:
+        del loads[index]
@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -17,7 +17,7 @@ import logging
 import time
 
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from .candidate import Candidate
 from .config import Config
@@ -30,10 +30,12 @@ from .limit_handler import LimitHandler
 from .load_rounding import LoadRounding
 from .measurement_database import MeasurementDatabase
 from .pep3140 import Pep3140Dict
+from .resume_state import ResumeState
 from .search_goal import SearchGoal
 from .selector import Selector
 from .target_scaling import TargetScaling
-from .trial_measurement import AbstractMeasurer
+from .target_spec import TargetSpec
+from .trial_measurement import AbstractMeasurer, MeasurementResult
 
 
 @dataclass
@@ -85,6 +87,15 @@ class MultipleLossRatioSearch:
     Conservative behavior (single long trial, zero exceed ratio)
     is still available using corresponding goal definitions.
 
+    Next improvement is measuring candidates of different search goals
+    at the same time, if the measurer can perform several trials at once
+    (see AbstractMeasurer.parallelism and MeasurerPool).
+
+    Similarly, if the measurer can report counters during a trial
+    (see AbstractMeasurer.measure_with_stop), main loop trials
+    are stopped as soon as their loss count fails every target.
+    Initial trials are never stopped, their forwarding rate is needed.
+
     Final improvement is exiting early if the minimal load
     is not a valid lower bound (at final duration)
     and also exiting if the overall search duration is too long.
@@ -121,21 +132,51 @@ class MultipleLossRatioSearch:
     """Storage for (stats of) measurement results so far."""
     stop_time: float = secondary_field()
     """Monotonic time value at which the search should end with failure."""
+    resume_state: ResumeState = secondary_field()
+    """Imported results and whether the measurer has interrupted the search."""
 
     def search(
         self,
         measurer: AbstractMeasurer,
         debug: Optional[Callable[[str], None]] = None,
+        warm_start: Optional[dict] = None,
+        resume: Optional[dict] = None,
     ) -> Pep3140Dict[SearchGoal, GoalResult]:
         """Perform initial trials, create state object, proceed with main loop.
 
         Stateful arguments (measurer and debug) are stored.
         Derived objects are constructed from config.
 
+        The results measured by this search can be exported
+        by self.export_results(), also after the search has failed.
+        If it failed because the measurer raised (e.g. traffic generator
+        crashed), self.resume_state.interrupted is true, and the export
+        is suitable for resuming. Other failures (e.g. min load being
+        an upper bound) are verdicts of the search, resuming would only
+        repeat them.
+
+        If resume data (exported by a search with the same config
+        on the same SUT) is given, the results are added to the database
+        (after the warmup trial), so they count as if they were measured
+        by this search. They are not exported again.
+        Initial trials are still performed, they are short
+        and they verify the SUT still behaves as before.
+
+        If warm start data (exported by a search with the same goals)
+        is given, the relevant bounds it has for final targets
+        are used as initial bounds, instead of performing initial trials.
+        The data is only used to select the initial loads,
+        the bounds are verified by new trials as usual.
+        If the data does not have any usable bound, initial trials are done.
+
         :param measurer: Measurement provider to use by this search object.
         :param debug: Callable to optionally use instead of logging.debug().
+        :param warm_start: Exported database of a prior search to start from.
+        :param resume: Exported database of an interrupted search to continue.
         :type measurer: AbstractMeasurer
         :type debug: Optional[Callable[[str], None]]
+        :type warm_start: Optional[dict]
+        :type resume: Optional[dict]
         :returns: Structure containing conditional throughputs and other stats,
             one for each search goal. If a value is None it means there is
             no lower bound (min load turned out to be an upper bound).
@@ -162,8 +203,26 @@ class MultipleLossRatioSearch:
         )
         self.database = MeasurementDatabase(self.scaling.targets)
         self.stop_time = time.monotonic() + self.config.search_duration_max
-        result0, result1 = self.run_initial_trials()
-        self.main_loop(result0.discrete_load, result1.discrete_load)
+        self.resume_state = ResumeState()
+        target_to_loads = None
+        if warm_start is not None:
+            target_to_loads = self.warm_start_loads(warm_start)
+        self.run_warmup_trial()
+        if resume is not None:
+            self.resume_state.imported = self.import_results(resume)
+            imported = self.resume_state.imported
+            self.debug(f"Resuming with {len(imported)} prior results.")
+            for result in imported:
+                self.database.add(result)
+        if target_to_loads:
+            lower_loads = [loads[0] for loads in target_to_loads.values()]
+            upper_loads = [loads[1] for loads in target_to_loads.values()]
+            self.main_loop(
+                min(lower_loads), max(upper_loads), target_to_loads
+            )
+        else:
+            result0, result1 = self.run_initial_trials()
+            self.main_loop(result0.discrete_load, result1.discrete_load)
         ret_dict = Pep3140Dict()
         for goal in self.config.goals:
             target = self.scaling.goal_to_final_target[goal]
@@ -171,35 +230,272 @@ class MultipleLossRatioSearch:
             ret_dict[goal] = GoalResult.from_bounds(bounds=bounds)
         return ret_dict
 
-    def measure(self, duration: float, load: DiscreteLoad) -> DiscreteResult:
+    def measure(
+        self, duration: float, load: DiscreteLoad, early_stop: bool = True
+    ) -> DiscreteResult:
         """Call measurer and put the result to appropriate form in database.
 
         Also check the argument types and load roundness,
         and return the result to the caller.
 
+        If the measurer supports it, the trial is stopped early
+        when the loss count so far is already too high for any target,
+        see should_stop. The shortened trial is recorded
+        as completed, see complete_stopped.
+
         :param duration: Intended duration for the trial measurement.
         :param load: Intended load for the trial measurement:
+        :param early_stop: If false, the trial is never stopped early.
         :type duration: float
         :type load: DiscreteLoad
+        :type early_stop: bool
         :returns: The trial results.
         :rtype: DiscreteResult
         :raises RuntimeError: If an argument doed not have the required type.
         """
+        self._check_trial_inputs(duration=duration, load=load)
+        self.debug(f"Measuring at d={duration},il={int(load)}")
+        stopped = []
+
+        def should_stop(partial: MeasurementResult) -> bool:
+            """Return whether to stop the trial, remember the decision.
+
+            :param partial: Result of the trial so far.
+            :type partial: MeasurementResult
+            :returns: True if the trial should be stopped now.
+            :rtype: bool
+            """
+            if early_stop and self.should_stop(partial, duration):
+                stopped.append(partial)
+                return True
+            return False
+
+        try:
+            result = self.measurer.measure_with_stop(
+                intended_duration=duration,
+                intended_load=float(load),
+                should_stop=should_stop,
+            )
+        except BaseException:
+            self.resume_state.interrupted = True
+            raise
+        if stopped:
+            self.debug(f"Stopped early after {result.offered_duration}s")
+            result = self.complete_stopped(result, duration)
+        self.debug(f"Measured lr={result.loss_ratio}")
+        result = DiscreteResult.with_load(result=result, load=load)
+        self.database.add(result)
+        return result
+
+    def measure_many(
+        self, inputs: Sequence[Tuple[float, DiscreteLoad]]
+    ) -> List[DiscreteResult]:
+        """Call measurer for several trials at once, put results to database.
+
+        The results are added to database in the order of inputs,
+        regardless of which trial finished first,
+        so the search stays deterministic.
+
+        :param inputs: Intended duration and load for each trial.
+        :type inputs: Sequence[Tuple[float, DiscreteLoad]]
+        :returns: The trial results, in the order of inputs.
+        :rtype: List[DiscreteResult]
+        :raises RuntimeError: If an argument doed not have the required type.
+        """
+        for duration, load in inputs:
+            self._check_trial_inputs(duration=duration, load=load)
+            self.debug(f"Measuring at d={duration},il={int(load)}")
+        try:
+            results = self.measurer.measure_many(
+                [(duration, float(load)) for duration, load in inputs]
+            )
+        except BaseException:
+            self.resume_state.interrupted = True
+            raise
+        discrete_results = []
+        for (_, load), result in zip(inputs, results):
+            self.debug(f"Measured lr={result.loss_ratio} at il={int(load)}")
+            result = DiscreteResult.with_load(result=result, load=load)
+            self.database.add(result)
+            discrete_results.append(result)
+        return discrete_results
+
+    def should_stop(self, partial: MeasurementResult, duration: float) -> bool:
+        """Return whether the trial already fails even the most lenient target.
+
+        Loss count can only grow, so if the loss count so far is larger
+        than the largest target loss ratio times the count intended
+        for the whole trial, the whole trial would fail every target,
+        regardless of the rest of the trial.
+
+        The count intended for the whole trial is extrapolated
+        from the partial result, so the units do not matter.
+
+        :param partial: Result of the trial so far, intended duration
+            being the time elapsed so far.
+        :param duration: Intended duration of the whole trial [s].
+        :type partial: MeasurementResult
+        :type duration: float
+        :returns: True if the rest of the trial cannot change its outcome.
+        :rtype: bool
+        """
+        if partial.intended_duration <= 0.0:
+            return False
+        ratio = max(target.loss_ratio for target in self.scaling.targets)
+        full_count = partial.intended_count * (
+            duration / partial.intended_duration
+        )
+        return partial.loss_count > ratio * full_count
+
+    @staticmethod
+    def complete_stopped(
+        result: MeasurementResult, duration: float
+    ) -> MeasurementResult:
+        """Return result of a stopped trial, completed to the full duration.
+
+        The rest of the trial is assumed to be lossless and on time,
+        so the loss ratio of the completed result is the lowest one
+        the whole trial could have achieved. As the trial was stopped
+        only when even that is above all target loss ratios,
+        the classification is the same as if the trial was completed.
+
+        Durations are extended to the full one (keeping any overhead),
+        so the trial counts towards duration sums as the whole trial would.
+
+        :param result: Result of the stopped trial, as returned by measurer.
+        :param duration: Intended duration of the whole trial [s].
+        :type result: MeasurementResult
+        :type duration: float
+        :returns: Equivalent result of the whole trial.
+        :rtype: MeasurementResult
+        """
+        achieved = result.offered_duration
+        if achieved <= 0.0 or achieved >= duration:
+            return result
+        missing = int(result.intended_count * (duration / achieved - 1.0))
+        overhead = max(0.0, result.duration_with_overheads - achieved)
+        return MeasurementResult(
+            intended_duration=duration,
+            intended_load=result.intended_load,
+            offered_count=result.offered_count + missing,
+            loss_count=result.loss_count,
+            offered_duration=duration,
+            duration_with_overheads=duration + overhead,
+            intended_count=result.intended_count + missing,
+        )
+
+    def import_results(self, data: dict) -> List[DiscreteResult]:
+        """Return exported results as discrete results for this search.
+
+        Results with intended load outside of min and max load are skipped.
+        Results with load not round for the current rounding
+        (e.g. the goal widths differ) are also skipped,
+        as moving them to a round load would make the load
+        inconsistent with the counts measured at the original load.
+
+        :param data: Database exported by to_dict.
+        :type data: dict
+        :returns: Results usable with this search database.
+        :rtype: List[DiscreteResult]
+        """
+        discrete_results = []
+        for result in MeasurementDatabase.results_from_dict(data):
+            if not (
+                self.config.min_load <= result.intended_load
+                <= self.config.max_load
+            ):
+                continue
+            load = self.from_float(result.intended_load)
+            if not load.is_round:
+                continue
+            result = DiscreteResult.with_load(result=result, load=load)
+            discrete_results.append(result)
+        return discrete_results
+
+    def export_results(self) -> dict:
+        """Return results measured by this search, in to_dict form.
+
+        Results imported from resume data are not included,
+        so they cannot be carried over from one search to the next.
+
+        :returns: Results in a form suitable for import_results.
+        :rtype: dict
+        """
+        imported = {id(result) for result in self.resume_state.imported}
+        data = self.database.to_dict()
+        data["results"] = [
+            item
+            for result, item in zip(self.database.results, data["results"])
+            if id(result) not in imported
+        ]
+        return data
+
+    def warm_start_loads(
+        self, data: dict
+    ) -> Optional[Dict[TargetSpec, Tuple[DiscreteLoad, DiscreteLoad]]]:
+        """Return initial lower and upper load for each final target.
+
+        The exported results are put into a temporary database,
+        and its relevant bounds are used. If a bound is missing,
+        min load or max load is used instead.
+
+        :param data: Database exported by to_dict.
+        :type data: dict
+        :returns: Mapping from final target to initial loads,
+            or None if no final target has any relevant bound.
+        :rtype: Optional[Dict[TargetSpec, Tuple[DiscreteLoad, DiscreteLoad]]]
+        """
+        prior = MeasurementDatabase(self.scaling.targets)
+        for result in self.import_results(data):
+            prior.add(result)
+        target_to_loads, usable = {}, False
+        for target in self.scaling.goal_to_final_target.values():
+            bounds = prior.get_relevant_bounds(target=target)
+            lower, upper = bounds.clo, bounds.chi
+            usable = usable or bool(lower or upper)
+            lower = lower.rounded_down() if lower else None
+            upper = upper.rounded_down() if upper else None
+            lower = lower or self.limit_handler.min_load
+            upper = upper or self.limit_handler.max_load
+            self.debug(f"Warm start loads for {target}: {lower}, {upper}")
+            target_to_loads[target] = (lower, upper)
+        if not usable:
+            self.debug("No prior bounds, doing initial trials.")
+            return None
+        return target_to_loads
+
+    @staticmethod
+    def _check_trial_inputs(duration: float, load: DiscreteLoad) -> None:
+        """Check the argument types and load roundness.
+
+        :param duration: Intended duration for the trial measurement.
+        :param load: Intended load for the trial measurement:
+        :type duration: float
+        :type load: DiscreteLoad
+        :raises RuntimeError: If an argument doed not have the required type.
+        """
         if not isinstance(duration, float):
             raise RuntimeError(f"Duration has to be float: {duration!r}")
         if not isinstance(load, DiscreteLoad):
             raise RuntimeError(f"Load has to be discrete: {load!r}")
         if not load.is_round:
             raise RuntimeError(f"Told to measure unrounded: {load!r}")
-        self.debug(f"Measuring at d={duration},il={int(load)}")
-        result = self.measurer.measure(
-            intended_duration=duration,
-            intended_load=float(load),
+
+    def run_warmup_trial(self) -> None:
+        """Perform warmup trial (if configured), then reset the database.
+
+        Warmup should not affect the real results, so it is measured
+        at max load and the result is forgotten.
+        """
+        if not self.config.warmup_duration:
+            return
+        self.debug("Warmup trial.")
+        self.measure(
+            self.config.warmup_duration,
+            self.limit_handler.max_load,
+            early_stop=False,
         )
-        self.debug(f"Measured lr={result.loss_ratio}")
-        result = DiscreteResult.with_load(result=result, load=load)
-        self.database.add(result)
-        return result
+        self.database = MeasurementDatabase(self.scaling.targets)
 
     def run_initial_trials(self) -> Tuple[DiscreteResult, DiscreteResult]:
         """Perform trials to get enough data to start the selectors.
@@ -214,8 +510,10 @@ class MultipleLossRatioSearch:
         (forwarding rate is only a good hint for zero loss ratio load).
         The correction is conservative (all increase in load turns to losses).
 
-        Also, warmup trial (if configured) is performed,
-        all other trials are added to the database.
+        All trials are added to the database,
+        warmup trial (if configured) is expected to be done already.
+        The trials are not stopped early, as the forwarding rate
+        of a completed stopped trial would not be a good hint.
 
         This could return the initial width, but from implementation perspective
         it is easier to return two measurements (or the same one twice) here
@@ -237,13 +535,8 @@ class MultipleLossRatioSearch:
             if not width or width < target.discrete_width:
                 width = target.discrete_width
         self.debug(f"Init ratio {ratio} duration {duration} width {width}")
-        if self.config.warmup_duration:
-            self.debug("Warmup trial.")
-            self.measure(self.config.warmup_duration, max_load)
-            # Warmup should not affect the real results, reset the database.
-            self.database = MeasurementDatabase(self.scaling.targets)
         self.debug(f"First trial at max rate: {max_load}")
-        result0 = self.measure(duration, max_load)
+        result0 = self.measure(duration, max_load, early_stop=False)
         rfr = result0.relative_forwarding_rate
         corrected_rfr = (self.from_float(rfr) / (1.0 - ratio)).rounded_down()
         if corrected_rfr >= max_load:
@@ -251,7 +544,7 @@ class MultipleLossRatioSearch:
             return result0, result0
         mrr = self.limit_handler.handle(corrected_rfr, width, None, max_load)
         self.debug(f"Second trial at (corrected) mrr: {mrr}")
-        result1 = self.measure(duration, mrr)
+        result1 = self.measure(duration, mrr, early_stop=False)
         # Attempt to get narrower width.
         result_ratio = result1.loss_ratio
         if result_ratio > ratio:
@@ -265,10 +558,17 @@ class MultipleLossRatioSearch:
             self.debug("Close enough, measuring at mrr2 is not needed.")
             return result1, result1
         self.debug(f"Third trial at (corrected) mrr2: {mrr2}")
-        result2 = self.measure(duration, mrr2)
+        result2 = self.measure(duration, mrr2, early_stop=False)
         return result1, result2
 
-    def main_loop(self, load0: DiscreteLoad, load1: DiscreteLoad) -> None:
+    def main_loop(
+        self,
+        load0: DiscreteLoad,
+        load1: DiscreteLoad,
+        target_to_loads: Optional[
+            Dict[TargetSpec, Tuple[DiscreteLoad, DiscreteLoad]]
+        ] = None,
+    ) -> None:
         """Initialize selectors and keep measuring the winning candidate.
 
         Selectors are created, the two input loads are useful starting points.
@@ -279,13 +579,26 @@ class MultipleLossRatioSearch:
         Winner is selected according to ordering defined in Candidate class.
         In case of a tie, selectors for earlier goals are preferred.
 
+        If the measurer can perform several trials at once,
+        several winners (nominated by different selectors) are measured
+        together, see select_winners. The results are added
+        to the database (and winners informed) in the winning order.
+
         As a selector is only allowed to update current width as the winner,
         the update is done here explicitly.
 
+        When warm starting, each selector gets its own initial loads
+        (for its final target), the two loads then only define
+        the initial global width.
+
         :param load0: Discrete load of one of results from run_initial_trials.
         :param load1: Discrete load of other of results from run_initial_trials.
+        :param target_to_loads: Optional initial lower and upper load
+            for each final target, as computed by warm_start_loads.
         :type load0: DiscreteLoad
         :type load1: DiscreteLoad
+        :type target_to_loads: Optional[
+            Dict[TargetSpec, Tuple[DiscreteLoad, DiscreteLoad]]]
         :raises RuntimeError: If the search takes too long,
             or if min load becomes an upper bound for any search goal
         """
@@ -294,32 +607,80 @@ class MultipleLossRatioSearch:
         global_width = GlobalWidth.from_loads(load0, load1)
         selectors = []
         for target in self.scaling.goal_to_final_target.values():
+            lower, upper = load0, load1
+            if target_to_loads:
+                lower, upper = target_to_loads[target]
             selector = Selector(
                 final_target=target,
                 global_width=global_width,
-                initial_lower_load=load0,
-                initial_upper_load=load1,
+                initial_lower_load=lower,
+                initial_upper_load=upper,
                 database=self.database,
                 handler=self.limit_handler,
                 debug=self.debug,
             )
             selectors.append(selector)
+        parallelism = self.measurer.parallelism
         while time.monotonic() < self.stop_time:
-            winner = Candidate()
-            for selector in selectors:
-                # Order of arguments is important
-                # when two targets nominate the same candidate.
-                winner = min(Candidate.nomination_from(selector), winner)
-            if not winner:
+            candidates = [
+                Candidate.nomination_from(selector) for selector in selectors
+            ]
+            winners = self.select_winners(candidates, parallelism)
+            if not winners:
                 break
             # We do not check duration versus stop_time here,
             # as some measurers can be unpredictably faster
             # than their intended duration suggests.
-            self.measure(duration=winner.duration, load=winner.load)
+            if len(winners) == 1:
+                winner = winners[0]
+                self.measure(duration=winner.duration, load=winner.load)
+            else:
+                self.measure_many(
+                    [(winner.duration, winner.load) for winner in winners]
+                )
             # Delayed updates.
-            if winner.width:
-                global_width.width = winner.width
-            winner.won()
+            for winner in winners:
+                if winner.width:
+                    global_width.width = winner.width
+                winner.won()
         else:
             raise RuntimeError("Optimized search takes too long.")
         self.debug("Search done.")
+
+    @staticmethod
+    def select_winners(
+        candidates: Sequence[Candidate], count: int
+    ) -> List[Candidate]:
+        """Return up to count best candidates which do not conflict.
+
+        Winners are chosen one by one, each as the least (see Candidate)
+        of the remaining candidates, earlier candidates win ties.
+        For count one, this is the classic single winner.
+
+        A candidate conflicts with an earlier winner if it has the same load,
+        as the result of the earlier winner can make it not worth measuring.
+        Conflicting candidates are skipped, they are probably nominated
+        again (or not) in the next round, based on the updated database.
+
+        :param candidates: Nominations from selectors, in goal order.
+        :param count: Maximal number of winners to return.
+        :type candidates: Sequence[Candidate]
+        :type count: int
+        :returns: Winners in the order they won, empty if none.
+        :rtype: List[Candidate]
+        """
+        winners = []
+        remaining = list(candidates)
+        while remaining and len(winners) < count:
+            winner = Candidate()
+            for candidate in remaining:
+                # Order of arguments is important
+                # when two targets nominate the same candidate.
+                winner = min(candidate, winner)
+            if not winner:
+                break
+            remaining = [cand for cand in remaining if cand is not winner]
+            if any(winner.load == other.load for other in winners):
+                continue
+            winners.append(winner)
+        return winners
@@ -0,0 +1,33 @@
+# Copyright (c) 2023 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module defining ResumeState class."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from .discrete_result import DiscreteResult
+
+
+@dataclass
+class ResumeState:
+    """What a search needs to know for exporting data to resume from.
+
+    Results imported from resume data are not exported again,
+    and only a search interrupted by the measurer is worth resuming.
+    """
+
+    imported: List[DiscreteResult] = field(default_factory=list)
+    """Results imported from resume data, not measured by this search."""
+    interrupted: bool = False
+    """Whether the search ended because a call to the measurer raised."""
@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -18,6 +18,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .dataclass import secondary_field
 from .discrete_width import DiscreteWidth
 
 
@@ -58,9 +59,42 @@ class TargetSpec:
     """Copied from goal. If true and min load is not an upper bound, raise."""
     preceding: Optional[TargetSpec] = field(repr=False)
     """Reference to next coarser target (if any) belonging to the same goal."""
+    # Fields below are computed from data above.
+    _hash_value: int = secondary_field()
+    """Hash value computed at instance creation, see __post_init__."""
 
     # No conversions or validations, as this is an internal structure.
 
+    def __post_init__(self) -> None:
+        """Compute the hash value once, store it in a secondary field.
+
+        Targets are keys in many mappings (stats, database index),
+        and the generated hash would be computed recursively
+        (through discrete width and the chain of preceding targets)
+        on every lookup.
+        """
+        hash_value = hash(
+            (
+                self.loss_ratio,
+                self.exceed_ratio,
+                self.discrete_width,
+                self.trial_duration,
+                self.duration_sum,
+                self.expansion_coefficient,
+                self.fail_fast,
+                self.preceding,
+            )
+        )
+        object.__setattr__(self, "_hash_value", hash_value)
+
+    def __hash__(self) -> int:
+        """Return the hash value computed at instance creation.
+
+        :returns: Hash value consistent with the generated equality.
+        :rtype: int
+        """
+        return self._hash_value
+
     def __str__(self) -> str:
         """Convert into a short human-readable string.
 
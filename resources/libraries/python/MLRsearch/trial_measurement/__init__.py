@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -17,3 +17,4 @@ __init__ file for Python package "trial_measurement".
 
 from .abstract_measurer import AbstractMeasurer
 from .measurement_result import MeasurementResult
+from .measurer_pool import MeasurerPool
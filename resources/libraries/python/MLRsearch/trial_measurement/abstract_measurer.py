@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -14,6 +14,7 @@
 """Module defining AbstractMeasurer class."""
 
 from abc import ABCMeta, abstractmethod
+from typing import Callable, List, Sequence, Tuple
 
 from .measurement_result import MeasurementResult as Result
 
@@ -31,8 +32,77 @@ class AbstractMeasurer(metaclass=ABCMeta):
 
     The current code uses language from packet forwarding,
     docstring sometimes mention transactions as an alternative view.
+
+    Implementations able to perform several independent trials at once
+    (e.g. using multiple traffic generators) should override
+    parallelism and measure_many. The default is one trial at a time.
+
+    Implementations able to read counters while the traffic is running
+    should override measure_with_stop, so the search can stop trials
+    which are already known to fail all targets.
     """
 
+    @property
+    def parallelism(self) -> int:
+        """Return how many trials measure_many can perform at once.
+
+        :returns: Maximal number of inputs for one measure_many call.
+        :rtype: int
+        """
+        return 1
+
+    def measure_many(
+        self, inputs: Sequence[Tuple[float, float]]
+    ) -> List[Result]:
+        """Perform independent trial measurements, return results in order.
+
+        The default implementation performs the trials one by one.
+
+        :param inputs: Intended duration [s] and intended load [tps]
+            for each trial, at most parallelism of them.
+        :type inputs: Sequence[Tuple[float, float]]
+        :returns: Results of the measurements, in the order of inputs.
+        :rtype: List[measurement_result.MeasurementResult]
+        """
+        return [
+            self.measure(intended_duration=duration, intended_load=load)
+            for duration, load in inputs
+        ]
+
+    def measure_with_stop(
+        self,
+        intended_duration: float,
+        intended_load: float,
+        should_stop: Callable[[Result], bool],
+    ) -> Result:
+        """Perform trial measurement, stop early if told to, return result.
+
+        Implementations should periodically call should_stop
+        with a partial result describing the trial so far
+        (intended duration being the time elapsed so far,
+        intended count being the count intended so far),
+        and stop the traffic as soon as it returns true.
+
+        The returned result describes the trial as measured,
+        intended duration is the full one (as in arguments),
+        but offered duration and counts are those of the shortened trial.
+
+        The default implementation never stops early, it calls measure.
+
+        :param intended_duration: Intended trial duration [s].
+        :param intended_load: Intended rate of transactions (packets) [tps].
+        :param should_stop: Callable telling whether to stop the trial now.
+        :type intended_duration: float
+        :type intended_load: float
+        :type should_stop: Callable[[Result], bool]
+        :returns: Structure detailing the result of the measurement.
+        :rtype: measurement_result.MeasurementResult
+        """
+        del should_stop  # This measurer cannot stop a trial early.
+        return self.measure(
+            intended_duration=intended_duration, intended_load=intended_load
+        )
+
     @abstractmethod
     def measure(self, intended_duration: float, intended_load: float) -> Result:
         """Perform trial measurement and return the result.
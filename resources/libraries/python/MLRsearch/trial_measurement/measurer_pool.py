@@ -0,0 +1,101 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module defining MeasurerPool class."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from .abstract_measurer import AbstractMeasurer
+from .measurement_result import MeasurementResult as Result
+
+
+@dataclass
+class MeasurerPool(AbstractMeasurer):
+    """Measurer dispatching independent trials to several measurers at once.
+
+    Each member measurer is expected to drive its own (isolated) SUT
+    instance or port pair, e.g. a separate traffic generator,
+    so trials performed at the same time do not affect each other.
+
+    Trials are performed in threads, as measurers typically spend
+    the trial duration waiting for an external traffic generator.
+    Each member measurer performs at most one trial at a time.
+    """
+
+    measurers: Sequence[AbstractMeasurer]
+    """Measurers to use, the first one is used for single trials."""
+
+    def __post_init__(self) -> None:
+        """Convert measurers to a tuple and check it is not empty.
+
+        :raises ValueError: If there are no measurers.
+        """
+        self.measurers = tuple(self.measurers)
+        if not self.measurers:
+            raise ValueError("Measurer pool needs at least one measurer.")
+
+    @property
+    def parallelism(self) -> int:
+        """Return the number of member measurers.
+
+        :returns: Maximal number of inputs for one measure_many call.
+        :rtype: int
+        """
+        return len(self.measurers)
+
+    def measure(self, intended_duration: float, intended_load: float) -> Result:
+        """Perform one trial measurement using the first measurer.
+
+        :param intended_duration: Intended trial duration [s].
+        :param intended_load: Intended rate of transactions (packets) [tps].
+        :type intended_duration: float
+        :type intended_load: float
+        :returns: Structure detailing the result of the measurement.
+        :rtype: measurement_result.MeasurementResult
+        """
+        return self.measurers[0].measure(
+            intended_duration=intended_duration,
+            intended_load=intended_load,
+        )
+
+    def measure_many(
+        self, inputs: Sequence[Tuple[float, float]]
+    ) -> List[Result]:
+        """Perform trials concurrently, one per measurer, return in order.
+
+        If any trial raises, the exception is re-raised
+        (after all other trials have finished).
+
+        :param inputs: Intended duration [s] and intended load [tps]
+            for each trial, at most parallelism of them.
+        :type inputs: Sequence[Tuple[float, float]]
+        :returns: Results of the measurements, in the order of inputs.
+        :rtype: List[measurement_result.MeasurementResult]
+        :raises ValueError: If there are more inputs than measurers.
+        """
+        if len(inputs) > len(self.measurers):
+            raise ValueError(f"Too many trials for the pool: {inputs!r}")
+        if len(inputs) < 2:
+            return super().measure_many(inputs)
+        with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+            futures = [
+                executor.submit(
+                    measurer.measure,
+                    intended_duration=duration,
+                    intended_load=load,
+                )
+                for measurer, (duration, load) in zip(self.measurers, inputs)
+            ]
+        return [future.result() for future in futures]
@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -19,10 +19,10 @@ TODO: Separate optimizations specific to PLRsearch and distribute the rest
       as a standalone package so other projects may reuse.
 """
 
-import copy
 import traceback
 
 import dill
+import numpy
 
 from numpy import random
 
@@ -64,6 +64,108 @@ def try_estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
         raise
 
 
+def try_serve_estimates(
+    communication_pipe, scale_coeff=8.0, trace_enabled=False
+):
+    """Call serve_estimates but catch any exception and send traceback.
+
+    :param communication_pipe: Endpoint for communication with parent process.
+    :param scale_coeff: Float number to tweak convergence speed with.
+    :param trace_enabled: Whether to emit trace level debugs.
+    :type communication_pipe: multiprocessing.Connection
+    :type scale_coeff: float
+    :type trace_enabled: bool
+    :raises BaseException: Anything raised by interpreter or serve_estimates.
+    """
+    try:
+        serve_estimates(communication_pipe, scale_coeff, trace_enabled)
+    except BaseException:
+        traceback_string = traceback.format_exc()
+        communication_pipe.send(traceback_string)
+        raise
+
+
+def serve_estimates(communication_pipe, scale_coeff=8.0, trace_enabled=False):
+    """Perform estimate_nd computations repeatedly, keeping state in-process.
+
+    This is a long-lived variant of estimate_nd, so that a worker process
+    can serve all trials of a search, instead of starting one per trial.
+    The trial results and the focus tracker stay in the worker process,
+    only the new trial results are received for each computation.
+
+    The first input object (received from pipe) is a 4-tuple of:
+    - dimension: Integer, number of parameters to consider.
+    - dilled_function: Function (serialized using dill), which:
+    - - Takes trace function, list of trial results and the dimension
+        number of float parameters from (-1, 1).
+    - - Returns float 2-tuple of dependent value and parameter log-likelihood.
+    - param_focus_tracker: VectorStatTracker to use for initial focus.
+    - batch_size: Maximal number of samples to draw at once, or zero.
+      If nonzero, the function gets numpy arrays of parameters
+      (one array per dimension) and returns arrays of values
+      and log-likelihoods.
+
+    Then, each computation starts on receiving a 2-tuple of:
+    - new_results: List of trial results to append to the ones received before.
+    - max_samples: None or a limit for samples to use.
+
+    The computation stops when another item (stop object) appears,
+    the stop object is consumed and the same output object
+    as in estimate_nd is sent. The focus tracker is also kept
+    to focus the next computation.
+
+    Receiving None instead of a computation request ends the function.
+
+    :param communication_pipe: Endpoint for communication with parent process.
+    :param scale_coeff: Float number to tweak convergence speed with.
+    :param trace_enabled: Whether trace list should be populated at all.
+    :type communication_pipe: multiprocessing.Connection
+    :type scale_coeff: float
+    :type trace_enabled: bool
+    """
+    (
+        dimension,
+        dilled_function,
+        param_focus_tracker,
+        batch_size,
+    ) = communication_pipe.recv()
+    function_with_results = dill.loads(dilled_function)
+    trial_result_list = []
+
+    def value_logweight_function(trace, *sample_point):
+        """Call the received function with trial results received so far.
+
+        :param trace: Multiprocessing-safe logging function (closure).
+        :param sample_point: The dimensionless parameters.
+        :type trace: function (str, object) -> None
+        :type sample_point: Tuple[float, ...]
+        :returns: Value and log-likelihood (or arrays of them).
+        :rtype: 2-tuple of float or 2-tuple of numpy.ndarray
+        """
+        return function_with_results(trace, trial_result_list, *sample_point)
+
+    while 1:
+        request = communication_pipe.recv()
+        if request is None:
+            return
+        new_results, max_samples = request
+        trial_result_list.extend(new_results)
+        result = _estimate(
+            communication_pipe,
+            dimension,
+            value_logweight_function,
+            param_focus_tracker,
+            max_samples,
+            scale_coeff,
+            trace_enabled,
+            batch_size,
+        )
+        param_focus_tracker = result[1]
+        # Consume the stop object (wait for it if max_samples was reached).
+        communication_pipe.recv()
+        communication_pipe.send(result)
+
+
 def generate_sample(averages, covariance_matrix, dimension, scale_coeff):
     """Generate next sample for estimate_nd.
 
@@ -81,10 +183,7 @@ def generate_sample(averages, covariance_matrix, dimension, scale_coeff):
     :returns: The generated sample point.
     :rtype: N-tuple of float
     """
-    covariance_matrix = copy.deepcopy(covariance_matrix)
-    for first in range(dimension):
-        for second in range(dimension):
-            covariance_matrix[first][second] *= scale_coeff
+    covariance_matrix = numpy.array(covariance_matrix) * scale_coeff
     while 1:
         sample_point = random.multivariate_normal(
             averages, covariance_matrix, 1
@@ -98,6 +197,37 @@ def generate_sample(averages, covariance_matrix, dimension, scale_coeff):
             return sample_point
 
 
+def generate_samples(averages, covariance_matrix, scale_coeff, count):
+    """Generate a block of samples for estimate_nd, all from the same focus.
+
+    Samples are drawn in bulk, those falling outside the unit area
+    are discarded, until the requested number of samples is reached.
+
+    :param averages: Coordinates of the focus center.
+    :param covariance_matrix: Matrix controlling the spread around the average.
+    :param scale_coeff: Coefficient to conformally multiply the spread.
+    :param count: Number of sample points to generate.
+    :type averages: Indexable of N floats
+    :type covariance_matrix: Indexable of N indexables of N floats
+    :type scale_coeff: float
+    :type count: int
+    :returns: The generated sample points, one per row.
+    :rtype: numpy.ndarray
+    """
+    covariance_matrix = numpy.array(covariance_matrix) * scale_coeff
+    blocks = []
+    missing = count
+    while missing > 0:
+        block = random.multivariate_normal(
+            averages, covariance_matrix, 2 * missing
+        )
+        # Multivariate Gauss can fall outside (-1, 1) interval
+        block = block[numpy.all(numpy.abs(block) < 1.0, axis=1)][:missing]
+        blocks.append(block)
+        missing -= len(block)
+    return numpy.concatenate(blocks)
+
+
 def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
     """Use Bayesian inference from control queue, put result to result queue.
 
@@ -189,8 +319,6 @@ def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
     :raises numpy.linalg.LinAlgError: If the focus shape gets singular
         (due to rounding errors). Try changing scale_coeff.
     """
-    debug_list = []
-    trace_list = []
     # Block until input object appears.
     (
         dimension,
@@ -198,6 +326,62 @@ def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
         param_focus_tracker,
         max_samples,
     ) = communication_pipe.recv()
+    value_logweight_function = dill.loads(dilled_function)
+    communication_pipe.send(
+        _estimate(
+            communication_pipe,
+            dimension,
+            value_logweight_function,
+            param_focus_tracker,
+            max_samples,
+            scale_coeff,
+            trace_enabled,
+        )
+    )
+
+
+def _estimate(
+    communication_pipe,
+    dimension,
+    value_logweight_function,
+    param_focus_tracker,
+    max_samples,
+    scale_coeff,
+    trace_enabled,
+    batch_size=0,
+):
+    """Perform the computation until stop object appears, return result.
+
+    See estimate_nd for the description of arguments and of the result.
+    The stop object is not read from the pipe.
+
+    If batch_size is nonzero, samples are processed in blocks,
+    see _add_batch. The block size starts at one and doubles
+    (up to batch_size), so the focus gets updated frequently initially,
+    when it is probably far from the important region.
+
+    :param communication_pipe: Endpoint for communication with parent process.
+    :param dimension: Number of parameters to consider.
+    :param value_logweight_function: Function to integrate.
+    :param param_focus_tracker: Tracker to use for initial focus.
+    :param max_samples: None or a limit for samples to use.
+    :param scale_coeff: Float number to tweak convergence speed with.
+    :param trace_enabled: Whether trace list should be populated at all.
+    :param batch_size: Maximal number of samples to process at once,
+        zero to process them one by one.
+    :type communication_pipe: multiprocessing.Connection
+    :type dimension: int
+    :type value_logweight_function: Callable[..., Tuple[float, float]]
+    :type param_focus_tracker: Optional[stat_trackers.VectorStatTracker]
+    :type max_samples: Optional[int]
+    :type scale_coeff: float
+    :type trace_enabled: bool
+    :type batch_size: int
+    :returns: Value tracker, focus tracker, debug list, trace list, samples.
+    :rtype: tuple
+    """
+    debug_list = []
+    trace_list = []
     debug_list.append(
         f"Called with param_focus_tracker {param_focus_tracker!r}"
     )
@@ -218,7 +402,6 @@ def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
         if trace_enabled:
             trace_list.append(f"{name} {value!r}")
 
-    value_logweight_function = dill.loads(dilled_function)
     samples = 0
     # Importance sampling produces samples of higher weight (important)
     # more frequently, and corrects that by adding weight bonus
@@ -239,6 +422,21 @@ def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
     while not communication_pipe.poll():
         if max_samples and samples >= max_samples:
             break
+        if batch_size:
+            count = min(batch_size, max(1, samples))
+            if max_samples:
+                count = min(count, max_samples - samples)
+            _add_batch(
+                value_logweight_function,
+                trace,
+                count,
+                scale_coeff,
+                param_focus_tracker,
+                value_tracker,
+                param_sampled_tracker,
+            )
+            samples += count
+            continue
         sample_point = generate_sample(
             param_focus_tracker.averages,
             param_focus_tracker.covariance_matrix,
@@ -282,6 +480,67 @@ def estimate_nd(communication_pipe, scale_coeff=8.0, trace_enabled=False):
             ]
         )
     )
-    communication_pipe.send(
-        (value_tracker, param_focus_tracker, debug_list, trace_list, samples)
+    return value_tracker, param_focus_tracker, debug_list, trace_list, samples
+
+
+def _add_batch(
+    value_logweight_function,
+    trace,
+    count,
+    scale_coeff,
+    param_focus_tracker,
+    value_tracker,
+    param_sampled_tracker,
+):
+    """Generate and evaluate a block of samples, update trackers in bulk.
+
+    This is the batched equivalent of one iteration of the loop
+    in _estimate, for many samples at once.
+    All samples of the block are generated from the focus
+    as it was before the block, so rarity of each sample
+    is computed from that focus (which is exactly the distribution
+    the samples come from).
+
+    :param value_logweight_function: Function to integrate,
+        taking and returning numpy arrays.
+    :param trace: Function to add to trace list (if enabled).
+    :param count: Number of samples in the block.
+    :param scale_coeff: Float number to tweak convergence speed with.
+    :param param_focus_tracker: Tracker to focus the samples by, updated.
+    :param value_tracker: Tracker of value posterior, updated.
+    :param param_sampled_tracker: Tracker of sampled parameters, updated.
+    :type value_logweight_function: Callable[..., Tuple[numpy.ndarray, ...]]
+    :type trace: function (str, object) -> None
+    :type count: int
+    :type scale_coeff: float
+    :type param_focus_tracker: stat_trackers.VectorStatTracker
+    :type value_tracker: stat_trackers.ScalarDualStatTracker
+    :type param_sampled_tracker: stat_trackers.VectorStatTracker
+    :raises RuntimeError: If the function returns NaN for any sample.
+    """
+    sample_points = generate_samples(
+        param_focus_tracker.averages,
+        param_focus_tracker.covariance_matrix,
+        scale_coeff,
+        count,
+    )
+    values, log_weights = value_logweight_function(trace, *sample_points.T)
+    trace("values", values)
+    trace("log_weights", log_weights)
+    if numpy.isnan(values).any() or numpy.isnan(log_weights).any():
+        raise RuntimeError(
+            f"NaN from value_logweight_function at samples {sample_points!r}"
+        )
+    # Update focus related statistics.
+    param_distances = (
+        param_focus_tracker.add_many_without_dominance_get_distances(
+            sample_points, log_weights
+        )
     )
+    # The code above looked at weight (not importance).
+    # The code below looks at importance (not weight).
+    log_importances = log_weights + param_distances / 2.0 / scale_coeff
+    trace("log_importances", log_importances)
+    value_tracker.add_many(values, log_importances)
+    # Update sampled statistics.
+    param_sampled_tracker.add_many(sample_points, log_importances)
@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -21,6 +21,7 @@ import time
 from collections import namedtuple
 
 import dill
+import numpy
 
 from scipy.special import erfcx, erfc
 
@@ -28,8 +29,7 @@ from scipy.special import erfcx, erfc
 # then switch to absolute imports within PLRsearch package.
 # Current usage of relative imports is just a short term workaround.
 from . import Integrator
-from . import stat_trackers
-from .log_plus import log_plus, log_minus
+from .log_plus import log_plus, log_minus, log_minus_array
 
 
 class PLRsearch:
@@ -60,6 +60,7 @@ class PLRsearch:
         trial_number_offset=0,
         timeout=7200.0,
         trace_enabled=False,
+        batch_size=256,
     ):
         """Store rate measurer and additional parameters.
 
@@ -77,11 +78,18 @@ class PLRsearch:
             Use this to ensure first iterations have enough time to compute
             reasonable estimates for later trials to use.
         :param timeout: The search ends if it lasts more than this many seconds.
+        :param trace_enabled: Whether integrators should emit trace debugs.
+        :param batch_size: Maximal number of samples the integrators
+            draw and evaluate at once, using array operations.
+            Zero means sample by sample, which is also used
+            when trace is enabled (as only that path traces each sample).
         :type measurer: MLRsearch.AbstractMeasurer
         :type trial_duration_per_trial: float
         :type packet_loss_ratio_target: float
         :type trial_number_offset: int
         :type timeout: float
+        :type trace_enabled: bool
+        :type batch_size: int
         """
         self.measurer = measurer
         self.trial_duration_per_trial = float(trial_duration_per_trial)
@@ -89,6 +97,7 @@ class PLRsearch:
         self.trial_number_offset = int(trial_number_offset)
         self.timeout = float(timeout)
         self.trace_enabled = bool(trace_enabled)
+        self.batch_size = 0 if self.trace_enabled else int(batch_size)
 
     def search(self, min_rate, max_rate):
         """Perform the search, return average and stdev for throughput estimate.
@@ -182,6 +191,30 @@ class PLRsearch:
             f"Started search with min_rate {min_rate!r}, "
             f"max_rate {max_rate!r}"
         )
+        workers = self.start_workers(min_rate, max_rate)
+        try:
+            return self._search_with_workers(
+                min_rate, max_rate, stop_time, workers
+            )
+        finally:
+            for worker in workers:
+                worker.close()
+
+    def _search_with_workers(self, min_rate, max_rate, stop_time, workers):
+        """Perform the trials of the search, see search for details.
+
+        :param min_rate: Avoid measuring at offered loads below this [pps].
+        :param max_rate: Avoid measuring at offered loads above this [pps].
+        :param stop_time: Time (as in time.time) to stop the search at.
+        :param workers: Integrator workers to compute with, as returned
+            by start_workers.
+        :type min_rate: float
+        :type max_rate: float
+        :type stop_time: float
+        :type workers: 2-tuple of _IntegratorWorker
+        :returns: Average and stdev of critical load estimate.
+        :rtype: 2-tuple of float
+        """
         trial_result_list = []
         trial_number = self.trial_number_offset
         focus_trackers = (None, None)
@@ -198,6 +231,7 @@ class PLRsearch:
                 min_rate,
                 max_rate,
                 focus_trackers,
+                workers=workers,
             )
             measurement, average, stdev, avg1, avg2, focus_trackers = results
             # Workaround for unsent packets and other anomalies.
@@ -507,6 +541,349 @@ class PLRsearch:
             trace("log_trial_likelihood", log_trial_likelihood)
         return log_likelihood
 
+    @staticmethod
+    def lfit_stretch_array(load, mrr, spread):
+        """Stretch-based fitting function, elementwise on numpy arrays.
+
+        Array variant of lfit_stretch, arguments are broadcast together.
+        All branches are computed, the one lfit_stretch would take
+        is selected for each element.
+
+        :param load: Offered loads (positive), in packets per second.
+        :param mrr: Values of the mrr parameter.
+        :param spread: Values of the spread parameter.
+        :type load: numpy.ndarray or float
+        :type mrr: numpy.ndarray or float
+        :type spread: numpy.ndarray or float
+        :returns: Logarithms of average number of packets lost per second.
+        :rtype: numpy.ndarray
+        """
+        log_2 = math.log(2)
+        log_3 = math.log(3)
+        log_spread = numpy.log(spread)
+        chi = (load - mrr) / spread
+        chi0 = -mrr / spread
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            big_loss = numpy.log(
+                load - mrr
+                + (numpy.logaddexp(0.0, -chi) - numpy.logaddexp(0.0, chi0))
+                * spread
+            )
+            two_positive = numpy.logaddexp(chi, 2 * chi0 - log_2)
+            two_negative = numpy.logaddexp(chi0, 2 * chi - log_2)
+            crude = log_minus_array(chi, chi0) + log_spread
+            two = log_minus_array(two_positive, two_negative)
+            three_positive = numpy.logaddexp(two_positive, 3 * chi - log_3)
+            three_negative = numpy.logaddexp(two_negative, 3 * chi0 - log_3)
+            three = log_minus_array(three_positive, three_negative)
+            direct = numpy.log(
+                numpy.logaddexp(0.0, chi) - numpy.logaddexp(0.0, chi0)
+            )
+        small_loss = numpy.where(
+            two_positive <= two_negative,
+            crude,
+            numpy.where(two == three, two, direct) + log_spread,
+        )
+        return numpy.where(chi > 0, big_loss, small_loss)
+
+    @staticmethod
+    def lfit_erf_array(load, mrr, spread):
+        """Erf-based fitting function, elementwise on numpy arrays.
+
+        Array variant of lfit_erf, arguments are broadcast together.
+        All branches are computed, the one lfit_erf would take
+        is selected for each element.
+
+        :param load: Offered loads (positive), in packets per second.
+        :param mrr: Values of the mrr parameter.
+        :param spread: Values of the spread parameter.
+        :type load: numpy.ndarray or float
+        :type mrr: numpy.ndarray or float
+        :type spread: numpy.ndarray or float
+        :returns: Logarithms of average number of packets lost per second.
+        :rtype: numpy.ndarray
+        """
+        chi = (mrr - load) / spread
+        chi0 = mrr / spread
+        xerfcx_limit = PLRsearch.xerfcx_limit
+        with numpy.errstate(
+            divide="ignore", invalid="ignore", over="ignore", under="ignore"
+        ):
+            second = numpy.log(xerfcx_limit - chi * erfcx(chi0))
+            second -= chi0 * chi0
+            first = numpy.where(
+                chi > math.exp(10),
+                PLRsearch.log_xerfcx_10 + 2 * (numpy.log(chi) - 10),
+                numpy.log(xerfcx_limit - chi * erfcx(chi)),
+            )
+            first -= chi * chi
+            positive = log_minus_array(first, second)
+            exp_first = xerfcx_limit + chi * erfcx(-chi)
+            exp_first *= numpy.exp(-chi * chi)
+            exp_first -= 2 * chi
+            negative = numpy.log(exp_first - numpy.exp(second))
+        intermediate = numpy.where(chi >= -1.0, positive, negative)
+        return intermediate + numpy.log(spread) - numpy.log(erfc(-chi0))
+
+    @staticmethod
+    def find_critical_rate_array(
+        lfit_array_func, min_rate, max_rate, loss_ratio_target, mrr, spread
+    ):
+        """Return the critical loads for many parameter pairs at once.
+
+        Array variant of find_critical_rate, the bisection is performed
+        for all elements together, until each element is done.
+
+        :param lfit_array_func: Array fitting function,
+            typically lfit_stretch_array or lfit_erf_array.
+        :param min_rate: Lower bound for binary search [pps].
+        :param max_rate: Upper bound for binary search [pps].
+        :param loss_ratio_target: Fitting function should return loss rate
+            giving this ratio at the returned load and parameters [1].
+        :param mrr: The mrr parameter values for the fitting function [pps].
+        :param spread: The spread parameter values for the fitting function.
+        :type lfit_array_func: Function from 3 arrays to array.
+        :type min_rate: float
+        :type max_rate: float
+        :type loss_ratio_target: float
+        :type mrr: numpy.ndarray
+        :type spread: numpy.ndarray
+        :returns: Loads [pps] which achieve the target with given parameters.
+        :rtype: numpy.ndarray
+        """
+        rate_lo = numpy.full(mrr.shape, min_rate, dtype=float)
+        rate_hi = numpy.full(mrr.shape, max_rate, dtype=float)
+        rate = numpy.empty(mrr.shape, dtype=float)
+        active = numpy.arange(mrr.size)
+        while active.size:
+            lo = rate_lo[active]
+            hi = rate_hi[active]
+            mid = (hi + lo) / 2.0
+            rate[active] = mid
+            active = active[(mid != hi) & (mid != lo)]
+            mid = rate[active]
+            with numpy.errstate(over="ignore"):
+                loss_ratio = numpy.exp(
+                    lfit_array_func(mid, mrr[active], spread[active])
+                )
+            loss_ratio /= mid
+            going_down = loss_ratio > loss_ratio_target
+            going_up = loss_ratio < loss_ratio_target
+            rate_hi[active[going_down]] = mid[going_down]
+            rate_lo[active[going_up]] = mid[going_up]
+            active = active[going_down | going_up]
+        return rate
+
+    @staticmethod
+    def log_weight_array(lfit_array_func, trial_result_list, mrr, spread):
+        """Return log of weight of trial results for many parameter pairs.
+
+        Array variant of log_weight, the likelihood of every trial result
+        is computed for all parameter pairs as a single array operation.
+
+        :param lfit_array_func: Array fitting function,
+            typically lfit_stretch_array or lfit_erf_array.
+        :param trial_result_list: List of trial measurement results.
+        :param mrr: The mrr parameter values for the fitting function.
+        :param spread: The spread parameter values for the fitting function.
+        :type lfit_array_func: Function from 3 arrays to array.
+        :type trial_result_list: list of MLRsearch.MeasurementResult
+        :type mrr: numpy.ndarray
+        :type spread: numpy.ndarray
+        :returns: Logarithms of result weight, one per parameter pair.
+        :rtype: numpy.ndarray
+        """
+        # One row per trial result, one column per parameter pair.
+        loads = numpy.array(
+            [result.intended_load for result in trial_result_list], dtype=float
+        ).reshape(-1, 1)
+        offered_counts = numpy.array(
+            [result.offered_count for result in trial_result_list], dtype=float
+        ).reshape(-1, 1)
+        loss_counts = numpy.array(
+            [result.plr_loss_count for result in trial_result_list],
+            dtype=float,
+        ).reshape(-1, 1)
+        log_avg_rel_loss_per_second = lfit_array_func(loads, mrr, spread)
+        log_avg_abs_loss_per_trial = log_avg_rel_loss_per_second + numpy.log(
+            offered_counts / loads
+        )
+        log_trial_likelihood = numpy.logaddexp(0.0, -log_avg_abs_loss_per_trial)
+        log_trial_likelihood *= -loss_counts
+        log_trial_likelihood -= numpy.logaddexp(0.0, log_avg_abs_loss_per_trial)
+        return log_trial_likelihood.sum(axis=0)
+
+    def make_value_logweight_func(self, fitting_function, min_rate, max_rate):
+        """Return function for integrator to compute with.
+
+        The returned function does not depend on self (nor on the measurer),
+        so it is cheap to serialize.
+
+        :param fitting_function: lfit_erf or lfit_stretch.
+        :param min_rate: Practical minimum of possible ofered load.
+        :param max_rate: Practical maximum of possible ofered load.
+        :type fitting_function: Function from 3 floats to float.
+        :type min_rate: float
+        :type max_rate: float
+        :returns: Function of trace, trial results and two parameters.
+        :rtype: Callable[[Callable, list, float, float], Tuple[float, float]]
+        """
+        packet_loss_ratio_target = self.packet_loss_ratio_target
+
+        def value_logweight_func(trace, trial_result_list, x_mrr, x_spread):
+            """Return log of critical rate and log of likelihood.
+
+            This is a closure, accessing the fitting function and rate limits.
+            Trial results are passed explicitly, as the worker process
+            accumulates them across trials.
+
+            The dimensional spread parameter is the (dimensional) mrr
+            raised to the power of x_spread scaled to interval (0, 1).
+            The dimensional mrr parameter distribution has shape of
+            1/(1+x^2), but x==1 corresponds to max_rate
+            and 1.0 pps is added to avoid numerical problems in fitting
+            functions.
+
+            TODO: x^-2 (for x>1.0) might be simpler/nicer prior.
+
+            :param trace: Multiprocessing-safe logging function (closure).
+            :param trial_result_list: Results of measurements so far.
+            :param x_mrr: The first dimensionless param
+                from (-1, 1) interval.
+            :param x_spread: The second dimensionless param
+                from (-1, 1) interval.
+            :type trace: function (str, object) -> None
+            :type trial_result_list: list of MLRsearch.MeasurementResult
+            :type x_mrr: float
+            :type x_spread: float
+            :returns: Log of critical rate [pps] and log of likelihood.
+            :rtype: 2-tuple of float
+            """
+            mrr = max_rate * (1.0 / (x_mrr + 1.0) - 0.5) + 1.0
+            spread = math.exp((x_spread + 1.0) / 2.0 * math.log(mrr))
+            logweight = PLRsearch.log_weight(
+                trace, fitting_function, trial_result_list, mrr, spread
+            )
+            value = math.log(
+                PLRsearch.find_critical_rate(
+                    trace,
+                    fitting_function,
+                    min_rate,
+                    max_rate,
+                    packet_loss_ratio_target,
+                    mrr,
+                    spread,
+                )
+            )
+            return value, logweight
+
+        return value_logweight_func
+
+    def make_batch_value_logweight_func(
+        self, array_fitting_function, min_rate, max_rate
+    ):
+        """Return function for integrator to compute with, on sample batches.
+
+        This is the array variant of make_value_logweight_func,
+        the returned function takes arrays of dimensionless parameters
+        and returns arrays of values and log-likelihoods.
+
+        :param array_fitting_function: lfit_erf_array or lfit_stretch_array.
+        :param min_rate: Practical minimum of possible ofered load.
+        :param max_rate: Practical maximum of possible ofered load.
+        :type array_fitting_function: Function from 3 arrays to array.
+        :type min_rate: float
+        :type max_rate: float
+        :returns: Function of trace, trial results and two parameter arrays.
+        :rtype: Callable[[Callable, list, numpy.ndarray, numpy.ndarray],
+            Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+        packet_loss_ratio_target = self.packet_loss_ratio_target
+
+        def batch_value_logweight_func(
+            trace, trial_result_list, x_mrr, x_spread
+        ):
+            """Return logs of critical rates and logs of likelihoods.
+
+            The parameter transformation is the same
+            as in make_value_logweight_func, applied elementwise.
+
+            :param trace: Multiprocessing-safe logging function (closure).
+            :param trial_result_list: Results of measurements so far.
+            :param x_mrr: The first dimensionless params
+                from (-1, 1) interval.
+            :param x_spread: The second dimensionless params
+                from (-1, 1) interval.
+            :type trace: function (str, object) -> None
+            :type trial_result_list: list of MLRsearch.MeasurementResult
+            :type x_mrr: numpy.ndarray
+            :type x_spread: numpy.ndarray
+            :returns: Logs of critical rates [pps] and logs of likelihoods.
+            :rtype: 2-tuple of numpy.ndarray
+            """
+            trace("batch of samples", x_mrr.size)
+            mrr = max_rate * (1.0 / (x_mrr + 1.0) - 0.5) + 1.0
+            spread = numpy.exp((x_spread + 1.0) / 2.0 * numpy.log(mrr))
+            logweights = PLRsearch.log_weight_array(
+                array_fitting_function, trial_result_list, mrr, spread
+            )
+            values = numpy.log(
+                PLRsearch.find_critical_rate_array(
+                    array_fitting_function,
+                    min_rate,
+                    max_rate,
+                    packet_loss_ratio_target,
+                    mrr,
+                    spread,
+                )
+            )
+            return values, logweights
+
+        return batch_value_logweight_func
+
+    def start_workers(self, min_rate, max_rate, focus_trackers=(None, None)):
+        """Start integrator worker processes, one per fitting function.
+
+        The workers live until closed, computing during each measurement.
+
+        :param min_rate: Practical minimum of possible ofered load.
+        :param max_rate: Practical maximum of possible ofered load.
+        :param focus_trackers: Pair of trackers initialized
+            to speed up the numeric computation.
+        :type min_rate: float
+        :type max_rate: float
+        :type focus_trackers: 2-tuple of None or stat_trackers.VectorStatTracker
+        :returns: Stretch worker and erf worker.
+        :rtype: 2-tuple of _IntegratorWorker
+        """
+        stretch_focus_tracker, erf_focus_tracker = focus_trackers
+        batch_size = self.batch_size
+        if batch_size:
+            stretch_func = self.make_batch_value_logweight_func(
+                self.lfit_stretch_array, min_rate, max_rate
+            )
+            erf_func = self.make_batch_value_logweight_func(
+                self.lfit_erf_array, min_rate, max_rate
+            )
+        else:
+            stretch_func = self.make_value_logweight_func(
+                self.lfit_stretch, min_rate, max_rate
+            )
+            erf_func = self.make_value_logweight_func(
+                self.lfit_erf, min_rate, max_rate
+            )
+        stretch_worker = _IntegratorWorker(
+            "stretch",
+            stretch_func,
+            stretch_focus_tracker,
+            self.trace_enabled,
+            batch_size,
+        )
+        erf_worker = _IntegratorWorker(
+            "erf", erf_func, erf_focus_tracker, self.trace_enabled, batch_size
+        )
+        return stretch_worker, erf_worker
+
     def measure_and_compute(
         self,
         trial_duration,
@@ -516,10 +893,11 @@ class PLRsearch:
         max_rate,
         focus_trackers=(None, None),
         max_samples=None,
+        workers=None,
     ):
         """Perform both measurement and computation at once.
 
-        High level steps: Prepare and launch computation worker processes,
+        High level steps: Let computation workers start computing,
         perform the measurement, stop computation and combine results.
 
         Integrator needs a specific function to process (-1, 1) parameters.
@@ -528,8 +906,8 @@ class PLRsearch:
         distribution over the dimensional parameters.
         Maximal rate (line rate) is needed for that transformation.
 
-        Two fitting functions are used, computation is started
-        on temporary worker process per fitting function. After the measurement,
+        Two fitting functions are used, computation is performed
+        in a worker process per fitting function. After the measurement,
         average and stdev of the critical rate (not log) of each worker
         are combined and returned. Raw averages are also returned,
         offered load for next iteration is chosen based on them.
@@ -537,11 +915,15 @@ class PLRsearch:
         measurements at its avg are best for relevant results (for both),
         but we do not know which fitting function it is.
 
-        Focus trackers are updated in-place. If a focus tracker in None,
-        new instance is created.
+        The workers (see start_workers) are long-lived, they keep
+        the trial results and focus trackers between calls,
+        so only trial results added since the previous call are sent.
+        If no workers are given, temporary ones are started
+        with the given focus trackers, and closed after the computation.
+        Focus trackers are not used when workers are given,
+        the returned ones are copies of those the workers keep.
 
         TODO: Define class for result object, so that fields are documented.
-        TODO: Re-use processes, instead creating on each computation?
         TODO: As only one result is needed fresh, figure out a way
         how to keep the other worker running. This will alow shorter
         duration per trial. Special handling at first and last measurement
@@ -555,6 +937,7 @@ class PLRsearch:
         :param focus_trackers: Pair of trackers initialized
             to speed up the numeric computation.
         :param max_samples: Limit for integrator samples, for debugging.
+        :param workers: Workers as returned by start_workers, or None.
         :type trial_duration: float
         :type transmit_rate: float
         :type trial_result_list: list of MLRsearch.MeasurementResult
@@ -562,6 +945,7 @@ class PLRsearch:
         :type max_rate: float
         :type focus_trackers: 2-tuple of None or stat_trackers.VectorStatTracker
         :type max_samples: None or int
+        :type workers: None or 2-tuple of _IntegratorWorker
         :returns: Measurement and computation results.
         :rtype: _ComputeResult
         """
@@ -571,161 +955,23 @@ class PLRsearch:
             f"trial_result_list {trial_result_list!r}, max_rate {max_rate!r}, "
             f"focus_trackers {focus_trackers!r}, max_samples {max_samples!r}"
         )
-        # Preparation phase.
-        dimension = 2
-        stretch_focus_tracker, erf_focus_tracker = focus_trackers
-        if stretch_focus_tracker is None:
-            stretch_focus_tracker = stat_trackers.VectorStatTracker(dimension)
-            stretch_focus_tracker.unit_reset()
-        if erf_focus_tracker is None:
-            erf_focus_tracker = stat_trackers.VectorStatTracker(dimension)
-            erf_focus_tracker.unit_reset()
-        old_trackers = stretch_focus_tracker.copy(), erf_focus_tracker.copy()
-
-        def start_computing(fitting_function, focus_tracker):
-            """Just a block of code to be used for each fitting function.
-
-            Define function for integrator, create process and pipe ends,
-            start computation, return the boss pipe end.
-
-            :param fitting_function: lfit_erf or lfit_stretch.
-            :param focus_tracker: Tracker initialized to speed up the numeric
-                computation.
-            :type fitting_function: Function from 3 floats to float.
-            :type focus_tracker: None or stat_trackers.VectorStatTracker
-            :returns: Boss end of communication pipe.
-            :rtype: multiprocessing.Connection
-            """
-
-            boss_pipe_end, worker_pipe_end = multiprocessing.Pipe()
-            # Starting the worker first. Contrary to documentation
-            # https://docs.python.org/3/library/multiprocessing.html#multiprocessing.connection.Connection
-            # sending of large object without active listener on the other side
-            # results in a deadlock, not in a ValueError.
-            # See https://stackoverflow.com/questions/15137292/large-objects-and-multiprocessing-pipes-and-send
-            worker = multiprocessing.Process(
-                target=Integrator.try_estimate_nd,
-                args=(worker_pipe_end, 5.0, self.trace_enabled),
-            )
-            worker.daemon = True
-            worker.start()
-
-            # Only now it is safe to send the function to compute with.
-            def value_logweight_func(trace, x_mrr, x_spread):
-                """Return log of critical rate and log of likelihood.
-
-                This is a closure. The ancestor function got
-                trial_result_list as a parameter, and we are accessing it.
-                As integrator has strict conditions on function signature,
-                trial_result_list cannot be an explicit argument
-                of the current function.
-                This is also why we have to define this closure
-                at each invocation of the ancestor function anew.
-
-                The dimensional spread parameter is the (dimensional) mrr
-                raised to the power of x_spread scaled to interval (0, 1).
-                The dimensional mrr parameter distribution has shape of
-                1/(1+x^2), but x==1 corresponds to max_rate
-                and 1.0 pps is added to avoid numerical problems in fitting
-                functions.
-
-                TODO: x^-2 (for x>1.0) might be simpler/nicer prior.
-
-                :param trace: Multiprocessing-safe logging function (closure).
-                :param x_mrr: The first dimensionless param
-                    from (-1, 1) interval.
-                :param x_spread: The second dimensionless param
-                    from (-1, 1) interval.
-                :type trace: function (str, object) -> None
-                :type x_mrr: float
-                :type x_spread: float
-                :returns: Log of critical rate [pps] and log of likelihood.
-                :rtype: 2-tuple of float
-                """
-                mrr = max_rate * (1.0 / (x_mrr + 1.0) - 0.5) + 1.0
-                spread = math.exp((x_spread + 1.0) / 2.0 * math.log(mrr))
-                logweight = self.log_weight(
-                    trace, fitting_function, trial_result_list, mrr, spread
-                )
-                value = math.log(
-                    self.find_critical_rate(
-                        trace,
-                        fitting_function,
-                        min_rate,
-                        max_rate,
-                        self.packet_loss_ratio_target,
-                        mrr,
-                        spread,
-                    )
-                )
-                return value, logweight
-
-            dilled_function = dill.dumps(value_logweight_func)
-            boss_pipe_end.send(
-                (dimension, dilled_function, focus_tracker, max_samples)
-            )
-            return boss_pipe_end
-
-        erf_pipe = start_computing(self.lfit_erf, erf_focus_tracker)
-        stretch_pipe = start_computing(self.lfit_stretch, stretch_focus_tracker)
-
-        # Measurement phase.
-        measurement = self.measurer.measure(trial_duration, transmit_rate)
-
-        # Processing phase.
-        def stop_computing(name, pipe):
-            """Just a block of code to be used for each worker.
-
-            Send stop object, poll for result, then either
-            unpack response, log messages and return, or raise traceback.
-
-            TODO: Define class/structure for the return value?
-
-            :param name: Human friendly worker identifier for logging purposes.
-            :param pipe: Boss end of connection towards worker to stop.
-            :type name: str
-            :type pipe: multiprocessing.Connection
-            :returns: Computed value tracker, actual focus tracker,
-                and number of samples used for this iteration.
-            :rtype: _PartialResult
-            """
-            # If worker encountered an exception, we get it in the recv below,
-            # but send will report a broken pipe.
-            # EAFP says we should ignore the error (instead of polling first).
-            # https://devblogs.microsoft.com/python
-            #   /idiomatic-python-eafp-versus-lbyl/
-            try:
-                pipe.send(None)
-            except BrokenPipeError:
-                pass
-            if not pipe.poll(10.0):
-                raise RuntimeError(f"Worker {name} did not finish!")
-            result_or_traceback = pipe.recv()
-            try:
-                (
-                    value_tracker,
-                    focus_tracker,
-                    debug_list,
-                    trace_list,
-                    sampls,
-                ) = result_or_traceback
-            except ValueError as exc:
-                raise RuntimeError(
-                    f"Worker {name} failed with the following traceback:\n"
-                    f"{result_or_traceback}"
-                ) from exc
-            logging.info(f"Logs from worker {name!r}:")
-            for message in debug_list:
-                logging.info(message)
-            for message in trace_list:
-                logging.debug(message)
-            logging.debug(
-                f"trackers: value {value_tracker!r} focus {focus_tracker!r}"
-            )
-            return _PartialResult(value_tracker, focus_tracker, sampls)
-
-        stretch_result = stop_computing("stretch", stretch_pipe)
-        erf_result = stop_computing("erf", erf_pipe)
+        old_trackers = focus_trackers
+        temporary = workers is None
+        if temporary:
+            workers = self.start_workers(min_rate, max_rate, focus_trackers)
+        stretch_worker, erf_worker = workers
+        try:
+            erf_worker.start_computing(trial_result_list, max_samples)
+            stretch_worker.start_computing(trial_result_list, max_samples)
+            # Measurement phase.
+            measurement = self.measurer.measure(trial_duration, transmit_rate)
+            # Processing phase.
+            stretch_result = stretch_worker.stop_computing()
+            erf_result = erf_worker.stop_computing()
+        finally:
+            if temporary:
+                stretch_worker.close()
+                erf_worker.close()
         result = PLRsearch._get_result(measurement, stretch_result, erf_result)
         logging.info(
             f"measure_and_compute finished with trial result "
@@ -770,6 +1016,147 @@ class PLRsearch:
         return _ComputeResult(measurement, avg, stdev, sea, eea, trackers)
 
 
+class _IntegratorWorker:
+    """Boss side of a long-lived integrator worker process.
+
+    The worker process runs Integrator.serve_estimates,
+    computing between start_computing and stop_computing calls.
+    Trial results already sent are remembered, so each computation
+    only sends the new ones.
+    """
+
+    def __init__(
+        self,
+        name,
+        value_logweight_func,
+        focus_tracker,
+        trace_enabled,
+        batch_size=0,
+    ):
+        """Start the worker process and send it the function to integrate.
+
+        :param name: Human friendly worker identifier for logging purposes.
+        :param value_logweight_func: Function of trace, trial results
+            and two parameters, as made by make_value_logweight_func
+            (or by make_batch_value_logweight_func if batch_size is nonzero).
+        :param focus_tracker: Tracker to focus the first computation,
+            or None for the default one.
+        :param trace_enabled: Whether the worker should emit trace debugs.
+        :param batch_size: Maximal number of samples to evaluate at once,
+            zero for sample by sample.
+        :type name: str
+        :type value_logweight_func: Callable
+        :type focus_tracker: None or stat_trackers.VectorStatTracker
+        :type trace_enabled: bool
+        :type batch_size: int
+        """
+        self.name = name
+        self.results_sent = 0
+        self.computing = False
+        self.pipe, worker_pipe_end = multiprocessing.Pipe()
+        # Starting the worker first. Contrary to documentation
+        # https://docs.python.org/3/library/multiprocessing.html#multiprocessing.connection.Connection
+        # sending of large object without active listener on the other side
+        # results in a deadlock, not in a ValueError.
+        # See https://stackoverflow.com/questions/15137292/large-objects-and-multiprocessing-pipes-and-send
+        self.process = multiprocessing.Process(
+            target=Integrator.try_serve_estimates,
+            args=(worker_pipe_end, 5.0, trace_enabled),
+        )
+        self.process.daemon = True
+        self.process.start()
+        # Only now it is safe to send the function to compute with.
+        dimension = 2
+        self.pipe.send(
+            (
+                dimension,
+                dill.dumps(value_logweight_func),
+                focus_tracker,
+                batch_size,
+            )
+        )
+
+    def start_computing(self, trial_result_list, max_samples=None):
+        """Send trial results not sent yet, which starts the computation.
+
+        :param trial_result_list: All results of previous measurements.
+        :param max_samples: Limit for integrator samples, for debugging.
+        :type trial_result_list: list of MLRsearch.MeasurementResult
+        :type max_samples: None or int
+        """
+        new_results = trial_result_list[self.results_sent:]
+        self.pipe.send((new_results, max_samples))
+        self.results_sent = len(trial_result_list)
+        self.computing = True
+
+    def stop_computing(self):
+        """Send stop object, poll for result, unpack, log and return it.
+
+        If the worker has failed, its traceback is received instead,
+        it is raised as RuntimeError.
+
+        :returns: Computed value tracker, actual focus tracker,
+            and number of samples used for this iteration.
+        :rtype: _PartialResult
+        :raises RuntimeError: If the worker failed or did not respond.
+        """
+        name = self.name
+        pipe = self.pipe
+        self.computing = False
+        # If worker encountered an exception, we get it in the recv below,
+        # but send will report a broken pipe.
+        # EAFP says we should ignore the error (instead of polling first).
+        # https://devblogs.microsoft.com/python
+        #   /idiomatic-python-eafp-versus-lbyl/
+        try:
+            pipe.send(None)
+        except BrokenPipeError:
+            pass
+        if not pipe.poll(10.0):
+            raise RuntimeError(f"Worker {name} did not finish!")
+        result_or_traceback = pipe.recv()
+        try:
+            (
+                value_tracker,
+                focus_tracker,
+                debug_list,
+                trace_list,
+                sampls,
+            ) = result_or_traceback
+        except ValueError as exc:
+            raise RuntimeError(
+                f"Worker {name} failed with the following traceback:\n"
+                f"{result_or_traceback}"
+            ) from exc
+        logging.info(f"Logs from worker {name!r}:")
+        for message in debug_list:
+            logging.info(message)
+        for message in trace_list:
+            logging.debug(message)
+        logging.debug(
+            f"trackers: value {value_tracker!r} focus {focus_tracker!r}"
+        )
+        return _PartialResult(value_tracker, focus_tracker, sampls)
+
+    def close(self):
+        """Tell the worker process to end, terminate it if it does not.
+
+        If the computation was not stopped (e.g. measurement failed),
+        it is stopped first, the result is ignored.
+        """
+        try:
+            if self.computing:
+                self.pipe.send(None)
+            self.pipe.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(10.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.pipe.close()
+
+
 # Named tuples, for multiple local variables to be passed as return value.
 _PartialResult = namedtuple(
     "_PartialResult", "value_tracker focus_tracker samples"
@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -24,6 +24,11 @@ functions of this module use None as -inf.
 
 TODO: Figure out a more performant way of handling -inf.
 
+Functions with _array suffix work elementwise on numpy arrays
+(or anything broadcastable), they use -inf instead of None
+and return nan where the scalar variants would raise.
+The array variant of log_plus is numpy.logaddexp.
+
 The functions handle the common task of adding or subtracting
 two numbers where both operands and the result is given in logarithm form.
 There are conditionals to make sure overflow does not happen (if possible)
@@ -31,6 +36,8 @@ during the computation."""
 
 import math
 
+import numpy
+
 
 def log_plus(first, second):
     """Return logarithm of the sum of two exponents.
@@ -100,3 +107,23 @@ def safe_exp(log_value):
     if log_value is None:
         return 0.0
     return math.exp(log_value)
+
+
+def log_minus_array(first, second):
+    """Return logarithm of the difference of two exponents, elementwise.
+
+    Array variant of log_minus, -inf is used as the logarithm of zero.
+    Unlike numpy.logaddexp, there is no numpy ufunc for this.
+    Where the difference would be non-positive, nan is returned.
+
+    :param first: Logarithms of the numbers to subtract from.
+    :param second: Logarithms of the numbers to subtract.
+    :type first: numpy.ndarray or float
+    :type second: numpy.ndarray or float
+    :returns: Logarithms of the differences.
+    :rtype: numpy.ndarray
+    """
+    with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        factor = -numpy.expm1(numpy.subtract(second, first))
+        retval = first + numpy.log(factor)
+    return numpy.where(factor > 0.0, retval, numpy.nan)
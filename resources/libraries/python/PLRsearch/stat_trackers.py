@@ -1,4 +1,4 @@
-# Copyright (c) 2024 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -26,6 +26,8 @@ import math
 
 import numpy
 
+from scipy.special import logsumexp
+
 # TODO: Teach FD.io CSIT to use multiple dirs in PYTHONPATH,
 # then switch to absolute imports within PLRsearch package.
 # Current usage of relative imports is just a short term workaround.
@@ -121,6 +123,83 @@ class ScalarStatTracker:
         self.log_variance = log_variance
         return self
 
+    def merge(self, log_sum_weight, average, log_variance):
+        """Return updated stats corresponding to addition of weighted data.
+
+        The data is given by its stats, as if tracked by another tracker.
+        Adding samples one by one gives the same result (up to rounding)
+        as merging their stats.
+
+        :param log_sum_weight: Natural logarithm of sum of weights of the data.
+        :param average: Weighted average of the data.
+        :param log_variance: Natural logarithm of variance of the data,
+            or None for zero variance.
+        :type log_sum_weight: float
+        :type average: float
+        :type log_variance: float or None
+        :returns: Updated self.
+        :rtype: ScalarStatTracker
+        """
+        old_log_sum_weight = self.log_sum_weight
+        if old_log_sum_weight is None:
+            self.log_sum_weight = log_sum_weight
+            self.average = average
+            self.log_variance = log_variance
+            return self
+        new_log_sum_weight = log_plus(old_log_sum_weight, log_sum_weight)
+        log_old_ratio = old_log_sum_weight - new_log_sum_weight
+        log_data_ratio = log_sum_weight - new_log_sum_weight
+        shift = average - self.average
+        new_average = self.average + shift * math.exp(log_data_ratio)
+        new_log_variance = None
+        if self.log_variance is not None:
+            new_log_variance = self.log_variance + log_old_ratio
+        if log_variance is not None:
+            new_log_variance = log_plus(
+                new_log_variance, log_variance + log_data_ratio
+            )
+        absolute_shift = abs(shift)
+        if absolute_shift > 0.0:
+            log_square_shift = 2 * math.log(absolute_shift)
+            new_log_variance = log_plus(
+                new_log_variance,
+                log_square_shift + log_old_ratio + log_data_ratio,
+            )
+        self.log_sum_weight = new_log_sum_weight
+        self.average = new_average
+        self.log_variance = new_log_variance
+        return self
+
+    def add_many(self, scalar_values, log_weights):
+        """Return updated stats corresponding to addition of many samples.
+
+        The samples are processed as numpy arrays, their stats are computed
+        at once and merged, which is much faster than calling add
+        for every sample.
+
+        :param scalar_values: The scalar values of the samples.
+        :param log_weights: Natural logarithms of weights of the samples.
+        :type scalar_values: numpy.ndarray or iterable of float
+        :type log_weights: numpy.ndarray or iterable of float
+        :returns: Updated self.
+        :rtype: ScalarStatTracker
+        """
+        scalar_values = numpy.asarray(scalar_values, dtype=float)
+        log_weights = numpy.asarray(log_weights, dtype=float)
+        if not scalar_values.size:
+            return self
+        log_sum_weight = float(logsumexp(log_weights))
+        log_ratios = log_weights - log_sum_weight
+        average = float(numpy.dot(numpy.exp(log_ratios), scalar_values))
+        with numpy.errstate(divide="ignore"):
+            log_square_shifts = 2 * numpy.log(
+                numpy.abs(scalar_values - average)
+            )
+        log_variance = float(logsumexp(log_ratios + log_square_shifts))
+        if log_variance == -math.inf:
+            log_variance = None
+        return self.merge(log_sum_weight, average, log_variance)
+
 
 class ScalarDualStatTracker(ScalarStatTracker):
     """Class for tracking one-dimensional samples, offering dual stats.
@@ -218,6 +297,38 @@ class ScalarDualStatTracker(ScalarStatTracker):
         primary.add(scalar_value, log_weight)
         return self
 
+    def add_many(self, scalar_values, log_weights):
+        """Return updated both stats after addition of many samples.
+
+        Equivalent (up to rounding) to calling add for each sample in order.
+
+        :param scalar_values: The scalar values of the samples.
+        :param log_weights: Natural logarithms of weights of the samples.
+        :type scalar_values: numpy.ndarray or iterable of float
+        :type log_weights: numpy.ndarray or iterable of float
+        :returns: Updated self.
+        :rtype: ScalarDualStatTracker
+        """
+        scalar_values = numpy.asarray(scalar_values, dtype=float)
+        log_weights = numpy.asarray(log_weights, dtype=float)
+        if not scalar_values.size:
+            return self
+        primary = super()
+        # The weightest sample, the latest one if tied.
+        index = log_weights.size - 1 - int(numpy.argmax(log_weights[::-1]))
+        max_log_weight = float(log_weights[index])
+        if self.max_log_weight is None or max_log_weight >= self.max_log_weight:
+            self.max_log_weight = max_log_weight
+            self.secondary = primary.copy()
+            self.secondary.add_many(
+                numpy.delete(scalar_values, index),
+                numpy.delete(log_weights, index),
+            )
+        else:
+            self.secondary.add_many(scalar_values, log_weights)
+        primary.add_many(scalar_values, log_weights)
+        return self
+
     def get_pessimistic_variance(self):
         """Return estimate of variance reflecting weight effects.
 
@@ -387,6 +498,100 @@ class VectorStatTracker:
         # self.covariance_matrix still points to the object we updated in-place.
         return shift
 
+    def add_many(self, vector_values, log_weights):
+        """Return updated state corresponding to addition of many samples.
+
+        The samples are processed as numpy arrays, their stats are computed
+        at once and merged, which is equivalent (up to rounding)
+        to calling add_get_shift for each sample in order.
+
+        :param vector_values: The values of the samples, one per row.
+        :param log_weights: Natural logarithms of weights of the samples.
+        :type vector_values: numpy.ndarray
+        :type log_weights: numpy.ndarray or iterable of float
+        :returns: Updated self.
+        :rtype: VectorStatTracker
+        """
+        vector_values = numpy.asarray(vector_values, dtype=float)
+        log_weights = numpy.asarray(log_weights, dtype=float)
+        if not log_weights.size:
+            return self
+        if self.log_sum_weight is None:
+            # First sample sets averages, but keeps the covariance matrix.
+            self.add_get_shift(vector_values[0], float(log_weights[0]))
+            vector_values = vector_values[1:]
+            log_weights = log_weights[1:]
+            if not log_weights.size:
+                return self
+        data_log_sum_weight = float(logsumexp(log_weights))
+        data_ratios = numpy.exp(log_weights - data_log_sum_weight)
+        data_averages = data_ratios @ vector_values
+        data_shifts = vector_values - data_averages
+        data_covariance = (data_shifts.T * data_ratios) @ data_shifts
+        old_log_sum_weight = self.log_sum_weight
+        new_log_sum_weight = log_plus(old_log_sum_weight, data_log_sum_weight)
+        old_ratio = math.exp(old_log_sum_weight - new_log_sum_weight)
+        data_ratio = math.exp(data_log_sum_weight - new_log_sum_weight)
+        old_averages = numpy.array(self.averages, dtype=float)
+        shift = data_averages - old_averages
+        covariance_matrix = (
+            old_ratio * numpy.array(self.covariance_matrix, dtype=float)
+            + data_ratio * data_covariance
+            + old_ratio * data_ratio * numpy.outer(shift, shift)
+        )
+        self.log_sum_weight = new_log_sum_weight
+        self.averages = (old_averages + shift * data_ratio).tolist()
+        self.covariance_matrix = covariance_matrix.tolist()
+        return self
+
+    def add_many_without_dominance_get_distances(
+        self, vector_values, log_weights
+    ):
+        """Update stats by many samples, return distances from old state.
+
+        This is a bulk variant of add_without_dominance_get_distance.
+        The weights are manipulated the same way as if the samples
+        were added one by one, but all distances use the metric
+        and the average from before the update,
+        which is exactly right when all samples were generated
+        from the same (old) state, as the integrator does.
+
+        :param vector_values: The values of the samples, one per row.
+        :param log_weights: Natural logarithms of weights of the samples.
+        :type vector_values: numpy.ndarray
+        :type log_weights: numpy.ndarray or iterable of float
+        :returns: Distance of each sample from the old average.
+        :rtype: numpy.ndarray
+        """
+        vector_values = numpy.asarray(vector_values, dtype=float)
+        shifts = vector_values - numpy.array(self.averages, dtype=float)
+        gradients = numpy.linalg.solve(self.covariance_matrix, shifts.T).T
+        distances = numpy.einsum("ij,ij->i", shifts, gradients)
+        if not distances.size:
+            return distances
+        # Weight manipulation lowers the weight of all data added before,
+        # so the sample weights are corrected by all later manipulations.
+        lsw = self.log_sum_weight
+        adjusted_log_weights = []
+        log_rescales = []
+        for log_weight in numpy.asarray(log_weights, dtype=float).tolist():
+            log_rescale = 0.0
+            if lsw is not None and lsw < log_weight - 1.0:
+                new_lsw = (lsw + log_weight) / 2.0
+                log_rescale = new_lsw - lsw
+                lsw = new_lsw
+                log_weight = new_lsw
+            lsw = log_plus(lsw, log_weight)
+            adjusted_log_weights.append(log_weight)
+            log_rescales.append(log_rescale)
+        later_log_rescales = numpy.cumsum(log_rescales[::-1])[::-1]
+        if self.log_sum_weight is not None:
+            self.log_sum_weight += float(later_log_rescales[0])
+        later_log_rescales = numpy.append(later_log_rescales[1:], 0.0)
+        adjusted_log_weights = numpy.array(adjusted_log_weights)
+        self.add_many(vector_values, adjusted_log_weights + later_log_rescales)
+        return distances
+
     # TODO: There are some uses for such a vector tracker,
     # that does not track average, but weightest (latest if tied) value,
     # and computes covariance matrix centered around that.
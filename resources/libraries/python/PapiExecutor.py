@@ -20,15 +20,17 @@ import copy
 import glob
 import json
 import logging
+import queue
 import shutil
 import struct  # vpp-papi can raise struct.error
 import subprocess
 import sys
 import tempfile
 import time
-from collections import deque, UserDict
+from collections import UserDict
 
 from pprint import pformat
+from paramiko.ssh_exception import SSHException
 from robot.api import logger
 
 from resources.libraries.python.Constants import Constants
@@ -38,10 +40,14 @@ from resources.libraries.python.PapiHistory import PapiHistory
 from resources.libraries.python.ssh import (
     SSH,
     SSHTimeout,
-    exec_cmd_no_error,
-    scp_node,
 )
 from resources.libraries.python.topology import Topology, SocketType
+from resources.libraries.python.VppApiCache import (
+    API_JSON_DIR,
+    INSTALLED_PAPI_GLOB,
+    VppApiCache,
+    download_api_files,
+)
 from resources.libraries.python.VppApiCrc import VppApiCrcChecker
 
 
@@ -108,6 +114,7 @@ class PapiSocketExecutor:
     """Methods for executing VPP Python API commands on forwarded socket.
 
     The current implementation downloads and parses .api.json files only once
+    (API definitions are shared by all client instances)
     and caches client instances for reuse.
     Cleanup metadata is added as additional attributes
     directly to the client instances.
@@ -163,7 +170,15 @@ class PapiSocketExecutor:
             replies = papi_exec.add(cmd1, **args1).add(cmd2, **args2).\
                 add(cmd2, **args3).get_replies(err_msg)
 
-    The "is_async=True" part in the last example enables "async handling mode",
+    4. Mixed requests and dumps, pipelined.
+       Up to window commands are in flight, results are in order of adding,
+       a reply for each request and a list of details for each dump.
+
+        with PapiSocketExecutor(node) as papi_exec:
+            results = papi_exec.add(cmd1, **args1).add(dump_cmd, **args2).\
+                get_results(err_msg, window=32)
+
+    The "is_async=True" part in example 3 enables "async handling mode",
     which imposes limitations but gains speed and saves memory.
     This is different than async mode of VPP PAPI, as the default handling mode
     also uses async PAPI connections.
@@ -177,20 +192,26 @@ class PapiSocketExecutor:
     # Class cache for reuse between instances.
     api_root_dir = None
     """We copy .api json files and PAPI code from DUT to robot machine.
-    This class variable holds temporary directory once created.
-    When python exits, the directory is deleted, so no downloaded file leaks.
-    The value will be set to TemporaryDirectory class instance (not string path)
-    to ensure deletion at exit."""
+    Unless PAPI cache is used, this class variable holds temporary directory
+    once created. When python exits, the directory is deleted,
+    so no downloaded file leaks. The value will be set to TemporaryDirectory
+    class instance (not string path) to ensure deletion at exit."""
     api_json_path = None
     """String path to .api.json files, a directory somewhere in api_root_dir."""
     api_package_path = None
     """String path to PAPI code, a different directory under api_root_dir."""
     crc_checker = None
     """Accesses .api.json files at creation, caching speeds up accessing it."""
+    api_definitions = None
+    """Parsed API definitions shared by all client instances.
+    Tuple of (apifiles, messages, services) as returned
+    by VPPApiJSONFiles.load_api, set when the first client instance is created.
+    Clients do not modify the message objects, and types the messages refer to
+    are registered globally in vpp_papi, so sharing is safe."""
     reusable_vpp_client_list = list()
     """Each connection needs a separate client instance,
-    and each client instance creation needs to parse all .api files,
-    which takes time. If a client instance disconnects, it is put here,
+    creating it is cheap thanks to api_definitions, but not free.
+    If a client instance disconnects, it is put here,
     so on next connect we can reuse intead of creating new."""
     conn_cache = dict()
     """Mapping from node key to connected client instance."""
@@ -214,48 +235,38 @@ class PapiSocketExecutor:
         self._api_command_list = list()
 
     def ensure_api_dirs(self):
-        """Copy files from DUT to local temporary directory.
+        """Make sure API files from DUT are present in a local directory.
 
-        If the directory is still there, do not copy again.
-        If copying, also initialize CRC checker (this also performs
+        If the directory is already known, do nothing.
+        Otherwise, also initialize CRC checker (this also performs
         static checks), and remember PAPI package path.
         Do not add that to PATH yet.
+
+        If PAPI cache is enabled, the files (and pre-parsed messages
+        for CRC checker) are taken from the cache, which skips download
+        and parsing when the same VPP build has been seen before.
+        If not, files are downloaded to a temporary directory.
         """
         cls = self.__class__
         if cls.api_package_path:
             return
-        # Pylint suggests to use "with" statement, which we cannot,
-        # do as the dir should stay for multiple ensure_vpp_instance calls.
-        cls.api_root_dir = tempfile.TemporaryDirectory(dir="/tmp")
-        root_path = cls.api_root_dir.name
-        # Pack, copy and unpack Python part of VPP installation from _node.
-        # TODO: Use rsync or recursive version of ssh.scp_node instead?
-        node = self._node
-        exec_cmd_no_error(node, ["rm", "-rf", "/tmp/papi.txz"])
-        # Papi python version depends on OS (and time).
-        # Python 3.4 or higher, site-packages or dist-packages.
-        installed_papi_glob = "/usr/lib/python3*/*-packages/vpp_papi"
-        # We need to wrap this command in bash, in order to expand globs,
-        # and as ssh does join, the inner command has to be quoted.
-        inner_cmd = " ".join(
-            [
-                "tar",
-                "cJf",
-                "/tmp/papi.txz",
-                "--exclude=*.pyc",
-                installed_papi_glob,
-                "/usr/share/vpp/api",
-            ]
-        )
-        exec_cmd_no_error(node, ["bash", "-c", f"'{inner_cmd}'"])
-        scp_node(node, root_path + "/papi.txz", "/tmp/papi.txz", get=True)
-        run(["tar", "xf", root_path + "/papi.txz", "-C", root_path])
-        cls.api_json_path = root_path + "/usr/share/vpp/api"
+        message_table = None
+        if Constants.PAPI_CACHE_DIR:
+            root_path, message_table = VppApiCache().ensure_entry(self._node)
+        else:
+            # Pylint suggests to use "with" statement, which we cannot,
+            # do as the dir should stay for multiple ensure_vpp_instance calls.
+            cls.api_root_dir = tempfile.TemporaryDirectory(dir="/tmp")
+            root_path = cls.api_root_dir.name
+            download_api_files(self._node, root_path)
+        cls.api_json_path = root_path + API_JSON_DIR
         # Perform initial checks before .api.json files are gone,
         # by creating the checker instance.
-        cls.crc_checker = VppApiCrcChecker(cls.api_json_path)
+        cls.crc_checker = VppApiCrcChecker(
+            cls.api_json_path, message_table=message_table
+        )
         # When present locally, we finally can find the installation path.
-        cls.api_package_path = glob.glob(root_path + installed_papi_glob)[0]
+        cls.api_package_path = glob.glob(root_path + INSTALLED_PAPI_GLOB)[0]
         # Package path has to be one level above the vpp_papi directory.
         cls.api_package_path = cls.api_package_path.rsplit("/", 1)[0]
 
@@ -285,18 +296,36 @@ class PapiSocketExecutor:
             # It is right, we should refactor the code and move initialization
             # of package outside.
             from vpp_papi.vpp_papi import VPPApiClient as vpp_class
-            # We need to create instance before removing from sys.path.
-            # Cannot use loglevel parameter, robot.api.logger lacks the support.
-            vpp_instance = vpp_class(
-                apidir=cls.api_json_path,
-                use_socket=True,
-                server_address="TBD",
-                async_thread=False,
-                # Some operations take considerable time.
-                # For example, 4c dpdk interface up on e810cq, takes ~3 seconds.
-                read_timeout=14.0,
-                logger=FilteredLogger(logger, "INFO"),
-            )
+            from vpp_papi.vpp_papi import VPPApiJSONFiles as json_files
+            time_start = time.monotonic()
+            # Every instance calls load_api to parse all .api.json files.
+            # Temporarily replace it to either remember the first result,
+            # or to return the remembered result without parsing again.
+            orig_load_api = json_files.__dict__.get("load_api", None)
+            if orig_load_api is not None:
+                json_files.load_api = staticmethod(
+                    cls._make_shared_load_api(json_files.load_api)
+                )
+            try:
+                # We need to create instance before removing from sys.path.
+                # Cannot use loglevel parameter,
+                # robot.api.logger lacks the support.
+                vpp_instance = vpp_class(
+                    apidir=cls.api_json_path,
+                    use_socket=True,
+                    server_address="TBD",
+                    async_thread=False,
+                    # Some operations take considerable time.
+                    # For example, 4c dpdk interface up on e810cq,
+                    # takes ~3 seconds.
+                    read_timeout=14.0,
+                    logger=FilteredLogger(logger, "INFO"),
+                )
+            finally:
+                if orig_load_api is not None:
+                    json_files.load_api = orig_load_api
+            duration = time.monotonic() - time_start
+            logger.trace(f"Creating PAPI client instance took {duration}s.")
             # The following is needed to prevent union (e.g. Ip4) debug logging
             # of VPP part of PAPI from spamming robot logs.
             logging.getLogger("vpp_papi.serializer").setLevel(logging.INFO)
@@ -305,6 +334,36 @@ class PapiSocketExecutor:
                 sys.path.pop()
         return vpp_instance
 
+    @classmethod
+    def _make_shared_load_api(cls, load_api):
+        """Return a replacement for load_api using shared API definitions.
+
+        The first call of the replacement delegates to the original function
+        and stores the result in api_definitions class attribute.
+        Subsequent calls return the stored result, without any parsing.
+
+        :param load_api: The original VPPApiJSONFiles.load_api function.
+        :type load_api: Callable
+        :returns: Function with the same signature as load_api.
+        :rtype: Callable
+        """
+
+        def shared_load_api(apifiles=None, apidir=None):
+            """Return shared API definitions, parse only if not parsed yet.
+
+            :param apifiles: List of .api.json files to load, or None.
+            :param apidir: Directory to find .api.json files in, or None.
+            :type apifiles: Optional[List[str]]
+            :type apidir: Optional[str]
+            :returns: Loaded files, messages and services.
+            :rtype: Tuple[list, dict, dict]
+            """
+            if cls.api_definitions is None:
+                cls.api_definitions = load_api(apifiles, apidir)
+            return cls.api_definitions
+
+        return shared_load_api
+
     @classmethod
     def key_for_node_and_socket(cls, node, remote_socket):
         """Return a hashable object to distinguish nodes.
@@ -399,16 +458,23 @@ class PapiSocketExecutor:
         Only at this point a local socket names are created
         in a temporary directory, as CSIT can connect to multiple VPPs.
 
+        Unless disabled by PAPI_NATIVE_FORWARDING, the local socket
+        is forwarded in-process over a paramiko transport.
+        If that fails (or is disabled), a background ssh process is used.
+
         The following attributes are added to the client instance
         to simplify caching and cleanup:
         csit_temp_dir
             - Temporary socket files are created here.
         csit_control_socket
             - This socket controls the local ssh process doing the forwarding.
+        csit_forwarder
+            - The in-process forwarder, or None if ssh process is used.
         csit_local_vpp_socket
             - This is the forwarded socket to talk with remote VPP.
-        csit_deque
-            - Queue for responses.
+        csit_queue
+            - Queue for responses, filled by PAPI event callback.
+              Readers block on it, so they wake up as soon as a reply arrives.
 
         The attribute names do not start with underscore,
         so pylint does not complain about accessing private attribute.
@@ -424,7 +490,6 @@ class PapiSocketExecutor:
             return self
         # No luck, create and connect a new instance.
         time_enter = time.monotonic()
-        node = self._node
         # Parsing takes longer than connecting, prepare instance before tunnel.
         vpp_instance = self.ensure_vpp_instance()
         # Store into cache as soon as possible.
@@ -437,6 +502,41 @@ class PapiSocketExecutor:
         vpp_instance.csit_local_vpp_socket = api_socket
         ssh_socket = temp_path + "/ssh.sock"
         vpp_instance.csit_control_socket = ssh_socket
+        vpp_instance.csit_forwarder = None
+        if Constants.PAPI_NATIVE_FORWARDING:
+            try:
+                ssh = SSH(pool="papi_forwarding")
+                ssh.connect(self._node)
+                vpp_instance.csit_forwarder = ssh.forward_unix_socket(
+                    api_socket, self._remote_vpp_socket
+                )
+            except (IOError, SSHException) as err:
+                logger.warn(
+                    f"Native PAPI socket forwarding failed: {err!r}\n"
+                    f"Falling back to ssh process."
+                )
+        if vpp_instance.csit_forwarder is None:
+            self._forward_with_ssh_process(api_socket, ssh_socket)
+        # Everything is ready, set the local socket address and connect.
+        vpp_instance.transport.server_address = api_socket
+        vpp_instance.connect("csit_socket", do_async=True)
+        reply_queue = queue.SimpleQueue()
+        vpp_instance.csit_queue = reply_queue
+        vpp_instance.register_event_callback(lambda x, y: reply_queue.put(y))
+        duration_conn = time.monotonic() - time_enter
+        logger.trace(f"Establishing socket connection took {duration_conn}s.")
+        return self
+
+    def _forward_with_ssh_process(self, api_socket, ssh_socket):
+        """Start background ssh process forwarding the socket, wait for it.
+
+        :param api_socket: Path of the local socket to create.
+        :param ssh_socket: Path of the control socket for the ssh process.
+        :type api_socket: str
+        :type ssh_socket: str
+        :raises RuntimeError: If the local socket does not appear in time.
+        """
+        node = self._node
         # Cleanup possibilities.
         ret_code, _ = run(["ls", ssh_socket], check=False)
         if ret_code != 2:
@@ -482,8 +582,8 @@ class PapiSocketExecutor:
         priv_key = node.get("priv_key")
         if priv_key:
             # This is tricky. We need a file to pass the value to ssh command.
-            # And we need ssh command, because paramiko does not support sockets
-            # (neither ssh_socket, nor _remote_vpp_socket).
+            # And we need ssh command, as this is the fallback
+            # for when the in-process forwarding does not work.
             key_file = tempfile.NamedTemporaryFile()
             key_file.write(priv_key)
             # Make sure the content is written, but do not close yet.
@@ -511,15 +611,6 @@ class PapiSocketExecutor:
         if priv_key:
             # Socket up means the key has been read. Delete file by closing it.
             key_file.close()
-        # Everything is ready, set the local socket address and connect.
-        vpp_instance.transport.server_address = api_socket
-        vpp_instance.connect("csit_socket", do_async=True)
-        deq = deque()
-        vpp_instance.csit_deque = deq
-        vpp_instance.register_event_callback(lambda x, y: deq.append(y))
-        duration_conn = time.monotonic() - time_enter
-        logger.trace(f"Establishing socket connection took {duration_conn}s.")
-        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """No-op, the client instance remains in cache in connected state."""
@@ -543,17 +634,20 @@ class PapiSocketExecutor:
             return
         logger.debug(f"Disconnecting by key: {key}")
         client_instance.disconnect()
-        run(
-            [
-                "ssh",
-                "-S",
-                client_instance.csit_control_socket,
-                "-O",
-                "exit",
-                "0.0.0.0",
-            ],
-            check=False,
-        )
+        if client_instance.csit_forwarder is not None:
+            client_instance.csit_forwarder.close()
+        else:
+            run(
+                [
+                    "ssh",
+                    "-S",
+                    client_instance.csit_control_socket,
+                    "-O",
+                    "exit",
+                    "0.0.0.0",
+                ],
+                check=False,
+            )
         # Temp dir has autoclean, but deleting explicitly
         # as an error can happen.
         try:
@@ -606,7 +700,7 @@ class PapiSocketExecutor:
 
     @staticmethod
     def disconnect_all_papi_connections():
-        """Disconnect all connected client instances, tear down the SSH tunnels.
+        """Disconnect all connected client instances, tear down the tunnels.
 
         Also remove the local sockets by deleting the temporary directory.
         Put disconnected client instances to the reuse list.
@@ -623,6 +717,7 @@ class PapiSocketExecutor:
         keys_copy = list(cls.conn_cache.keys())
         for key in keys_copy:
             cls.disconnect_by_key(key)
+        PapiExecutor.close_stats_agents()
 
     def add(self, csit_papi_command, history=True, **kwargs):
         """Add next command to internal command list; return self.
@@ -768,6 +863,38 @@ class PapiSocketExecutor:
             raise RuntimeError("Async handling does not suport get_details.")
         return self._execute(err_msg, do_async=False, single_reply=False)
 
+    def get_results(self, err_msg="Failed to get results.", window=64):
+        """Get results for a batch of requests and dumps, pipelined.
+
+        Unlike get_reply and get_details, this method does not wait
+        for replies before sending next command. Up to window commands
+        are kept in flight, replies are matched to commands by context.
+        Dump commands (recognized by "_dump" suffix) are followed
+        by control ping, whose reply terminates the list of details.
+
+        The results are returned in the order of added commands.
+        For a request, the result is the reply, parsed into dict-like object
+        with "retval" field (if present) guaranteed to be zero on success.
+        For a dump, the result is the list of details.
+
+        Do not use for commands trigering VPP-2033,
+        use series of get_reply instead.
+
+        :param err_msg: The message used if the PAPI command(s) execution fails.
+        :param window: Maximal number of commands in flight.
+        :type err_msg: str
+        :type window: int
+        :returns: One result per command, reply or list of details.
+        :rtype: List[Union[UserDict, List[UserDict]]]
+        :raises RuntimeError: If retval is nonzero, parsing or ssh error.
+        """
+        if self._is_async:
+            raise RuntimeError("Async handling does not suport get_results.")
+        local_list = self._api_command_list
+        # Clear first as execution may fail.
+        self._api_command_list = list()
+        return self._execute_pipelined(local_list, err_msg, window)
+
     @staticmethod
     def run_cli_cmd(
         node, cli_cmd, log=True, remote_vpp_socket=Constants.SOCKSVR_PATH
@@ -846,6 +973,9 @@ class PapiSocketExecutor:
 
         One read attempt is guaranteed even with zero timeout.
 
+        The queue wakes the waiting thread as soon as the reader thread
+        puts a reply in, so there is no polling latency.
+
         Most of the time, early None means VPP crashed (see VPP-2033),
         but there is a legitimate use in _drain cleanup functionality.
 
@@ -857,15 +987,12 @@ class PapiSocketExecutor:
         :rtype: Optional[namedtuple]
         """
         timeout = vpp_instance.read_timeout if timeout is None else timeout
-        time_stop = time.monotonic() + timeout
-        while 1:
-            try:
-                return vpp_instance.csit_deque.popleft()
-            except IndexError:
-                # We could busy-wait but that seems to starve the reader thread.
-                time.sleep(0.01)
-            if time.monotonic() > time_stop:
-                return None
+        try:
+            if timeout > 0.0:
+                return vpp_instance.csit_queue.get(timeout=timeout)
+            return vpp_instance.csit_queue.get_nowait()
+        except queue.Empty:
+            return None
 
     @staticmethod
     def _drain(vpp_instance, err_msg, timeout=30.0):
@@ -1038,13 +1165,88 @@ class PapiSocketExecutor:
             PapiSocketExecutor._drain(vpp_instance, err_msg)
         return ret_list
 
+    def _execute_pipelined(self, local_list, err_msg, window):
+        """Execute commands keeping a bounded number in flight.
+
+        Each command is sent (dumps followed by control ping)
+        as long as there are less than window commands without final reply.
+        Then one reply is read and associated with its command by context,
+        control ping reply marks the end of details of the preceding dump.
+
+        CRC checking is done for the replies (requests are checked in .add).
+
+        :param local_list: The list of PAPI commands to be executed on the node.
+        :param err_msg: The message used if the PAPI command(s) execution fails.
+        :param window: Maximal number of commands in flight.
+        :type local_list: list of dict
+        :type err_msg: str
+        :type window: int
+        :returns: One result per command, reply or list of details.
+        :rtype: List[Union[UserDict, List[UserDict]]]
+        :raises AssertionError: If VPP does not know the command.
+        :raises RuntimeError: If the replies are not all correct.
+        """
+        vpp_instance = self.get_connected_client()
+        control_ping_fn = getattr(vpp_instance.api, "control_ping")
+        window = max(1, window)
+        results = [None] * len(local_list)
+        # Mapping from context to (command index, dump context),
+        # the dump context is only set for a control ping following a dump.
+        pending = dict()
+        next_index = 0
+        in_flight = 0
+        try:
+            while next_index < len(local_list) or in_flight:
+                while next_index < len(local_list) and in_flight < window:
+                    command = local_list[next_index]
+                    api_name = command["api_name"]
+                    papi_fn = getattr(vpp_instance.api, api_name)
+                    context = papi_fn(**command["api_args"])
+                    pending[context] = (next_index, None)
+                    if api_name.endswith("_dump"):
+                        results[next_index] = list()
+                        pending[control_ping_fn()] = (next_index, context)
+                    next_index += 1
+                    in_flight += 1
+                reply = PapiSocketExecutor._read(vpp_instance)
+                if reply is None:
+                    raise RuntimeError(
+                        f"{err_msg}\nPipelined PAPI timed out,"
+                        f" {in_flight} commands in flight."
+                    )
+                if reply.context not in pending:
+                    raise RuntimeError(
+                        f"{err_msg}\nUnexpected context: {reply!r}"
+                    )
+                index, dump_context = pending[reply.context]
+                if dump_context is not None:
+                    # No more details, late ones are unexpected.
+                    del pending[reply.context]
+                    del pending[dump_context]
+                    in_flight -= 1
+                    continue
+                self.crc_checker.check_api_name(reply.__class__.__name__)
+                dictized_reply = dictize_and_check_retval(reply, err_msg)
+                if isinstance(results[index], list):
+                    results[index].append(dictized_reply)
+                    continue
+                results[index] = dictized_reply
+                del pending[reply.context]
+                in_flight -= 1
+        except (AttributeError, IOError, struct.error) as err:
+            raise AssertionError(f"{err_msg}") from err
+        finally:
+            # Discard any unprocessed replies to avoid secondary failures.
+            PapiSocketExecutor._drain(vpp_instance, err_msg)
+        return results
+
 
 class Disconnector:
     """Class for holding a single keyword."""
 
     @staticmethod
     def disconnect_all_papi_connections():
-        """Disconnect all connected client instances, tear down the SSH tunnels.
+        """Disconnect all connected client instances, tear down the tunnels.
 
         Also remove the local sockets by deleting the temporary directory.
         Put disconnected client instances to the reuse list.
@@ -1063,6 +1265,7 @@ class Disconnector:
         # Iterate over copy of entries so deletions do not mess with iterator.
         for key in list(cls.conn_cache.keys()):
             cls.disconnect_by_key(key)
+        PapiExecutor.close_stats_agents()
 
 
 class PapiExecutor:
@@ -1103,8 +1306,18 @@ class PapiExecutor:
       method 'add'.
     - even if the parameter contains multiple paths, there is only one
       reply item (for each .add).
+
+    Unless disabled by PAPI_STATS_AGENT, stats are read by a long-lived
+    remote agent (vpp_papi_provider.py --method stats_agent),
+    one per node and stats socket, reused by subsequent get_stats calls.
+    The agent keeps the stats segment mapped and remembers which counters
+    match given paths, so repeated calls only dump values.
+    If the agent fails, the one-shot provider run is used instead.
     """
 
+    stats_agents = dict()
+    """Mapping from (host, port, socket) to channel of running stats agent."""
+
     def __init__(self, node):
         """Initialization.
 
@@ -1176,7 +1389,11 @@ class PapiExecutor:
         paths = [cmd["api_args"]["path"] for cmd in self._api_command_list]
         self._api_command_list = list()
 
-        stdout = self._execute_papi(
+        if Constants.PAPI_STATS_AGENT:
+            reply = self._execute_stats_agent(paths, socket, timeout)
+            if reply is not None:
+                return reply
+        return self._execute_papi(
             paths,
             method="stats",
             err_msg=err_msg,
@@ -1184,54 +1401,159 @@ class PapiExecutor:
             socket=socket,
         )
 
-        return json.loads(stdout)
+    def _get_stats_agent(self, socket):
+        """Return channel of a running stats agent, start one if needed.
+
+        The agent runs over a dedicated SSH connection pool,
+        so it survives disconnects of the default connection.
+
+        :param socket: Path to Stats socket the agent should read.
+        :type socket: str
+        :returns: Channel connected to stdin and stdout of the agent.
+        :rtype: paramiko.Channel
+        :raises RuntimeError: If the agent does not report readiness.
+        """
+        key = (self._node["host"], self._node["port"], socket)
+        chan = self.stats_agents.get(key, None)
+        if chan is not None and not chan.closed:
+            return chan
+        ssh = SSH(pool="stats_agent")
+        ssh.connect(self._node)
+        chan = ssh.open_command_channel(
+            f"sudo -E -S {Constants.REMOTE_FW_DIR}"
+            f"/{Constants.RESOURCES_PAPI_PROVIDER}"
+            f" --method stats_agent --socket {socket}"
+        )
+        if "ready" not in self._read_agent_line(chan):
+            chan.close()
+            raise RuntimeError("Stats agent did not report readiness.")
+        self.stats_agents[key] = chan
+        return chan
 
     @staticmethod
-    def _process_api_data(api_d):
-        """Process API data for smooth converting to JSON string.
+    def _read_agent_line(chan):
+        """Read one JSON line written by the stats agent, return the object.
 
-        Apply binascii.hexlify() method for string values.
+        The agent writes exactly one line per request,
+        so no data is expected after the newline.
 
-        :param api_d: List of APIs with their arguments.
-        :type api_d: list
-        :returns: List of APIs with arguments pre-processed for JSON.
-        :rtype: list
+        :param chan: Channel connected to the agent.
+        :type chan: paramiko.Channel
+        :returns: Parsed object.
+        :rtype: dict
+        :raises EOFError: If the agent exits before writing the whole line.
         """
+        chunks = list()
+        while 1:
+            chunk = chan.recv(1024 * 1024)
+            if not chunk:
+                raise EOFError("Stats agent closed the channel.")
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                return json.loads(b"".join(chunks))
 
-        def process_value(val):
-            """Process value.
+    def _execute_stats_agent(self, paths, socket, timeout):
+        """Get stats from the stats agent, return None on agent failure.
 
-            :param val: Value to be processed.
-            :type val: object
-            :returns: Processed value.
-            :rtype: dict or str or int
-            """
-            if isinstance(val, dict):
-                for val_k, val_v in val.items():
-                    val[str(val_k)] = process_value(val_v)
-                retval = val
-            elif isinstance(val, list):
-                for idx, val_l in enumerate(val):
-                    val[idx] = process_value(val_l)
-                retval = val
+        The agent is closed on failure, so the next call starts a new one.
+        Duration of each call is logged.
+
+        :param paths: List of paths to dump.
+        :param socket: Path to Stats socket to read.
+        :param timeout: Timeout in seconds.
+        :type paths: list
+        :type socket: str
+        :type timeout: int
+        :returns: Requested VPP statistics, or None on failure.
+        :rtype: Optional[list of dict]
+        """
+        key = (self._node["host"], self._node["port"], socket)
+        time_start = time.monotonic()
+        try:
+            chan = self._get_stats_agent(socket)
+            chan.settimeout(timeout)
+            chan.sendall(json.dumps(dict(data=paths)).encode() + b"\n")
+            result = self._read_agent_line(chan)
+        except (
+            IOError, EOFError, ValueError, RuntimeError, SSHException
+        ) as err:
+            logger.debug(f"Stats agent on {key} failed: {err!r}")
+            result = dict(error=repr(err))
+        duration = time.monotonic() - time_start
+        if "error" in result:
+            logger.debug(f"Stats agent error: {result['error']}")
+            chan = self.stats_agents.pop(key, None)
+            if chan is not None:
+                chan.close()
+            return None
+        logger.debug(f"Stats agent call on {key} took {duration}s.")
+        return result["reply"]
+
+    @classmethod
+    def close_stats_agents(cls):
+        """Close channels of all running stats agents, making them exit.
+
+        Call this method before killing/restarting VPP instances,
+        as the agents would keep stale stats segments mapped.
+        """
+        for chan in cls.stats_agents.values():
+            chan.close()
+        cls.stats_agents.clear()
+
+    @staticmethod
+    def _encode_frame(value):
+        """Encode value as a frame of the provider's framed mode.
+
+        :param value: JSON serializable value.
+        :type value: object
+        :returns: Frame, 4-byte big-endian length followed by UTF-8 JSON.
+        :rtype: bytes
+        """
+        payload = json.dumps(value).encode("utf-8")
+        return struct.pack("!I", len(payload)) + payload
+
+    @staticmethod
+    def _read_reply_frames(chan):
+        """Read reply frames from the provider until EOF, reassemble them.
+
+        Frames are processed as they arrive, the whole output
+        is never held as a single string.
+
+        :param chan: Channel with the provider running in framed mode.
+        :type chan: paramiko.Channel
+        :returns: Reply list, as the provider in non-framed mode outputs.
+        :rtype: list
+        :raises RuntimeError: If the output ends inside a frame.
+        """
+        reply = list()
+        stream = chan.makefile("rb")
+        while 1:
+            header = stream.read(4)
+            if not header:
+                return reply
+            if len(header) < 4:
+                raise RuntimeError("Truncated frame header.")
+            size = struct.unpack("!I", header)[0]
+            payload = stream.read(size)
+            if len(payload) < size:
+                raise RuntimeError("Truncated frame payload.")
+            kind, value = json.loads(payload)
+            if kind == "item":
+                reply.append(value)
+            elif kind == "detail":
+                reply[-1]["api_reply"].append(value)
             else:
-                retval = val.encode().hex() if isinstance(val, str) else val
-            return retval
-
-        api_data_processed = list()
-        for api in api_d:
-            api_args_processed = dict()
-            for a_k, a_v in api["api_args"].items():
-                api_args_processed[str(a_k)] = process_value(a_v)
-            api_data_processed.append(
-                dict(api_name=api["api_name"], api_args=api_args_processed)
-            )
-        return api_data_processed
+                reply[-1][value[0]] = value[1]
 
     def _execute_papi(
         self, api_data, method="request", err_msg="", timeout=120, socket=None
     ):
-        """Execute PAPI command(s) on remote node and store the result.
+        """Execute PAPI command(s) on remote node and return the result.
+
+        The provider runs in framed mode. The data is sent as frames
+        over stdin of the channel, so no command line length limit applies
+        and strings do not need to be hex-encoded.
+        Reply frames are reassembled as they arrive.
 
         :param api_data: List of APIs with their arguments.
         :param method: VPP Python API method. Supported methods are: 'request',
@@ -1242,8 +1564,8 @@ class PapiExecutor:
         :type method: str
         :type err_msg: str
         :type timeout: int
-        :returns: Stdout from remote python utility, to be parsed by caller.
-        :rtype: str
+        :returns: Reply list, as parsed from provider output.
+        :rtype: list
         :raises SSHTimeout: If PAPI command(s) execution has timed out.
         :raises RuntimeError: If PAPI executor failed due to another reason.
         :raises AssertionError: If PAPI command(s) execution has failed.
@@ -1251,34 +1573,42 @@ class PapiExecutor:
         if not api_data:
             raise RuntimeError("No API data provided.")
 
-        json_data = (
-            json.dumps(api_data)
-            if method in ("stats", "stats_request")
-            else json.dumps(self._process_api_data(api_data))
-        )
-
+        # For request and dump, each API call is a separate frame.
+        frames = api_data if method in ("request", "dump") else [api_data]
         sock = f" --socket {socket}" if socket else ""
         cmd = (
-            f"{Constants.REMOTE_FW_DIR}/{Constants.RESOURCES_PAPI_PROVIDER}"
-            f" --method {method} --data '{json_data}'{sock}"
+            f"sudo -E -S {Constants.REMOTE_FW_DIR}"
+            f"/{Constants.RESOURCES_PAPI_PROVIDER}"
+            f" --method {method} --framed{sock}"
         )
+        chan = None
         try:
-            ret_code, stdout, _ = self._ssh.exec_command_sudo(
-                cmd=cmd, timeout=timeout, log_stdout_err=False
-            )
-        # TODO: Fail on non-empty stderr?
-        except SSHTimeout:
+            chan = self._ssh.open_command_channel(cmd, timeout=timeout)
+            chan.sendall(b"".join(self._encode_frame(item) for item in frames))
+            chan.shutdown_write()
+            reply = self._read_reply_frames(chan)
+            ret_code = chan.recv_exit_status()
+            stderr = b""
+            while chan.recv_stderr_ready():
+                stderr += chan.recv_stderr(1024 * 1024)
+        except TimeoutError as exc:
             logger.error(
                 f"PAPI command(s) execution timeout on host"
                 f" {self._node['host']}:\n{api_data}"
             )
-            raise
+            raise SSHTimeout(f"Timeout executing: {cmd}") from exc
         except Exception as exc:
             raise RuntimeError(
                 f"PAPI command(s) execution on host {self._node['host']}"
                 f" failed: {api_data}"
             ) from exc
+        finally:
+            if chan is not None:
+                chan.close()
         if ret_code != 0:
+            logger.debug(
+                f"PAPI provider stderr: {stderr.decode('utf-8', 'ignore')}"
+            )
             raise AssertionError(err_msg)
 
-        return stdout
+        return reply
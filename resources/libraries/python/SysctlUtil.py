@@ -1,4 +1,4 @@
-# Copyright (c) 2021 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -13,7 +13,8 @@
 
 """Linux sysctl library."""
 
-from resources.libraries.python.ssh import exec_cmd_no_error
+from resources.libraries.python.ssh import exec_cmd_no_error, \
+    exec_cmd_on_nodes
 
 __all__ = [u"SysctlUtil"]
 
@@ -50,3 +51,24 @@ class SysctlUtil:
         message = f"Node {node[u'host']} failed to run: {command}"
 
         exec_cmd_no_error(node, command, sudo=True, message=message)
+
+    @staticmethod
+    def set_sysctl_values_on_nodes(nodes, values, node_type=None):
+        """Set sysctl keys to specific values on all nodes in parallel.
+
+        All keys are set by a single command per node.
+
+        :param nodes: Nodes in the topology.
+        :param values: Mapping from sysctl key to the value to set.
+        :param node_type: If set, only nodes of this type are affected.
+        :type nodes: dict
+        :type values: dict
+        :type node_type: Optional[str]
+        :raises RuntimeError: If setting failed on any node.
+        """
+        settings = u" ".join(f"{key}={value}" for key, value in values.items())
+        command = f"sysctl -w {settings}"
+        exec_cmd_on_nodes(
+            nodes, command, sudo=True, node_type=node_type,
+            message=f"Failed to run: {command}"
+        )
@@ -1,4 +1,4 @@
-# Copyright (c) 2025 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -13,7 +13,10 @@
 
 """Performance testing traffic generator library."""
 
+import json
 import math
+import os
+import re
 import time
 
 from typing import Callable, List, Optional, Union
@@ -1479,6 +1482,15 @@ class OptimizedSearch:
         This way no re-measurement happens.
         Warmup has to be handled via resetter or ramp-up mechanisms.
 
+        If Constants.PERF_MLRSEARCH_STATE_DIR is set, the measurement database
+        of a complete search is stored there, and the next run of the same
+        test warm starts from the bounds it has found.
+        The database of a search interrupted by the traffic generator
+        is also stored, and the next run of the same test (in the same build,
+        with the same DUT version) resumes it, once.
+        Searches failed for other reasons (e.g. no lower bound) are not
+        stored, as resuming would only repeat the failure.
+
         :param frame_size: Frame size identifier or value [B].
         :param traffic_profile: Module name as a traffic profile identifier.
             See GPL/traffic_profiles/trex for implemented modules.
@@ -1597,10 +1609,134 @@ class OptimizedSearch:
         config.max_load = max_load
         config.search_duration_max = search_duration_max
         config.warmup_duration = 0.0
+        state_path = OptimizedSearch._mlr_state_path()
+        state = OptimizedSearch._load_mlr_state(state_path)
+        identity = OptimizedSearch._mlr_state_identity()
+        warm_start, resume = None, None
+        if state is not None and state[u"complete"]:
+            logger.debug(f"MLRsearch warm start from {state_path}")
+            warm_start = state
+        elif state is not None:
+            # Interrupted search is resumed at most once.
+            OptimizedSearch._remove_mlr_state(state_path)
+            if all(state.get(key) == identity[key] for key in identity):
+                logger.debug(f"MLRsearch resume from {state_path}")
+                resume = state
+            else:
+                logger.debug(f"Ignoring MLRsearch state {state_path}: "
+                             f"stored by a different build or DUT version")
         algorithm = MultipleLossRatioSearch(config)
-        results = algorithm.search(measurer=tg_instance, debug=logger.debug)
+        complete = False
+        try:
+            results = algorithm.search(
+                measurer=tg_instance,
+                debug=logger.debug,
+                warm_start=warm_start,
+                resume=resume,
+            )
+            complete = True
+        finally:
+            if state_path and algorithm.database is not None and (
+                complete or algorithm.resume_state.interrupted
+            ):
+                state = algorithm.export_results()
+                state.update(identity)
+                state[u"timestamp"] = time.time()
+                state[u"complete"] = complete
+                OptimizedSearch._save_mlr_state(state_path, state)
         return [results[goal] for goal in goals]
 
+    @staticmethod
+    def _mlr_state_path():
+        """Return path to MLRsearch state file for the current test.
+
+        :returns: Path to the file, or None if the feature is disabled.
+        :rtype: Optional[str]
+        """
+        if not Constants.PERF_MLRSEARCH_STATE_DIR:
+            return None
+        suite = BuiltIn().get_variable_value(u"${SUITE NAME}", u"")
+        test = BuiltIn().get_variable_value(u"${TEST NAME}", u"")
+        name = re.sub(r"[^A-Za-z0-9.+-]", u"_", f"{suite}.{test}")
+        return os.path.join(Constants.PERF_MLRSEARCH_STATE_DIR, f"{name}.json")
+
+    @staticmethod
+    def _mlr_state_identity():
+        """Return items identifying the build the MLRsearch state is from.
+
+        :returns: DUT type, DUT version and build identification.
+        :rtype: dict
+        """
+        return dict(
+            dut_type=BuiltIn().get_variable_value(u"${DUT_TYPE}", u"unknown"),
+            dut_version=BuiltIn().get_variable_value(
+                u"${DUT_VERSION}", u"unknown"
+            ),
+            build=Constants.PERF_MLRSEARCH_STATE_BUILD,
+        )
+
+    @staticmethod
+    def _load_mlr_state(state_path):
+        """Return MLRsearch state stored by a previous run, if any.
+
+        Unreadable file is treated as missing, the search just starts cold.
+        So is a state older than Constants.PERF_MLRSEARCH_STATE_MAX_AGE.
+
+        :param state_path: Path to the state file, None if disabled.
+        :type state_path: Optional[str]
+        :returns: Exported database with "complete" item, or None.
+        :rtype: Optional[dict]
+        """
+        if not state_path or not os.path.isfile(state_path):
+            return None
+        try:
+            with open(state_path, u"rt", encoding=u"utf-8") as file_in:
+                state = json.load(file_in)
+            age = time.time() - state.get(u"timestamp", 0.0)
+            if age > Constants.PERF_MLRSEARCH_STATE_MAX_AGE:
+                logger.debug(f"Ignoring MLRsearch state {state_path}: "
+                             f"{age:.0f} seconds old")
+            elif u"results" in state and u"complete" in state:
+                return state
+        except (AttributeError, OSError, TypeError, ValueError) as err:
+            logger.debug(f"Ignoring MLRsearch state {state_path}: {err!r}")
+        return None
+
+    @staticmethod
+    def _remove_mlr_state(state_path):
+        """Remove MLRsearch state, so it is not used again.
+
+        Failure to remove is logged, but does not fail the test.
+
+        :param state_path: Path to the state file.
+        :type state_path: str
+        """
+        try:
+            os.remove(state_path)
+        except OSError as err:
+            logger.debug(f"Failed to remove MLRsearch state: {err!r}")
+
+    @staticmethod
+    def _save_mlr_state(state_path, state):
+        """Store MLRsearch state, atomically replacing the previous one.
+
+        Failure to store is logged, but does not fail the test.
+
+        :param state_path: Path to the state file.
+        :param state: Exported results with "complete", "timestamp"
+            and build identification items.
+        :type state_path: str
+        :type state: dict
+        """
+        try:
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+            temp_path = f"{state_path}.{os.getpid()}.tmp"
+            with open(temp_path, u"wt", encoding=u"utf-8") as file_out:
+                json.dump(state, file_out)
+            os.replace(temp_path, state_path)
+        except OSError as err:
+            logger.debug(f"Failed to store MLRsearch state: {err!r}")
+
     @staticmethod
     def perform_soak_search(
             frame_size,
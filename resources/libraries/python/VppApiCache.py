@@ -0,0 +1,236 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Library for caching VPP API files on the machine running Robot.
+
+Without a cache, every Robot process has to pack PAPI code
+and .api.json files on DUT, copy them over and parse all .api.json files
+just to initialize CRC checking.
+As the files only change when a different VPP build is installed,
+the result can be kept on disk and shared between processes.
+
+Each cache entry is a directory named by VPP version and a hash
+of the content of the remote files (so different builds of the same version
+do not collide). Besides the extracted files, the entry contains
+a pre-parsed message table (see VppApiCrcChecker.read_message_table),
+which doubles as a marker of a complete entry.
+Modification time of the marker is updated on each use,
+entries not used recently are evicted (LRU) when there are too many.
+
+Entries are created under a temporary name and renamed when complete,
+so parallel Robot processes never see partially extracted entries.
+"""
+
+import glob
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from robot.api import logger
+
+from resources.libraries.python.Constants import Constants
+from resources.libraries.python.FileTransfer import fetch_paths
+from resources.libraries.python.ssh import exec_cmd_no_error
+from resources.libraries.python.VppApiCrc import VppApiCrcChecker
+
+
+__all__ = [
+    "API_JSON_DIR",
+    "INSTALLED_PAPI_GLOB",
+    "VppApiCache",
+    "download_api_files",
+]
+
+
+API_JSON_DIR = "/usr/share/vpp/api"
+"""Where VPP installs .api.json files on DUT."""
+INSTALLED_PAPI_GLOB = "/usr/lib/python3*/*-packages/vpp_papi"
+"""Papi python version depends on OS (and time).
+Python 3.4 or higher, site-packages or dist-packages."""
+MESSAGE_TABLE_FILE = "message_table.json"
+"""Name of the file with pre-parsed messages, also marks complete entries."""
+
+
+def download_api_files(node, root_path):
+    """Download Python part of VPP installation from node.
+
+    The files are extracted into root_path, keeping their absolute paths
+    (relative to root_path), so for example .api.json files end up
+    in root_path + API_JSON_DIR.
+    The files are streamed as a gzip compressed tar (much faster
+    to create than xz), no intermediate files are stored on either side.
+
+    :param node: DUT node to copy the files from.
+    :param root_path: Local directory to extract the files into.
+    :type node: dict
+    :type root_path: str
+    """
+    fetch_paths(
+        node, [INSTALLED_PAPI_GLOB, API_JSON_DIR], root_path,
+        excludes=["*.pyc"]
+    )
+
+
+class VppApiCache:
+    """Content-addressed on-disk cache of VPP API files and parsed messages.
+
+    The recommended way of use is:
+
+        root_path, message_table = VppApiCache().ensure_entry(node)
+        crc_checker = VppApiCrcChecker(
+            root_path + API_JSON_DIR, message_table=message_table
+        )
+    """
+
+    def __init__(
+        self,
+        cache_dir=Constants.PAPI_CACHE_DIR,
+        max_entries=Constants.PAPI_CACHE_SIZE,
+    ):
+        """Store the arguments.
+
+        :param cache_dir: Local directory holding the cache entries.
+        :param max_entries: How many entries to keep when evicting.
+        :type cache_dir: str
+        :type max_entries: int
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max(1, max_entries)
+
+    @staticmethod
+    def get_entry_key(node):
+        """Compute cache key for VPP API files installed on the node.
+
+        A single remote command is executed, it reports the installed
+        VPP package version and computes a hash over content
+        of all files that would be downloaded.
+
+        :param node: DUT node to compute the key for.
+        :type node: dict
+        :returns: Key usable as a directory name.
+        :rtype: str
+        :raises RuntimeError: If the remote command fails.
+        """
+        # Single quotes would break the bash wrapping, so none are used here.
+        inner_cmd = (
+            "(dpkg-query -W vpp || rpm -q vpp) 2>/dev/null | head -n 1;"
+            f" find {API_JSON_DIR} {INSTALLED_PAPI_GLOB} -type f"
+            " ! -name \\*.pyc | sort | xargs sha256sum | sha256sum"
+        )
+        stdout, _ = exec_cmd_no_error(
+            node, ["bash", "-c", f"'set -o pipefail; {inner_cmd}'"],
+            message="Failed to compute VPP API manifest hash.",
+        )
+        lines = stdout.strip().splitlines()
+        manifest_hash = lines[-1].split()[0]
+        version = lines[0].split()[-1] if len(lines) > 1 else "unknown"
+        version = re.sub(r"[^A-Za-z0-9.+~-]", "_", version)
+        return f"{version}-{manifest_hash[:16]}"
+
+    def _lookup(self, key):
+        """Return message table if a complete entry exists, mark it as used.
+
+        :param key: Cache key as returned by get_entry_key.
+        :type key: str
+        :returns: Message table, or None on cache miss.
+        :rtype: Optional[list]
+        """
+        marker = os.path.join(self.cache_dir, key, MESSAGE_TABLE_FILE)
+        try:
+            with open(marker, "rt", encoding="utf-8") as file_in:
+                message_table = json.load(file_in)
+            os.utime(marker)
+        except (OSError, ValueError):
+            return None
+        return message_table
+
+    def _create(self, node, key):
+        """Download and parse API files into a new entry, return the table.
+
+        The entry is built under a temporary name and renamed at the end.
+        If another process has created the same entry meanwhile,
+        the work done here is discarded.
+
+        :param node: DUT node to download the files from.
+        :param key: Cache key as returned by get_entry_key.
+        :type node: dict
+        :type key: str
+        :returns: Message table of the created entry.
+        :rtype: list
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix="tmp.", dir=self.cache_dir)
+        try:
+            download_api_files(node, tmp_path)
+            message_table = VppApiCrcChecker.read_message_table(
+                tmp_path + API_JSON_DIR
+            )
+            marker = os.path.join(tmp_path, MESSAGE_TABLE_FILE)
+            with open(marker, "wt", encoding="utf-8") as file_out:
+                json.dump(message_table, file_out)
+            os.rename(tmp_path, os.path.join(self.cache_dir, key))
+        except OSError:
+            # Rename failed as the entry exists now, use the existing one.
+            existing_table = self._lookup(key)
+            if existing_table is None:
+                raise
+            message_table = existing_table
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return message_table
+
+    def _evict(self, keep_key):
+        """Remove least recently used entries above the size limit.
+
+        :param keep_key: Key of the entry in use, never evicted.
+        :type keep_key: str
+        """
+        entries = list()
+        for path in glob.glob(os.path.join(self.cache_dir, "*")):
+            key = os.path.basename(path)
+            if key == keep_key or key.startswith("tmp."):
+                continue
+            try:
+                mtime = os.stat(os.path.join(path, MESSAGE_TABLE_FILE)).st_mtime
+            except OSError:
+                # Incomplete entry, evict first.
+                mtime = 0.0
+            entries.append((mtime, path))
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_entries - 1:]:
+            logger.debug(f"Evicting PAPI cache entry: {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    def ensure_entry(self, node):
+        """Make sure the cache contains API files of the node's VPP build.
+
+        :param node: DUT node to get the API files from.
+        :type node: dict
+        :returns: Local root path of the entry and the pre-parsed message table.
+        :rtype: Tuple[str, list]
+        """
+        time_start = time.monotonic()
+        key = self.get_entry_key(node)
+        message_table = self._lookup(key)
+        if message_table is None:
+            message_table = self._create(node, key)
+            self._evict(keep_key=key)
+            action = "created"
+        else:
+            action = "reused"
+        duration = time.monotonic() - time_start
+        logger.debug(f"PAPI cache entry {key} {action} in {duration}s.")
+        return os.path.join(self.cache_dir, key), message_table
@@ -45,14 +45,22 @@ class VppApiCrcChecker:
     For usual testing, it means "GLOBAL" scope."""
 
     def __init__(
-            self, directory, fail_on_mismatch=Constants.FAIL_ON_CRC_MISMATCH):
+            self, directory, fail_on_mismatch=Constants.FAIL_ON_CRC_MISMATCH,
+            message_table=None):
         """Initialize empty state, then register known collections.
 
         This also scans directory for .api.json files
         and performs initial checks, but does not report the findings yet.
 
+        If message_table is given (e.g. loaded from cache),
+        the directory is not scanned and the table is processed instead.
+
         :param directory: Root directory of the search for .api.json files.
+        :param fail_on_mismatch: Whether mismatch raises or just logs.
+        :param message_table: Pre-parsed output of read_message_table.
         :type directory: str
+        :type fail_on_mismatch: bool
+        :type message_table: Optional[list]
         """
 
         self.fail_on_mismatch = fail_on_mismatch
@@ -102,7 +110,9 @@ class VppApiCrcChecker:
 
         self._initial_conflicts_reported = False
         self._register_all()
-        self._check_dir(directory)
+        if message_table is None:
+            message_table = self.read_message_table(directory)
+        self._check_table(message_table)
 
     def log_and_raise(self, exc_msg):
         """Log to console, on fail_on_mismatch also raise runtime exception.
@@ -263,20 +273,20 @@ class VppApiCrcChecker:
         # but CRC does not match any. This has to be reported.
         self._reported[api_name] = crc
 
-    def _check_dir(self, directory):
-        """Parse every .api.json found under directory, remember conflicts.
-
-        As several collections are supported, each conflict invalidates
-        some of them, failure happens only when no collections would be left.
-        In that case, set of collections just before the failure is preserved,
-        the _reported mapping is filled with conflicting APIs.
-        The _found mapping is filled with discovered api names and crcs.
+    @classmethod
+    def read_message_table(cls, directory):
+        """Parse every .api.json found under directory, return message data.
 
-        The exception is not thrown here, but from report_initial_conflicts.
+        The returned table contains only JSON-serializable values,
+        so it can be stored and used to create checker instances
+        without parsing the .api.json files again.
 
         :param directory: Root directory of the search for .api.json files.
         :type directory: str
+        :returns: List of [name, crc, options] items, one for each message.
+        :rtype: List[list]
         """
+        message_table = list()
         for root, _, files in os.walk(directory):
             for filename in files:
                 if not filename.endswith(u".api.json"):
@@ -286,14 +296,33 @@ class VppApiCrcChecker:
                 version = json_obj[u"options"].get(u"version", None)
                 msgs = json_obj[u"messages"]
                 for msg_obj in msgs:
-                    msg_name = self._get_name(msg_obj)
-                    msg_crc = self._get_crc(msg_obj)
-                    msg_options = self._get_options(msg_obj, version)
-                    self._process_crc(msg_name, msg_crc, msg_options)
+                    msg_name = cls._get_name(msg_obj)
+                    msg_crc = cls._get_crc(msg_obj)
+                    msg_options = cls._get_options(msg_obj, version)
+                    message_table.append([msg_name, msg_crc, msg_options])
+        return message_table
+
+    def _check_table(self, message_table):
+        """Process every parsed message, remember conflicts.
+
+        As several collections are supported, each conflict invalidates
+        some of them, failure happens only when no collections would be left.
+        In that case, set of collections just before the failure is preserved,
+        the _reported mapping is filled with conflicting APIs.
+        The _found mapping is filled with discovered api names and crcs.
+
+        The exception is not thrown here, but from report_initial_conflicts.
+
+        :param message_table: Output of read_message_table.
+        :type message_table: List[list]
+        """
+        for msg_name, msg_crc, msg_options in message_table:
+            # Options get mutated later, do not modify the caller's table.
+            self._process_crc(msg_name, msg_crc, dict(msg_options))
         logger.console(f"Surviving CRC collections: {self._expected.keys()!r}")
 
     def report_initial_conflicts(self, report_missing=False):
-        """Report issues discovered by _check_dir, if not done that already.
+        """Report issues discovered by _check_table, if not done that already.
 
         Intended use: Call once after init, at a time when throwing exception
         is convenient.
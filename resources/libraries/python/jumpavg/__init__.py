@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -19,4 +19,6 @@ from .avg_stdev_stats import AvgStdevStats
 from .bit_counting_stats import BitCountingStats
 from .bit_counting_group import BitCountingGroup
 from .bit_counting_group_list import BitCountingGroupList
-from .classify import classify
+from .classify import classify, classify_unpruned
+from .classify_state import ClassifyState
+from .incremental_classifier import IncrementalClassifier
@@ -1,4 +1,4 @@
-# Copyright (c) 2023 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -18,12 +18,124 @@ Classification is one of primary purposes of this package.
 Minimal message length principle is used
 for grouping results into the list of groups,
 assuming each group is a population of different Gaussian distribution.
+
+The classify function uses IncrementalClassifier, which gives the same
+result as the straightforward quadratic search (kept as classify_unpruned
+for comparison), but skips work on group lists which cannot win.
 """
 
-from typing import Iterable, Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 from .avg_stdev_stats import AvgStdevStats
 from .bit_counting_group_list import BitCountingGroupList
+from .incremental_classifier import IncrementalClassifier
+
+
+def _process_values(
+    values: Iterable[Union[float, Iterable[float]]],
+    max_value: float = 0.0,
+    min_value: float = 0.0,
+    samples: int = 0,
+) -> Tuple[List[Union[float, AvgStdevStats]], float, float, int]:
+    """Turn iterable values into stats, find the range and sample count.
+
+    The extremes and the count can be continued from previous values.
+
+    :param values: Sequence of runs to classify.
+    :param max_value: Maximal sample value seen before.
+    :param min_value: Minimal sample value seen before, ignored if no samples.
+    :param samples: Number of samples seen before.
+    :type values: Iterable[Union[float, Iterable[float]]]
+    :type max_value: float
+    :type min_value: float
+    :type samples: int
+    :returns: Processed runs, max value, min value and sample count.
+    :rtype: Tuple[List[Union[float, AvgStdevStats]], float, float, int]
+    """
+    processed_values = []
+    for value in values:
+        if isinstance(value, (float, int)):
+            if value > max_value:
+                max_value = value
+            if value < min_value or not samples:
+                min_value = value
+            samples += 1
+            processed_values.append(value)
+        else:
+            for subvalue in value:
+                if subvalue > max_value:
+                    max_value = subvalue
+                if subvalue < min_value or not samples:
+                    min_value = subvalue
+                samples += 1
+            processed_values.append(AvgStdevStats.for_runs(value))
+    return processed_values, max_value, min_value, samples
+
+
+def _compute_unit(
+    max_value: float,
+    unit: Optional[float] = None,
+    sbps: Optional[float] = None,
+) -> float:
+    """Return the unit if set, or compute it from max value and sbps.
+
+    :param max_value: Maximal sample value.
+    :param unit: Typical resolution of the values.
+    :param sbps: Significant Bits Per Sample.
+    :type max_value: float
+    :type unit: Optional[float]
+    :type sbps: Optional[float]
+    :returns: The unit to use.
+    :rtype: float
+    """
+    if not unit:
+        if not sbps:
+            sbps = 12.0
+        max_in_units = pow(2.0, sbps + 1.0) - 1.0
+        unit = max_value / max_in_units
+    return unit
+
+
+def _is_prunable(
+    processed_values: List[Union[float, AvgStdevStats]],
+    max_value: float,
+    unit: float,
+) -> bool:
+    """Return whether IncrementalClassifier can handle the values.
+
+    The pruning bound assumes positive sizes and values.
+    Degenerate inputs are left to the unpruned search, to handle or fail.
+
+    :param processed_values: Runs as floats or stats.
+    :param max_value: Maximal sample value.
+    :param unit: Typical resolution of the values.
+    :type processed_values: List[Union[float, AvgStdevStats]]
+    :type max_value: float
+    :type unit: float
+    :returns: False if the unpruned search has to be used.
+    :rtype: bool
+    """
+    if max_value <= 0.0 or unit <= 0.0:
+        return False
+    return not any(
+        isinstance(value, AvgStdevStats) and value.size < 1
+        for value in processed_values
+    )
+
+
+def _set_comments(record_glist: BitCountingGroupList) -> None:
+    """Mark groups as regressions or progressions based on their averages.
+
+    :param record_glist: Classified group list to mutate.
+    :type record_glist: BitCountingGroupList
+    """
+    previous_average = record_glist[0].stats.avg
+    for group in record_glist:
+        if group.stats.avg < previous_average:
+            group.comment = "regression"
+        elif group.stats.avg > previous_average:
+            group.comment = "progression"
+        previous_average = group.stats.avg
 
 
 def classify(
@@ -60,23 +172,36 @@ def classify(
     :returns: Classified group list.
     :rtype: BitCountingGroupList
     """
-    processed_values = []
-    max_value = 0.0
-    for value in values:
-        if isinstance(value, (float, int)):
-            if value > max_value:
-                max_value = value
-            processed_values.append(value)
-        else:
-            for subvalue in value:
-                if subvalue > max_value:
-                    max_value = subvalue
-            processed_values.append(AvgStdevStats.for_runs(value))
-    if not unit:
-        if not sbps:
-            sbps = 12.0
-        max_in_units = pow(2.0, sbps + 1.0) - 1.0
-        unit = max_value / max_in_units
+    processed_values, max_value, min_value, samples = _process_values(values)
+    unit = _compute_unit(max_value, unit, sbps)
+    if not _is_prunable(processed_values, max_value, unit):
+        return _classify_processed(processed_values, max_value, unit)
+    classifier = IncrementalClassifier(
+        max_value=max_value, min_value=min_value, unit=unit, max_size=samples
+    )
+    for value in processed_values:
+        classifier.append(value)
+    record_glist = classifier.group_list()
+    _set_comments(record_glist)
+    return record_glist
+
+
+def _classify_processed(
+    processed_values: List[Union[float, AvgStdevStats]],
+    max_value: float,
+    unit: float,
+) -> BitCountingGroupList:
+    """Perform the unpruned search on preprocessed values.
+
+    :param processed_values: Runs as floats or stats.
+    :param max_value: Maximal sample value.
+    :param unit: Typical resolution of the values.
+    :type processed_values: List[Union[float, AvgStdevStats]]
+    :type max_value: float
+    :type unit: float
+    :returns: Classified group list.
+    :rtype: BitCountingGroupList
+    """
     # Glist means group list (BitCountingGroupList).
     open_glists = []
     record_glist = BitCountingGroupList(max_value=max_value, unit=unit)
@@ -88,11 +213,32 @@ def classify(
             if old_open_glist.bits < record_glist.bits:
                 record_glist = old_open_glist
         open_glists.append(new_open_glist)
-    previous_average = record_glist[0].stats.avg
-    for group in record_glist:
-        if group.stats.avg < previous_average:
-            group.comment = "regression"
-        elif group.stats.avg > previous_average:
-            group.comment = "progression"
-        previous_average = group.stats.avg
+    _set_comments(record_glist)
     return record_glist
+
+
+def classify_unpruned(
+    values: Iterable[Union[float, Iterable[float]]],
+    unit: Optional[float] = None,
+    sbps: Optional[float] = None,
+) -> BitCountingGroupList:
+    """Return the values in groups of optimal bit count, quadratic search.
+
+    This is the straightforward implementation, keeping one open group list
+    per value. It is slow for long inputs, but useful as a reference,
+    as the classify function is expected to return the same result.
+
+    :param values: Sequence of runs to classify.
+    :param unit: Typical resolution of the values.
+        Zero and None means no unit given.
+    :param sbps: Significant Bits Per Sample. None on zero means 12.
+        If units is not set, this is used to compute unit from max sample value.
+    :type values: Iterable[Union[float, Iterable[float]]]
+    :type unit: Optional[float]
+    :type sbps: Optional[float]
+    :returns: Classified group list.
+    :rtype: BitCountingGroupList
+    """
+    processed_values, max_value, _, _ = _process_values(values)
+    unit = _compute_unit(max_value, unit, sbps)
+    return _classify_processed(processed_values, max_value, unit)
@@ -0,0 +1,203 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module holding ClassifyState class."""
+
+import dataclasses
+import typing
+
+from .avg_stdev_stats import AvgStdevStats
+from .bit_counting_group_list import BitCountingGroupList
+from .classify import (
+    _classify_processed, _compute_unit, _is_prunable, _process_values,
+    _set_comments
+)
+from .incremental_classifier import IncrementalClassifier
+
+
+@dataclasses.dataclass
+class ClassifyState:
+    """Resumable state of classify, for series which only get new values.
+
+    The result of extend (or update) is always the same as the result
+    of classify called on all the values seen so far (with the same
+    unit and sbps), but the search state is kept between calls,
+    so classifying after new values are appended only costs
+    time proportional to the new values (and surviving open group lists).
+
+    The search depends on max value, unit (computed from max value
+    if not given) and min value, if a new value changes any of them,
+    or if the number of samples exceeds what the pruning bound
+    was computed for, the search is restarted from the stored runs.
+
+    Use to_dict and from_dict to store the state, the dict
+    is JSON serializable (if the values are).
+    """
+
+    unit: typing.Optional[float] = None
+    """Typical resolution of the values, as in classify."""
+    sbps: typing.Optional[float] = None
+    """Significant Bits Per Sample, as in classify."""
+    runs: typing.List[typing.Union[float, AvgStdevStats]] = None
+    """Processed values seen so far. None in init means an empty list."""
+    max_value: float = 0.0
+    """Maximal sample value seen so far."""
+    min_value: float = 0.0
+    """Minimal sample value seen so far, meaningless if no samples."""
+    samples: int = 0
+    """Number of samples seen so far."""
+    classifier: typing.Optional[IncrementalClassifier] = None
+    """The search state, None if it needs to be restarted."""
+
+    def __post_init__(self):
+        """Turn possible None into an empty list."""
+        if self.runs is None:
+            self.runs = []
+
+    def __len__(self) -> int:
+        """Return the number of runs (values) seen so far.
+
+        :returns: The length of runs.
+        :rtype: int
+        """
+        return len(self.runs)
+
+    def extend(
+        self, values: typing.Iterable[typing.Union[float, typing.Iterable]]
+    ) -> BitCountingGroupList:
+        """Add values to the series, return the classification of all.
+
+        :param values: New runs to append, in the classify format.
+        :type values: Iterable[Union[float, Iterable[float]]]
+        :returns: Classified group list of all values seen so far.
+        :rtype: BitCountingGroupList
+        """
+        processed_values, max_value, min_value, samples = _process_values(
+            values, self.max_value, self.min_value, self.samples
+        )
+        self.runs.extend(processed_values)
+        classifier = self.classifier
+        unit = _compute_unit(max_value, self.unit, self.sbps)
+        if classifier is not None and (
+            max_value != classifier.max_value
+            or min_value < classifier.min_value
+            or unit != classifier.unit
+            or samples > classifier.max_size
+        ):
+            classifier = None
+        self.max_value = max_value
+        self.min_value = min_value
+        self.samples = samples
+        if classifier is None:
+            if not _is_prunable(self.runs, max_value, unit):
+                self.classifier = None
+                return _classify_processed(list(self.runs), max_value, unit)
+            # Headroom, so appending does not restart too often.
+            classifier = IncrementalClassifier(
+                max_value=max_value,
+                min_value=min_value,
+                unit=unit,
+                max_size=2 * samples + 100,
+            )
+            processed_values = self.runs
+        elif not _is_prunable(processed_values, max_value, unit):
+            self.classifier = None
+            return _classify_processed(list(self.runs), max_value, unit)
+        for value in processed_values:
+            classifier.append(value)
+        self.classifier = classifier
+        record_glist = classifier.group_list()
+        _set_comments(record_glist)
+        return record_glist
+
+    def update(
+        self, values: typing.Sequence[typing.Union[float, typing.Iterable]]
+    ) -> BitCountingGroupList:
+        """Classify all values, reusing the state if they extend the runs.
+
+        If the values seen so far are not a prefix of the given values
+        (e.g. old builds got removed), the state is reset first.
+
+        :param values: All runs of the series, in the classify format.
+        :type values: Sequence[Union[float, Iterable[float]]]
+        :returns: Classified group list of the values.
+        :rtype: BitCountingGroupList
+        """
+        known = len(self.runs)
+        if known > len(values) or any(
+            run != (value if isinstance(value, (float, int))
+                    else AvgStdevStats.for_runs(value))
+            for run, value in zip(self.runs, values)
+        ):
+            self.reset()
+            known = 0
+        return self.extend(values[known:])
+
+    def reset(self) -> None:
+        """Forget all values, keep unit and sbps."""
+        self.runs = []
+        self.max_value = 0.0
+        self.min_value = 0.0
+        self.samples = 0
+        self.classifier = None
+
+    def to_dict(self) -> dict:
+        """Return JSON serializable state, usable in from_dict.
+
+        Runs which are stats are stored as dicts.
+
+        :returns: The state as a dict.
+        :rtype: dict
+        """
+        return dict(
+            unit=self.unit,
+            sbps=self.sbps,
+            runs=[
+                run if isinstance(run, (float, int))
+                else dataclasses.asdict(run)
+                for run in self.runs
+            ],
+            max_value=self.max_value,
+            min_value=self.min_value,
+            samples=self.samples,
+            classifier=(
+                None if self.classifier is None
+                else self.classifier.to_dict()
+            ),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ClassifyState":
+        """Return a new instance with the state from to_dict.
+
+        :param data: The state as returned by to_dict.
+        :type data: dict
+        :returns: The restored instance.
+        :rtype: ClassifyState
+        """
+        runs = [
+            run if isinstance(run, (float, int)) else AvgStdevStats(**run)
+            for run in data["runs"]
+        ]
+        classifier = data["classifier"]
+        if classifier is not None:
+            classifier = IncrementalClassifier.from_dict(classifier, runs)
+        return cls(
+            unit=data["unit"],
+            sbps=data["sbps"],
+            runs=runs,
+            max_value=data["max_value"],
+            min_value=data["min_value"],
+            samples=data["samples"],
+            classifier=classifier,
+        )
@@ -0,0 +1,452 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module holding IncrementalClassifier class.
+
+The straightforward classification keeps one open group list per value
+seen so far, and appends every new value to each of them.
+That makes it quadratic in both time and memory.
+
+This implementation performs the same search, producing identical results
+(including bit counts, to the last bit of the float), but:
+
+- Open group lists are tracked as a few floats (stats of the last group,
+  and bit count of the previous groups), real group objects are created
+  only for the final result.
+- Open group lists which can never become the record again are pruned,
+  using a bound in the spirit of PELT algorithm.
+
+The bound is explained in docstring of the _prune method.
+Pruning only helps if there are changes in the data,
+for stationary data the open group lists are kept (as any of them
+can still win), but the cheaper tracking still applies.
+"""
+
+import math
+import typing
+
+from .avg_stdev_stats import AvgStdevStats
+from .bit_counting_group import BitCountingGroup
+from .bit_counting_group_list import BitCountingGroupList
+
+
+LN2 = math.log(2)
+"""Value used to convert natural logarithm to bits, as in BitCountingStats."""
+GAUSS_BITS = 0.5 * math.log(2 * math.pi * math.e, 2)
+"""Per sample information content of unit Gaussian (beyond stdev bits)."""
+PRUNE_SLACK = 1.0
+"""Bits added to the pruning bound, to tolerate float rounding errors."""
+
+
+class _Candidate:
+    """Open group list, represented by its last group and other bits.
+
+    The stats are the same as in the BitCountingGroup object (including
+    the same rounding errors), other fields are constant for the candidate.
+    """
+
+    __slots__ = (
+        "start", "size", "avg", "stdev", "prev_avg", "prev_unit", "norm",
+        "bits_except_last", "last_bits", "bits"
+    )
+
+    def __init__(self, start, size, avg, stdev, prev_avg, bits_except_last):
+        """Store the values, leave the cached and computed values unset.
+
+        :param start: Index of the first run of the last group.
+        :param size: Number of samples in the last group.
+        :param avg: Average of samples in the last group.
+        :param stdev: Standard deviation of samples in the last group.
+        :param prev_avg: Average of the previous group, None if first.
+        :param bits_except_last: Bit count of all groups except the last.
+        :type start: int
+        :type size: int
+        :type avg: float
+        :type stdev: float
+        :type prev_avg: Optional[float]
+        :type bits_except_last: float
+        """
+        self.start = start
+        self.size = size
+        self.avg = avg
+        self.stdev = stdev
+        self.prev_avg = prev_avg
+        self.prev_unit = None
+        self.norm = None
+        self.bits_except_last = bits_except_last
+        self.last_bits = None
+        self.bits = None
+
+
+class IncrementalClassifier:
+    """Classification search which accepts the runs one by one.
+
+    Max value and unit (and also min value, used for pruning)
+    have to be known beforehand, as they affect bit counts of all groups.
+    Also the maximal number of samples is needed, for the pruning bound.
+
+    Runs are either floats, or AvgStdevStats instances.
+    Sizes of runs and of the overall data have to be positive,
+    the classify function handles other cases using the unpruned search.
+    """
+
+    def __init__(
+        self,
+        max_value: float,
+        min_value: float,
+        unit: float,
+        max_size: int,
+    ) -> None:
+        """Precompute values depending only on the arguments.
+
+        :param max_value: Maximal sample value, positive.
+        :param min_value: Minimal sample value.
+        :param unit: Typical resolution of the values, positive.
+        :param max_size: Upper bound on the number of samples.
+        :type max_value: float
+        :type min_value: float
+        :type unit: float
+        :type max_size: int
+        """
+        self.max_value = max_value
+        self.min_value = min_value
+        self.unit = unit
+        self.max_size = max(1, max_size)
+        self.runs = []
+        """All runs added so far."""
+        self.samples = 0
+        """Number of samples in the runs added so far."""
+        self.candidates = []
+        """Open group lists not pruned yet, ordered by start."""
+        self.records = []
+        """Last group of the record group list, after each run.
+        The tuple is start, size, avg, stdev, prev_avg, bits and
+        bits_except_last, as needed to reconstruct the group list."""
+        # The rest are caches.
+        self._max_unit = max_value / unit
+        self._first_bits = math.log(self._max_unit + 1, 2)
+        self._cutoff_bits = math.log(1 - 1 / (self._max_unit + 2), 2)
+        self._size_bits = [0.0]
+        self._sphere_head = [0.0]
+        self._sphere_tail = [0.0]
+        self._init_bound()
+
+    def _init_bound(self) -> None:
+        """Compute parts of the pruning bound depending only on the range."""
+        range_unit = (self.max_value - self.min_value) / self.unit
+        half_range = range_unit / 2
+        # Information content of size and of the samples around the avg,
+        # except the parts depending on stdev, as a function of size.
+        sample_bits = [0.0, -GAUSS_BITS]
+        for size in range(2, self.max_size + 1):
+            sphere = LN2 + math.log(math.pi) * ((size - 1) / 2)
+            sphere -= math.lgamma((size - 1) / 2)
+            sphere += math.log(size) * ((size - 2) / 2)
+            sample_bits.append(sphere / LN2 - GAUSS_BITS * size)
+        self._sample_bits = sample_bits
+        self._sample_floor = min(sample_bits[1:])
+        self._sample_span = max(sample_bits[1:]) - self._sample_floor
+        self._range_bits = math.log(range_unit + 1, 2)
+        self._bound_base = PRUNE_SLACK + self._sample_span
+        self._bound_base += math.log((half_range + 1) * (half_range + 2), 2)
+        self._bound_base += 2 * math.log(half_range + 1, 2) - 1.0
+
+    def _extend_caches(self, size: int) -> None:
+        """Make sure per-size parts of bit count are cached up to size.
+
+        :param size: The largest size to cache values for.
+        :type size: int
+        """
+        size_bits = self._size_bits
+        sphere_head = self._sphere_head
+        sphere_tail = self._sphere_tail
+        for new_size in range(len(size_bits), size + 1):
+            size_bits.append(math.log(new_size * (new_size + 1), 2))
+            head = math.log(2)
+            head += math.log(math.pi) * ((new_size - 1) / 2)
+            if new_size > 1:
+                head -= math.lgamma((new_size - 1) / 2)
+            sphere_head.append(head)
+            sphere_tail.append(math.log(new_size) * ((new_size - 2) / 2))
+
+    def _group_bits(self, cand: _Candidate) -> float:
+        """Return bits of the last group, as BitCountingGroup would compute.
+
+        The group is not copied, but the stats are "copied" the same way,
+        so that the rounding errors match.
+        The order of operations is the same as in BitCountingStats,
+        only terms depending on size or the previous avg are cached.
+
+        :param cand: The candidate to compute the last group bits for.
+        :type cand: _Candidate
+        :returns: Information content of the last group.
+        :rtype: float
+        """
+        size = cand.size
+        # AvgStdevStats.for_runs([stats])
+        avg = 0.0 + (cand.avg - 0.0) * size / size
+        stdev = math.sqrt((0.0 + cand.stdev * cand.stdev * size) / size)
+        unit = self.unit
+        bits = self._size_bits[size]
+        if cand.prev_avg is None:
+            bits += self._first_bits
+        else:
+            if cand.norm is None:
+                prev_avg = cand.prev_avg / unit
+                max_value = self._max_unit
+                norm = prev_avg * prev_avg
+                norm -= (prev_avg - 1) * max_value
+                norm += max_value * max_value / 2
+                cand.prev_unit = prev_avg
+                cand.norm = norm
+            bits -= math.log(
+                (abs(avg / unit - cand.prev_unit) + 1) / cand.norm, 2
+            )
+        if size < 2:
+            return bits
+        stdev /= unit
+        bits += math.log((stdev + 1) * (stdev + 2), 2)
+        bits += self._cutoff_bits
+        sphere_area_ln = self._sphere_head[size]
+        sphere_area_ln += math.log(stdev + 1) * (size - 2)
+        sphere_area_ln += self._sphere_tail[size]
+        bits += sphere_area_ln / LN2
+        return bits
+
+    def _prune(self, record: _Candidate) -> None:
+        """Remove candidates which cannot become the record again.
+
+        Let F(i) be bits of the record after run i, and let open candidate j
+        (with the last group G1 starting at j) have bits B_j(i) >= F(i).
+        Any later candidate starting at i+1 splits the group G1+G2
+        of candidate j into G1 and G2, with the rest being the same.
+        Its bits are F(i) + bits(G2), where G2 has previous average q
+        equal to the record's last group average.
+
+        Candidate j cannot win at any later step if its bits exceed F(i)
+        by more than the maximal possible difference
+        bits(G1) + bits(G2) - bits(G1+G2), considering the prev avg of G2
+        and the merged group is different. That difference is bounded
+        by a sum of terms, each depending on G1 only or being constant
+        (for the value range and max size):
+
+        - size bits of G1, as size bits of G2 do not exceed the merged.
+        - the sample bits of G1, plus span of sample bits over all sizes.
+        - avg bits of G1 compared to the widest avg coding,
+          plus the normalization of G2 avg coding (depending on q).
+        - stdev bits of G1, plus the maximal stdev bits of G2,
+          minus the minimal stdev bits of the merged group.
+        - sphere radius bits, twice their maximum minus twice those of G1,
+          as log(stdev + 1) is concave and stdev of merged group
+          is at least the weighted average of stdevs of the parts.
+
+        As the bound of the difference is never below a floor value,
+        the exact bound is only computed for candidates above the floor.
+
+        :param record: The current record candidate.
+        :type record: _Candidate
+        """
+        record_bits = record.bits
+        # Average of the copied record last group, as in copy_fast.
+        prev_avg = 0.0 + (record.avg - 0.0) * record.size / record.size
+        prev_avg /= self.unit
+        max_value = self._max_unit
+        norm = prev_avg * prev_avg
+        norm -= (prev_avg - 1) * max_value
+        norm += max_value * max_value / 2
+        base = record_bits + self._bound_base + math.log(norm, 2)
+        floor = base + 1.0 + self._sample_floor
+        kept = []
+        for cand in self.candidates:
+            if cand.bits <= floor:
+                kept.append(cand)
+                continue
+            size = cand.size
+            bound = base + self._size_bits[size] + self._sample_bits[size]
+            if cand.prev_avg is not None:
+                bound += self._range_bits
+                bound -= math.log(
+                    abs(cand.avg - cand.prev_avg) / self.unit + 1, 2
+                )
+            if size > 1:
+                stdev = cand.stdev / self.unit
+                bound += math.log((stdev + 2) / (stdev + 1), 2)
+            if cand.bits <= bound:
+                kept.append(cand)
+        self.candidates = kept
+
+    def append(self, run: typing.Union[float, AvgStdevStats]) -> None:
+        """Process one more run, update the record.
+
+        :param run: The run to append.
+        :type run: Union[float, AvgStdevStats]
+        """
+        index = len(self.runs)
+        self.runs.append(run)
+        if isinstance(run, (float, int)):
+            run_size = 1
+            run_avg = run
+            run_stdev = 0.0
+        else:
+            run_size = run.size
+            run_avg = run.avg
+            run_stdev = run.stdev
+        self.samples += run_size
+        self._extend_caches(self.samples)
+        if self.records:
+            _, size, avg, _, _, bits, bits_except_last = self.records[-1]
+            prev_avg = 0.0 + (avg - 0.0) * size / size
+            bits_except_last += bits
+        else:
+            prev_avg = None
+            bits_except_last = 0.0
+        stats = AvgStdevStats.for_runs([run])
+        new_cand = _Candidate(
+            index, stats.size, stats.avg, stats.stdev, prev_avg,
+            bits_except_last
+        )
+        new_cand.last_bits = self._group_bits(new_cand)
+        new_cand.bits = bits_except_last + new_cand.last_bits
+        record = new_cand
+        record_bits = new_cand.bits
+        sqrt = math.sqrt
+        group_bits = self._group_bits
+        for cand in self.candidates:
+            # Same operations as AvgStdevStats.for_runs([stats, run]).
+            old_size = cand.size
+            total_avg = 0.0 + (cand.avg - 0.0) * old_size / old_size
+            moment_2 = 0.0 + cand.stdev * cand.stdev * old_size
+            delta = run_avg - total_avg
+            total_size = old_size + run_size
+            total_avg += delta * run_size / total_size
+            moment_2 += run_stdev * run_stdev * run_size
+            moment_2 += delta * delta * old_size * run_size / total_size
+            cand.size = total_size
+            cand.avg = total_avg
+            cand.stdev = sqrt(moment_2 / total_size)
+            cand.last_bits = group_bits(cand)
+            cand.bits = cand.bits_except_last + cand.last_bits
+            if cand.bits < record_bits:
+                record = cand
+                record_bits = cand.bits
+        self.candidates.append(new_cand)
+        self.records.append((
+            record.start, record.size, record.avg, record.stdev,
+            record.prev_avg, record.last_bits, record.bits_except_last,
+        ))
+        self._prune(record)
+
+    def to_dict(self) -> dict:
+        """Return JSON serializable state, without the runs.
+
+        The runs are left out, as the owner usually has them stored anyway.
+
+        :returns: The state of the search, usable in from_dict.
+        :rtype: dict
+        """
+        return dict(
+            max_value=self.max_value,
+            min_value=self.min_value,
+            unit=self.unit,
+            max_size=self.max_size,
+            samples=self.samples,
+            candidates=[
+                [
+                    cand.start, cand.size, cand.avg, cand.stdev,
+                    cand.prev_avg, cand.bits_except_last
+                ]
+                for cand in self.candidates
+            ],
+            records=[list(record) for record in self.records],
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict,
+        runs: typing.List[typing.Union[float, AvgStdevStats]],
+    ) -> "IncrementalClassifier":
+        """Return a new instance with the state from to_dict and the runs.
+
+        :param data: The state as returned by to_dict.
+        :param runs: The runs added before the state was saved.
+        :type data: dict
+        :type runs: List[Union[float, AvgStdevStats]]
+        :returns: The restored instance.
+        :rtype: IncrementalClassifier
+        :raises ValueError: If the number of runs does not match the state.
+        """
+        if len(runs) != len(data["records"]):
+            raise ValueError(
+                f"Got {len(runs)} runs for {len(data['records'])} records."
+            )
+        ret_obj = cls(
+            max_value=data["max_value"],
+            min_value=data["min_value"],
+            unit=data["unit"],
+            max_size=data["max_size"],
+        )
+        ret_obj.runs = list(runs)
+        ret_obj.samples = data["samples"]
+        ret_obj.candidates = [
+            _Candidate(*fields) for fields in data["candidates"]
+        ]
+        ret_obj.records = [tuple(record) for record in data["records"]]
+        return ret_obj
+
+    def group_list(self) -> BitCountingGroupList:
+        """Construct the record group list, as classify would return it.
+
+        The groups are the same as in the unpruned search,
+        including the rounding errors from copying all but the last group.
+        Comments are not set.
+
+        :returns: The record group list, empty if no runs were added.
+        :rtype: BitCountingGroupList
+        """
+        groups = []
+        if not self.records:
+            return BitCountingGroupList(
+                max_value=self.max_value, unit=self.unit
+            )
+        end = len(self.runs)
+        record = self.records[-1]
+        bits_except_last = record[6]
+        copied = False
+        while 1:
+            start, size, avg, stdev, prev_avg, bits, _ = record
+            stats = AvgStdevStats(size=size, avg=avg, stdev=stdev)
+            if copied:
+                stats = AvgStdevStats.for_runs([stats])
+            groups.append(
+                BitCountingGroup(
+                    run_list=self.runs[start:end],
+                    max_value=self.max_value,
+                    unit=self.unit,
+                    prev_avg=prev_avg,
+                    stats=stats,
+                    cached_bits=bits,
+                )
+            )
+            if start < 1:
+                break
+            end = start
+            record = self.records[start - 1]
+            copied = True
+        groups.reverse()
+        return BitCountingGroupList(
+            max_value=self.max_value,
+            unit=self.unit,
+            group_list=groups,
+            bits_except_last=bits_except_last,
+        )
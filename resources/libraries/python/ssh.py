@@ -1,4 +1,4 @@
-# Copyright (c) 2022 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -14,12 +14,20 @@
 """Library for SSH connection management."""
 
 
+import os
+import select
 import socket
+import threading
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
 from io import StringIO
 from time import monotonic, sleep
+from typing import Optional
 
-from paramiko import RSAKey, SSHClient, AutoAddPolicy
+from paramiko import Channel, Message, RSAKey, SSHClient, AutoAddPolicy
+from paramiko.common import cMSG_CHANNEL_OPEN
 from paramiko.ssh_exception import SSHException, NoValidConnectionsError
 from robot.api import logger
 from scp import SCPClient, SCPException
@@ -27,7 +35,8 @@ from scp import SCPClient, SCPException
 from resources.libraries.python.OptionString import OptionString
 
 __all__ = [
-    u"exec_cmd", u"exec_cmd_no_error", u"SSH", u"SSHTimeout", u"scp_node"
+    u"exec_cmd", u"exec_cmd_no_error", u"exec_cmd_on_nodes", u"NodeCmdResult",
+    u"SSH", u"SSHTimeout", u"scp_node", u"UnixSocketForwarder",
 ]
 
 # TODO: load priv key
@@ -41,21 +50,34 @@ class SSH:
     """Contains methods for managing and using SSH connections."""
 
     __MAX_RECV_BUF = 10 * 1024 * 1024
+    __SELECT_CAP = 0.1
     __existing_connections = dict()
 
-    def __init__(self):
+    def __init__(self, pool=u""):
+        """Declare managed variables.
+
+        Connections are shared between instances with the same pool name.
+        A non-default pool is useful for long-lived users (e.g. socket
+        forwarding), so they are not affected when other code
+        disconnects (or reconnects) the default connection to the node.
+
+        :param pool: Name of the connection pool to use.
+        :type pool: str
+        """
         self._ssh = None
         self._node = None
+        self._pool = pool
 
-    @staticmethod
-    def _node_hash(node):
+    def _node_hash(self, node):
         """Get IP address and port hash from node dictionary.
 
         :param node: Node in topology.
         :type node: dict
-        :returns: IP address and port for the specified node.
+        :returns: IP address and port (and pool name) for the specified node.
         :rtype: int
         """
+        if self._pool:
+            return hash(frozenset([node[u"host"], node[u"port"], self._pool]))
         return hash(frozenset([node[u"host"], node[u"port"]]))
 
     def connect(self, node, attempts=5):
@@ -142,9 +164,20 @@ class SSH:
             f"Reconnecting peer done: {node[u'host']}, {node[u'port']}"
         )
 
-    def exec_command(self, cmd, timeout=10, log_stdout_err=True):
+    def exec_command(
+            self, cmd, timeout=10, log_stdout_err=True, line_callback=None):
         """Execute SSH command on a new channel on the connected Node.
 
+        The channel is waited on by select(), so the method returns
+        as soon as the command finishes. Output is accumulated
+        as a list of byte chunks and decoded once at the end.
+
+        If line_callback is given, stdout is not accumulated.
+        Instead, each complete line (decoded, without the newline)
+        is passed to the callback as soon as it arrives,
+        which suits long-running commands with large outputs.
+        Stderr is accumulated in any case.
+
         :param cmd: Command to run on the Node.
         :param timeout: Maximal time in seconds to wait until the command is
             done. If set to None then wait forever.
@@ -152,18 +185,18 @@ class SSH:
             and stderr are logged also if the return code is not zero
             independently of the value of log_stdout_err.
             Needed for calls outside Robot (e.g. from reservation script).
+        :param line_callback: If set, called with each line of stdout.
         :type cmd: str or OptionString
         :type timeout: int
         :type log_stdout_err: bool
-        :returns: return_code, stdout, stderr
+        :type line_callback: Optional[Callable[[str], None]]
+        :returns: return_code, stdout (empty if line_callback), stderr
         :rtype: tuple(int, str, str)
         :raises SSHTimeout: If command is not finished in timeout time.
         """
         if isinstance(cmd, (list, tuple)):
             cmd = OptionString(cmd)
         cmd = str(cmd)
-        stdout = u""
-        stderr = u""
         try:
             chan = self._ssh.get_transport().open_session(timeout=5)
             peer = self._ssh.get_transport().getpeername()
@@ -176,40 +209,74 @@ class SSH:
         logger.trace(f"exec_command on {peer} with timeout {timeout}: {cmd}")
 
         start = monotonic()
-        chan.exec_command(cmd)
-        while not chan.exit_status_ready() and timeout is not None:
-            if chan.recv_ready():
+        stdout_chunks = list()
+        stderr_chunks = list()
+        # Incomplete last line, used only with line_callback.
+        pending = b""
+
+        def read_available():
+            """Move all buffered data from channel to chunks or callback."""
+            nonlocal pending
+            while chan.recv_ready():
                 s_out = chan.recv(self.__MAX_RECV_BUF)
-                stdout += s_out.decode(encoding=u'utf-8', errors=u'ignore') \
-                    if isinstance(s_out, bytes) else s_out
-
-            if chan.recv_stderr_ready():
-                s_err = chan.recv_stderr(self.__MAX_RECV_BUF)
-                stderr += s_err.decode(encoding=u'utf-8', errors=u'ignore') \
-                    if isinstance(s_err, bytes) else s_err
-
-            duration = monotonic() - start
-            if duration > timeout:
-                raise SSHTimeout(
-                    f"Timeout exception during execution of command: {cmd}\n"
-                    f"Current contents of stdout buffer: "
-                    f"{stdout}\n"
-                    f"Current contents of stderr buffer: "
-                    f"{stderr}\n"
-                )
+                if line_callback is None:
+                    stdout_chunks.append(s_out)
+                    continue
+                *lines, pending = (pending + s_out).split(b"\n")
+                for line in lines:
+                    line_callback(
+                        line.decode(encoding=u"utf-8", errors=u"ignore")
+                    )
+            while chan.recv_stderr_ready():
+                stderr_chunks.append(chan.recv_stderr(self.__MAX_RECV_BUF))
+
+        def raise_timeout():
+            """Raise timeout exception with the output read so far.
+
+            :raises SSHTimeout: Always.
+            """
+            stdout = b"".join(stdout_chunks)
+            stderr = b"".join(stderr_chunks)
+            raise SSHTimeout(
+                f"Timeout exception during execution of command: {cmd}\n"
+                f"Current contents of stdout buffer: "
+                f"{stdout.decode(encoding=u'utf-8', errors=u'ignore')}\n"
+                f"Current contents of stderr buffer: "
+                f"{stderr.decode(encoding=u'utf-8', errors=u'ignore')}\n"
+            )
 
-            sleep(0.1)
+        chan.exec_command(cmd)
+        while not chan.exit_status_ready():
+            wait = None
+            if timeout is not None:
+                wait = start + timeout - monotonic()
+                if wait <= 0:
+                    raise_timeout()
+            if chan.eof_received:
+                # All output has arrived, only exit status is missing.
+                read_available()
+                if not chan.status_event.wait(wait):
+                    raise_timeout()
+                break
+            # Channel becomes readable on data, EOF or close.
+            # Arrival of exit status does not wake select up, the cap
+            # handles commands leaving background processes
+            # with stdout open (so no EOF arrives).
+            wait = self.__SELECT_CAP if wait is None else min(
+                wait, self.__SELECT_CAP
+            )
+            select.select([chan], [], [], wait)
+            read_available()
         return_code = chan.recv_exit_status()
-
-        while chan.recv_ready():
-            s_out = chan.recv(self.__MAX_RECV_BUF)
-            stdout += s_out.decode(encoding=u'utf-8', errors=u'ignore') \
-                if isinstance(s_out, bytes) else s_out
-
-        while chan.recv_stderr_ready():
-            s_err = chan.recv_stderr(self.__MAX_RECV_BUF)
-            stderr += s_err.decode(encoding=u'utf-8', errors=u'ignore') \
-                if isinstance(s_err, bytes) else s_err
+        read_available()
+        if line_callback is not None and pending:
+            line_callback(pending.decode(encoding=u"utf-8", errors=u"ignore"))
+        stdout = b"".join(stdout_chunks).decode(
+            encoding=u"utf-8", errors=u"ignore"
+        )
+        stderr = b"".join(stderr_chunks).decode(
+            encoding=u"utf-8", errors=u"ignore"
+        )
 
         duration = monotonic() - start
         logger.trace(f"exec_command on {peer} took {duration} seconds")
@@ -224,8 +291,36 @@ class SSH:
             )
         return return_code, stdout, stderr
 
+    def open_command_channel(self, cmd, timeout=10):
+        """Start command on a new channel, return the channel without waiting.
+
+        This is useful for long-lived remote processes communicating
+        over stdin and stdout of the channel. Caller is responsible
+        for closing the channel.
+
+        :param cmd: Command to run on the Node.
+        :param timeout: Timeout in seconds for blocking channel operations.
+        :type cmd: str or OptionString
+        :type timeout: int
+        :returns: Channel with the command started.
+        :rtype: paramiko.Channel
+        """
+        if isinstance(cmd, (list, tuple)):
+            cmd = OptionString(cmd)
+        cmd = str(cmd)
+        try:
+            chan = self._ssh.get_transport().open_session(timeout=5)
+        except (AttributeError, SSHException):
+            self._reconnect()
+            chan = self._ssh.get_transport().open_session(timeout=5)
+        chan.settimeout(timeout)
+        logger.trace(f"open_command_channel with timeout {timeout}: {cmd}")
+        chan.exec_command(cmd)
+        return chan
+
     def exec_command_sudo(
-            self, cmd, cmd_input=None, timeout=30, log_stdout_err=True):
+            self, cmd, cmd_input=None, timeout=30, log_stdout_err=True,
+            line_callback=None):
         """Execute SSH command with sudo on a new channel on the connected Node.
 
         :param cmd: Command to be executed.
@@ -233,10 +328,13 @@ class SSH:
         :param timeout: Timeout.
         :param log_stdout_err: If True, stdout and stderr are logged.
             Needed for calls outside Robot (e.g. from reservation script).
+        :param line_callback: If set, called with each line of stdout,
+            see exec_command.
         :type cmd: str
         :type cmd_input: str
         :type timeout: int
         :type log_stdout_err: bool
+        :type line_callback: Optional[Callable[[str], None]]
         :returns: return_code, stdout, stderr
         :rtype: tuple(int, str, str)
 
@@ -257,7 +355,8 @@ class SSH:
         else:
             command = f"sudo -E -S {cmd} <<< \"{cmd_input}\""
         return self.exec_command(
-            command, timeout, log_stdout_err=log_stdout_err
+            command, timeout, log_stdout_err=log_stdout_err,
+            line_callback=line_callback
         )
 
     def exec_command_lxc(
@@ -365,6 +464,28 @@ class SSH:
         """
         chan.close()
 
+    def forward_unix_socket(self, local_path, remote_path):
+        """Forward local unix domain socket to remote one, return forwarder.
+
+        connect() method has to be called first!
+
+        The local socket is ready to accept connections when this returns.
+        Caller is responsible for closing the returned forwarder.
+
+        :param local_path: Path of the local socket to create.
+        :param remote_path: Path of the remote socket to connect to.
+        :type local_path: str
+        :type remote_path: str
+        :returns: Started forwarder.
+        :rtype: UnixSocketForwarder
+        :raises SSHException: If the server rejects the forwarding.
+        """
+        forwarder = UnixSocketForwarder(
+            self._ssh.get_transport(), local_path, remote_path
+        )
+        forwarder.start()
+        return forwarder
+
     def scp(
             self, local_path, remote_path, get=False, timeout=30,
             wildcard=False):
@@ -413,9 +534,184 @@ class SSH:
         logger.trace(f"SCP took {duration} seconds")
 
 
+def open_streamlocal_channel(transport, remote_path, timeout=10.0):
+    """Open a channel connected to remote unix domain socket.
+
+    This is the "direct-streamlocal@openssh.com" channel type
+    (what "ssh -L local_path:remote_path" uses). Paramiko does not support it
+    in Transport.open_channel, as the message needs different fields,
+    so this function builds the request itself, otherwise mirroring
+    what open_channel does.
+
+    :param transport: Active authenticated transport to open channel on.
+    :param remote_path: Path to remote socket to connect to.
+    :param timeout: How long to wait for server to confirm the channel.
+    :type transport: paramiko.Transport
+    :type remote_path: str
+    :type timeout: float
+    :returns: Open channel.
+    :rtype: paramiko.Channel
+    :raises SSHException: If the server rejects the channel or on timeout.
+    """
+    # pylint: disable=protected-access
+    if not transport.active:
+        raise SSHException(u"SSH session not active")
+    with transport.lock:
+        window_size = transport._sanitize_window_size(None)
+        max_packet_size = transport._sanitize_packet_size(None)
+        chanid = transport._next_channel()
+        msg = Message()
+        msg.add_byte(cMSG_CHANNEL_OPEN)
+        msg.add_string(u"direct-streamlocal@openssh.com")
+        msg.add_int(chanid)
+        msg.add_int(window_size)
+        msg.add_int(max_packet_size)
+        msg.add_string(remote_path)
+        # Reserved string and uint32, see OpenSSH PROTOCOL file.
+        msg.add_string(u"")
+        msg.add_int(0)
+        chan = Channel(chanid)
+        transport._channels.put(chanid, chan)
+        transport.channel_events[chanid] = event = threading.Event()
+        transport.channels_seen[chanid] = True
+        chan._set_transport(transport)
+        chan._set_window(window_size, max_packet_size)
+    transport._send_user_message(msg)
+    time_stop = monotonic() + timeout
+    while not event.wait(0.1):
+        if not transport.active:
+            raise transport.get_exception() or SSHException(
+                u"Unable to open channel."
+            )
+        if monotonic() > time_stop:
+            raise SSHException(u"Timeout opening channel.")
+    chan = transport._channels.get(chanid)
+    if chan is None:
+        raise transport.get_exception() or SSHException(
+            f"Unable to open channel to {remote_path}."
+        )
+    return chan
+
+
+class UnixSocketForwarder:
+    """Local unix domain socket tunneled to remote one over SSH transport.
+
+    This replaces "ssh -L local_path:remote_path" without starting
+    any process. Each accepted local connection gets its own
+    direct-streamlocal channel and a thread relaying data both ways.
+
+    The first channel is opened already in start(), so forwarding failures
+    (e.g. AllowStreamLocalForwarding disabled on server) are detected early,
+    and the local socket is known to be ready when start() returns.
+    """
+
+    __BUF_SIZE = 256 * 1024
+
+    def __init__(self, transport, local_path, remote_path):
+        """Store the arguments, declare managed variables.
+
+        :param transport: Active authenticated transport to open channels on.
+        :param local_path: Path of the local socket to create.
+        :param remote_path: Path of the remote socket to connect to.
+        :type transport: paramiko.Transport
+        :type local_path: str
+        :type remote_path: str
+        """
+        self.transport = transport
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self._listener = None
+        self._first_channel = None
+        self._closed = False
+        self._endpoints = list()
+
+    def start(self):
+        """Open the first channel, create the local socket, start accepting.
+
+        :raises SSHException: If the server rejects the forwarding.
+        """
+        self._first_channel = open_streamlocal_channel(
+            self.transport, self.remote_path
+        )
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.local_path)
+        self._listener.listen(4)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        """Accept local connections and start relays until closed."""
+        while not self._closed:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            try:
+                chan = self._first_channel
+                self._first_channel = None
+                if chan is None:
+                    chan = open_streamlocal_channel(
+                        self.transport, self.remote_path
+                    )
+            except SSHException as err:
+                logger.debug(f"Forwarding to {self.remote_path} failed: {err}")
+                conn.close()
+                continue
+            self._endpoints.extend((conn, chan))
+            threading.Thread(
+                target=self._relay, args=(conn, chan), daemon=True
+            ).start()
+
+    def _relay(self, conn, chan):
+        """Copy data between local connection and channel until one closes.
+
+        :param conn: Accepted local connection.
+        :param chan: Channel connected to the remote socket.
+        :type conn: socket.socket
+        :type chan: paramiko.Channel
+        """
+        try:
+            while True:
+                readable, _, _ = select.select([conn, chan], [], [])
+                if conn in readable:
+                    data = conn.recv(self.__BUF_SIZE)
+                    if not data:
+                        break
+                    chan.sendall(data)
+                if chan in readable:
+                    data = chan.recv(self.__BUF_SIZE)
+                    if not data:
+                        break
+                    conn.sendall(data)
+        except (OSError, ValueError, SSHException):
+            # Closed from the other thread, or the connection broke.
+            pass
+        finally:
+            chan.close()
+            conn.close()
+
+    def close(self):
+        """Stop accepting, close all connections and remove local socket."""
+        self._closed = True
+        if self._listener is not None:
+            try:
+                # Shutdown wakes up the thread blocked in accept.
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+        if self._first_channel is not None:
+            self._first_channel.close()
+        for endpoint in self._endpoints:
+            endpoint.close()
+        try:
+            os.unlink(self.local_path)
+        except FileNotFoundError:
+            pass
+
+
 def exec_cmd(
         node, cmd, timeout=600, sudo=False, disconnect=False,
-        log_stdout_err=True
+        log_stdout_err=True, line_callback=None
     ):
     """Convenience function to ssh/exec/return rc, out & err.
 
@@ -430,12 +726,15 @@ def exec_cmd(
         and stderr are logged also if the return code is not zero
         independently of the value of log_stdout_err.
         Needed for calls outside Robot (e.g. from reservation script).
+    :param line_callback: If set, called with each line of stdout
+        as soon as it arrives, stdout is not accumulated then.
     :type node: dict
     :type cmd: str or OptionString
     :type timeout: int
     :type sudo: bool
     :type disconnect: bool
     :type log_stdout_err: bool
+    :type line_callback: Optional[Callable[[str], None]]
     :returns: RC, Stdout, Stderr.
     :rtype: Tuple[int, str, str]
     """
@@ -457,11 +756,13 @@ def exec_cmd(
     try:
         if not sudo:
             ret_code, stdout, stderr = ssh.exec_command(
-                cmd, timeout=timeout, log_stdout_err=log_stdout_err
+                cmd, timeout=timeout, log_stdout_err=log_stdout_err,
+                line_callback=line_callback
             )
         else:
             ret_code, stdout, stderr = ssh.exec_command_sudo(
-                cmd, timeout=timeout, log_stdout_err=log_stdout_err
+                cmd, timeout=timeout, log_stdout_err=log_stdout_err,
+                line_callback=line_callback
             )
     except SSHException as err:
         logger.error(repr(err))
@@ -475,7 +776,8 @@ def exec_cmd(
 
 def exec_cmd_no_error(
         node, cmd, timeout=600, sudo=False, message=None, disconnect=False,
-        retries=0, include_reason=False, log_stdout_err=True
+        retries=0, include_reason=False, log_stdout_err=True,
+        line_callback=None
     ):
     """Convenience function to ssh/exec/return out & err.
 
@@ -496,6 +798,8 @@ def exec_cmd_no_error(
         and stderr are logged also if the return code is not zero
         independently of the value of log_stdout_err.
         Needed for calls outside Robot thread (e.g. parallel framework setup).
+    :param line_callback: If set, called with each line of stdout
+        as soon as it arrives, stdout is not accumulated then.
     :type node: dict
     :type cmd: str or OptionString
     :type timeout: int
@@ -505,6 +809,7 @@ def exec_cmd_no_error(
     :type retries: int
     :type include_reason: bool
     :type log_stdout_err: bool
+    :type line_callback: Optional[Callable[[str], None]]
     :returns: Stdout, Stderr.
     :rtype: tuple(str, str)
     :raises RuntimeError: If bash return code is not 0.
@@ -512,7 +817,7 @@ def exec_cmd_no_error(
     for _ in range(retries + 1):
         ret_code, stdout, stderr = exec_cmd(
             node, cmd, timeout=timeout, sudo=sudo, disconnect=disconnect,
-            log_stdout_err=log_stdout_err
+            log_stdout_err=log_stdout_err, line_callback=line_callback
         )
         if ret_code == 0:
             break
@@ -527,6 +832,200 @@ def exec_cmd_no_error(
     return stdout, stderr
 
 
+@dataclass
+class NodeCmdResult:
+    """Outcome of a command executed on one node by exec_cmd_on_nodes.
+
+    The return code is None if the command has not finished,
+    the error field then describes why (e.g. connection failure, timeout).
+    """
+
+    host: str
+    """Host of the node the command was executed on."""
+    cmd: str
+    """The command as executed (before sudo wrapping)."""
+    ret_code: Optional[int] = None
+    """Return code of the command, None if it did not finish."""
+    stdout: str = u""
+    """Stdout of the command (of the last try if retried)."""
+    stderr: str = u""
+    """Stderr of the command (of the last try if retried)."""
+    duration: float = 0.0
+    """Wall time in seconds spent on the node, including retries."""
+    error: str = u""
+    """Description of the exception preventing the command to finish."""
+
+    @property
+    def passed(self):
+        """Return True if the command finished with zero return code.
+
+        :returns: Whether the command succeeded.
+        :rtype: bool
+        """
+        return self.ret_code == 0
+
+    def describe(self):
+        """Return multi-line text suitable for logging a failure.
+
+        :returns: Description of the result.
+        :rtype: str
+        """
+        text = f"Command execution failed on {self.host}: '{self.cmd}'\n"
+        if self.error:
+            return text + self.error
+        return text + f"RC: {self.ret_code}\n{self.stderr}"
+
+
+def _exec_cmd_on_node(node, cmd, timeout, sudo, retries):
+    """Execute command on a single node, meant to run in a worker thread.
+
+    No Robot logging is done (it would be lost in a non-main thread),
+    all information is returned in the result instead.
+
+    :param node: The node to execute command on.
+    :param cmd: Command to execute.
+    :param timeout: Timeout value in seconds for each try.
+    :param sudo: Sudo privilege execution flag.
+    :param retries: How many times to retry on failure.
+    :type node: dict
+    :type cmd: str or OptionString
+    :type timeout: int
+    :type sudo: bool
+    :type retries: int
+    :returns: Result of the (last) try.
+    :rtype: NodeCmdResult
+    """
+    result = NodeCmdResult(host=node[u"host"], cmd=str(cmd))
+    start = monotonic()
+    for attempt in range(retries + 1):
+        if attempt:
+            sleep(1)
+        try:
+            ret_code, stdout, stderr = exec_cmd(
+                node, cmd, timeout=timeout, sudo=sudo, log_stdout_err=False
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            # Mainly SSHTimeout, but nothing may escape the thread unnoticed.
+            result.error = repr(exc)
+            result.ret_code, result.stdout, result.stderr = None, u"", u""
+            continue
+        result.ret_code = ret_code
+        result.stdout = stdout or u""
+        result.stderr = stderr or u""
+        result.error = u"" if ret_code is not None else u"SSH failure."
+        if ret_code == 0:
+            break
+    result.duration = monotonic() - start
+    return result
+
+
+def exec_cmd_on_nodes(
+        nodes, cmd, timeout=600, sudo=False, message=None, node_type=None,
+        fail_fast=False, check=True, retries=0, max_workers=None
+    ):
+    """Execute command concurrently on multiple nodes, return the results.
+
+    Each node is handled in a worker thread, over the same pooled
+    SSH connection exec_cmd would use, so wall time is close to that
+    of the slowest node instead of the sum over all nodes.
+
+    The command may differ per node, if cmd is callable, it is called
+    (in the main thread, before any execution) with the node as argument
+    and the return value is used as the command for that node.
+
+    Two error policies are supported. With fail_fast, the first failure
+    raises immediately, commands not yet started are cancelled
+    (already running ones are left to finish in background).
+    Otherwise all nodes are waited for, and if check is True,
+    a single exception listing all failed nodes is raised at the end.
+    With check False (and no fail_fast), failures are only reported
+    in the returned results.
+
+    Results are logged from the main thread, as Robot logger
+    ignores messages from other threads.
+
+    :param nodes: Nodes to execute the command on, e.g. from topology.
+    :param cmd: Command to execute, or callable creating it from node.
+    :param timeout: Timeout value in seconds for each try. Default: 600.
+    :param sudo: Sudo privilege execution flag. Default: False.
+    :param message: Error message in case of failure. Default: None.
+    :param node_type: If set, only nodes of this type are used.
+    :param fail_fast: Raise on the first failure without waiting for others.
+    :param check: Whether to raise if any node failed (gather-all policy).
+    :param retries: How many times to retry on failure, per node.
+    :param max_workers: Maximal number of threads, default is one per node.
+    :type nodes: dict
+    :type cmd: str or OptionString or Callable[[dict], str]
+    :type timeout: int
+    :type sudo: bool
+    :type message: Optional[str]
+    :type node_type: Optional[str]
+    :type fail_fast: bool
+    :type check: bool
+    :type retries: int
+    :type max_workers: Optional[int]
+    :returns: Results, keyed by the same keys as the nodes argument.
+        With fail_fast, results of cancelled or unfinished nodes are missing.
+    :rtype: Dict[str, NodeCmdResult]
+    :raises RuntimeError: If a command failed and the policy requires raising.
+    """
+    selected = {
+        key: node for key, node in nodes.items()
+        if node_type is None or node[u"type"] == node_type
+    }
+    results = dict()
+    if not selected:
+        return results
+    commands = {
+        key: cmd(node) if callable(cmd) else cmd
+        for key, node in selected.items()
+    }
+    failed = list()
+    start = monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or len(selected),
+        thread_name_prefix=u"exec_cmd_on_nodes",
+    )
+    try:
+        futures = {
+            executor.submit(
+                _exec_cmd_on_node, node, commands[key], timeout, sudo, retries
+            ): key
+            for key, node in selected.items()
+        }
+        pending = set(futures)
+        while pending and not (fail_fast and failed):
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures[future]
+                result = future.result()
+                results[key] = result
+                logger.trace(
+                    f"exec_cmd_on_nodes on {result.host} took "
+                    f"{result.duration} seconds, RC {result.ret_code}\n"
+                    f"return STDOUT {result.stdout}\n"
+                    f"return STDERR {result.stderr}"
+                )
+                if not result.passed:
+                    logger.info(result.describe())
+                    failed.append(key)
+    finally:
+        executor.shutdown(
+            wait=not (fail_fast and failed), cancel_futures=True
+        )
+    durations = {res.host: res.duration for res in results.values()}
+    logger.debug(
+        f"exec_cmd_on_nodes on {len(selected)} nodes took "
+        f"{monotonic() - start} seconds, per node: {durations}"
+    )
+    if failed and (fail_fast or check):
+        raise RuntimeError(
+            f"{message or u'Command execution failed'}"
+            f" (failed on: {u', '.join(failed)})"
+        )
+    return {key: results[key] for key in selected if key in results}
+
+
 def scp_node(
         node, local_path, remote_path, get=False, timeout=30, disconnect=False):
     """Copy files from local_path to remote_path or vice versa.
@@ -0,0 +1,22 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+__init__ file for directory benchmarks
+
+Scripts in this directory measure performance of CSIT library code
+without a testbed. They require PYTHONPATH set to root CSIT directory,
+in order to import resources properly, and are executed as modules, e.g.:
+
+    python3 -m resources.tools.benchmarks.papi_read
+"""
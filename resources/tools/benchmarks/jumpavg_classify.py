@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of jumpavg classify on long synthetic trending series.
+
+The series consists of segments of random length, each segment
+has samples from a Gaussian distribution around a level,
+and the level changes (or stays the same) between segments,
+similarly to what trending data of a test looks like.
+
+Two implementations are compared:
+- unpruned: The quadratic search, jumpavg.classify_unpruned.
+- pruned: The current jumpavg.classify.
+
+The groups found (and bit counts) are checked to be identical.
+The unpruned search is slow for long series (minutes for 10k samples),
+use --no-reference to only time the pruned one.
+
+Usage:
+    python3 -m resources.tools.benchmarks.jumpavg_classify --samples 10000
+"""
+
+import random
+import time
+
+from argparse import ArgumentParser
+
+from resources.libraries.python.jumpavg import classify, classify_unpruned
+
+
+def generate_series(samples, min_length, max_length, noise, seed):
+    """Return a list of samples with level changes at random places.
+
+    :param samples: Number of samples to generate.
+    :param min_length: Minimal number of samples between changes.
+    :param max_length: Maximal number of samples between changes.
+    :param noise: Relative standard deviation of samples around the level.
+    :param seed: Seed for the random generator.
+    :type samples: int
+    :type min_length: int
+    :type max_length: int
+    :type noise: float
+    :type seed: int
+    :returns: The generated samples.
+    :rtype: List[float]
+    """
+    rnd = random.Random(seed)
+    level = 1e7
+    series = list()
+    while len(series) < samples:
+        length = rnd.randint(min_length, max_length)
+        level *= rnd.choice((0.9, 0.95, 1.0, 1.05, 1.1))
+        series.extend(rnd.gauss(level, level * noise) for _ in range(length))
+    return series[:samples]
+
+
+def measure(function, series):
+    """Classify the series, return the result and the duration.
+
+    :param function: Classify implementation to call.
+    :param series: The samples to classify.
+    :type function: Callable[[List[float]], BitCountingGroupList]
+    :type series: List[float]
+    :returns: Classified group list and duration in seconds.
+    :rtype: Tuple[BitCountingGroupList, float]
+    """
+    time_start = time.monotonic()
+    result = function(series)
+    return result, time.monotonic() - time_start
+
+
+def main():
+    """Parse arguments, classify the series, print a summary."""
+    parser = ArgumentParser(description="Jumpavg classify benchmark.")
+    parser.add_argument(
+        "--samples", type=int, default=10000, help="Length of the series."
+    )
+    parser.add_argument(
+        "--min-length", type=int, default=50,
+        help="Minimal number of samples between level changes."
+    )
+    parser.add_argument(
+        "--max-length", type=int, default=300,
+        help="Maximal number of samples between level changes."
+    )
+    parser.add_argument(
+        "--noise", type=float, default=0.03,
+        help="Relative stdev of samples."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument(
+        "--no-reference", action="store_true",
+        help="Do not run the (slow) unpruned implementation."
+    )
+    args = parser.parse_args()
+    series = generate_series(
+        args.samples, args.min_length, args.max_length, args.noise, args.seed
+    )
+    pruned, duration = measure(classify, series)
+    print(f"  pruned: {duration:10.3f} s, {len(pruned)} groups")
+    if args.no_reference:
+        return
+    unpruned, duration = measure(classify_unpruned, series)
+    print(f"unpruned: {duration:10.3f} s, {len(unpruned)} groups")
+    pruned_lengths = [len(group) for group in pruned]
+    unpruned_lengths = [len(group) for group in unpruned]
+    if pruned_lengths != unpruned_lengths or pruned.bits != unpruned.bits:
+        raise RuntimeError(
+            f"Results differ: {pruned_lengths} {pruned.bits} vs"
+            f" {unpruned_lengths} {unpruned.bits}"
+        )
+    print(f"Identical groups, {pruned.bits} bits.")
+
+
+if __name__ == "__main__":
+    main()
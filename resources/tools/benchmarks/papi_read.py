@@ -0,0 +1,205 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark of sync PAPI round-trip latency in PapiSocketExecutor.
+
+A fake VPP server answers each request on a local unix domain socket,
+a reader thread (playing the role of vpp_papi transport thread)
+passes replies to the event callback, and the main thread reads them
+the same way PapiSocketExecutor._execute_sync does.
+
+Two reply waiting implementations are compared:
+- poll: The previous deque with 10 ms sleep between read attempts.
+- event: The current PapiSocketExecutor._read blocking on a queue.
+
+Usage:
+    python3 -m resources.tools.benchmarks.papi_read --count 200
+"""
+
+import os
+import queue
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+from argparse import ArgumentParser
+from collections import deque
+from types import SimpleNamespace
+
+from resources.libraries.python.PapiExecutor import PapiSocketExecutor
+
+
+MSG_FORMAT = "!Q"
+MSG_SIZE = struct.calcsize(MSG_FORMAT)
+
+
+def recv_exact(sock, size):
+    """Receive exactly size bytes, return None if connection got closed.
+
+    :param sock: Connected socket to read from.
+    :param size: Number of bytes to read.
+    :type sock: socket.socket
+    :type size: int
+    :returns: Data read, or None on EOF.
+    :rtype: Optional[bytes]
+    """
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def fake_vpp_server(listener):
+    """Accept one connection, reply to each request with the same context.
+
+    :param listener: Bound and listening unix domain socket.
+    :type listener: socket.socket
+    """
+    conn, _ = listener.accept()
+    with conn:
+        while 1:
+            data = recv_exact(conn, MSG_SIZE)
+            if data is None:
+                return
+            conn.sendall(data)
+
+
+def reader_thread(sock, callback):
+    """Read replies and pass them to callback, as vpp_papi transport does.
+
+    :param sock: Connected client socket.
+    :param callback: Event callback taking message name and message.
+    :type sock: socket.socket
+    :type callback: Callable[[str, int], None]
+    """
+    while 1:
+        data = recv_exact(sock, MSG_SIZE)
+        if data is None:
+            return
+        callback("reply", struct.unpack(MSG_FORMAT, data)[0])
+
+
+def polling_read(vpp_instance, timeout=None):
+    """Read reply the way PapiSocketExecutor._read used to, by polling.
+
+    :param vpp_instance: Fake client instance with csit_deque attribute.
+    :param timeout: How long to wait for reply (or instance default).
+    :type vpp_instance: types.SimpleNamespace
+    :type timeout: Optional[float]
+    :returns: Reply read or None if nothing got read.
+    :rtype: Optional[int]
+    """
+    timeout = vpp_instance.read_timeout if timeout is None else timeout
+    time_stop = time.monotonic() + timeout
+    while 1:
+        try:
+            return vpp_instance.csit_deque.popleft()
+        except IndexError:
+            time.sleep(0.01)
+        if time.monotonic() > time_stop:
+            return None
+
+
+def measure(mode, count):
+    """Perform count sync round trips in given mode, return latencies.
+
+    :param mode: Either "poll" or "event".
+    :param count: Number of round trips to measure.
+    :type mode: str
+    :type count: int
+    :returns: Round trip latencies in seconds.
+    :rtype: List[float]
+    :raises RuntimeError: On timeout or unexpected reply.
+    """
+    vpp_instance = SimpleNamespace(read_timeout=5.0)
+    if mode == "poll":
+        deq = deque()
+        vpp_instance.csit_deque = deq
+
+        def callback(_, reply):
+            """Append the reply to the deque, as the previous callback did.
+
+            :param reply: The reply read by the reader thread.
+            :type reply: int
+            """
+            deq.append(reply)
+
+        read = polling_read
+    else:
+        reply_queue = queue.SimpleQueue()
+        vpp_instance.csit_queue = reply_queue
+
+        def callback(_, reply):
+            """Put the reply to the queue, as the current callback does.
+
+            :param reply: The reply read by the reader thread.
+            :type reply: int
+            """
+            reply_queue.put(reply)
+
+        # The public getters need a connected VPP client, the benchmark
+        # measures just the reply waiting, on a fake client instance.
+        read = PapiSocketExecutor._read  # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "api.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(1)
+        server = threading.Thread(
+            target=fake_vpp_server, args=(listener,), daemon=True
+        )
+        server.start()
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+        reader = threading.Thread(
+            target=reader_thread, args=(client, callback), daemon=True
+        )
+        reader.start()
+        latencies = list()
+        for context in range(count):
+            time_start = time.monotonic()
+            client.sendall(struct.pack(MSG_FORMAT, context))
+            reply = read(vpp_instance)
+            latencies.append(time.monotonic() - time_start)
+            if reply != context:
+                raise RuntimeError(f"Unexpected reply {reply!r} to {context}")
+        client.shutdown(socket.SHUT_RDWR)
+        client.close()
+        listener.close()
+    return latencies
+
+
+def main():
+    """Parse arguments, measure both modes, print a summary."""
+    parser = ArgumentParser(description="Sync PAPI read latency benchmark.")
+    parser.add_argument(
+        "--count", type=int, default=200, help="Round trips per mode."
+    )
+    args = parser.parse_args()
+    for mode in ("poll", "event"):
+        latencies = sorted(measure(mode, args.count))
+        avg = sum(latencies) / len(latencies)
+        median = latencies[len(latencies) // 2]
+        print(
+            f"{mode:>5}: avg {avg * 1e6:10.1f} us, median {median * 1e6:10.1f}"
+            f" us, max {latencies[-1] * 1e6:10.1f} us, total {sum(latencies)}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of PLRsearch integrator throughput, in samples per second.
+
+Synthetic trial results are generated for a system with given
+maximal receive rate (plus a small background loss ratio),
+similarly to what PLRsearch sees after many trials.
+Then the integrator computation runs for a fixed number of samples,
+once sample by sample and once with the batched (array) path.
+The computation is served by Integrator.serve_estimates as in the worker
+process of PLRsearch, but in the current process, with a stand-in pipe.
+
+Besides the speed, value averages and stdevs are printed,
+they should be close (but not identical, as the samples differ).
+
+Usage:
+    python3 -m resources.tools.benchmarks.plrsearch_integrator --trials 100
+"""
+
+import math
+import time
+
+from argparse import ArgumentParser
+
+import dill
+
+from numpy import random
+
+from resources.libraries.python.MLRsearch.trial_measurement import (
+    MeasurementResult
+)
+from resources.libraries.python.PLRsearch import Integrator
+from resources.libraries.python.PLRsearch.PLRsearch import PLRsearch
+from resources.libraries.python.PLRsearch.log_plus import safe_exp
+
+
+class _LocalPipe:
+    """Stand-in for the communication pipe, never signalling a stop.
+
+    Received objects are given at construction, sent objects are kept.
+    """
+
+    def __init__(self, *objects):
+        """Store the objects to be received.
+
+        :param objects: Objects for recv to return, in order.
+        :type objects: Tuple[object, ...]
+        """
+        self.to_receive = list(objects)
+        self.sent = []
+
+    def recv(self):
+        """Return the next object given at construction.
+
+        :returns: The object.
+        :rtype: object
+        """
+        return self.to_receive.pop(0)
+
+    def send(self, obj):
+        """Keep the sent object.
+
+        :param obj: The object sent by the integrator.
+        :type obj: object
+        """
+        self.sent.append(obj)
+
+    @staticmethod
+    def poll():
+        """Return False, the computation is limited by max_samples instead.
+
+        :returns: False.
+        :rtype: bool
+        """
+        return False
+
+
+def generate_trials(trials, mrr, min_rate, max_rate, seed):
+    """Return synthetic trial results, with durations as in PLRsearch.
+
+    :param trials: Number of trial results to generate.
+    :param mrr: Rate the simulated system forwards without loss [pps].
+    :param min_rate: Minimal offered load [pps].
+    :param max_rate: Maximal offered load [pps].
+    :param seed: Seed for the random generator.
+    :type trials: int
+    :type mrr: float
+    :type min_rate: float
+    :type max_rate: float
+    :type seed: int
+    :returns: The generated trial results.
+    :rtype: List[MeasurementResult]
+    """
+    rng = random.default_rng(seed)
+    result_list = []
+    for index in range(trials):
+        duration = 1.0 + index
+        load = float(rng.uniform(min_rate, max_rate))
+        count = int(load * duration)
+        average_loss = max(0.0, load - mrr) * duration + 1e-7 * count
+        loss = min(count, int(rng.poisson(average_loss)))
+        result = MeasurementResult(
+            intended_duration=duration,
+            intended_load=load,
+            offered_count=count,
+            loss_count=loss,
+        )
+        result.plr_loss_count = loss
+        result_list.append(result)
+    return result_list
+
+
+def measure(plrsearch, fitting_name, trial_list, rates, samples, batch_size):
+    """Run the integrator computation, return value stats and samples/sec.
+
+    :param plrsearch: Search instance to make integrated functions with.
+    :param fitting_name: Either "stretch" or "erf".
+    :param trial_list: Trial results to compute with.
+    :param rates: Minimal and maximal offered load [pps].
+    :param samples: Number of samples to compute.
+    :param batch_size: Batch size, zero for sample by sample.
+    :type plrsearch: PLRsearch
+    :type fitting_name: str
+    :type trial_list: List[MeasurementResult]
+    :type rates: Tuple[float, float]
+    :type samples: int
+    :type batch_size: int
+    :returns: Value average, value stdev and samples per second.
+    :rtype: Tuple[float, float, float]
+    """
+    min_rate, max_rate = rates
+    if batch_size:
+        function = plrsearch.make_batch_value_logweight_func(
+            getattr(PLRsearch, f"lfit_{fitting_name}_array"), min_rate, max_rate
+        )
+    else:
+        function = plrsearch.make_value_logweight_func(
+            getattr(PLRsearch, f"lfit_{fitting_name}"), min_rate, max_rate
+        )
+    # Same arguments as PLRsearch sends to its worker, then one computation,
+    # its stop object and the end of serving.
+    pipe = _LocalPipe(
+        (2, dill.dumps(function), None, batch_size),
+        (trial_list, samples),
+        "stop",
+        None,
+    )
+    time_start = time.monotonic()
+    Integrator.serve_estimates(pipe, scale_coeff=5.0, trace_enabled=False)
+    duration = time.monotonic() - time_start
+    value_tracker = pipe.sent[0][0]
+    stdev = math.sqrt(safe_exp(value_tracker.log_variance))
+    return math.exp(value_tracker.average), stdev, samples / duration
+
+
+def main():
+    """Parse arguments, run the integrator, print a summary."""
+    parser = ArgumentParser(description="PLRsearch integrator benchmark.")
+    parser.add_argument(
+        "--trials", type=int, default=100, help="Number of trial results."
+    )
+    parser.add_argument(
+        "--samples", type=int, default=4000,
+        help="Number of integrator samples per run."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=256,
+        help="Maximal batch size for the batched path."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    args = parser.parse_args()
+    min_rate, max_rate, mrr = 1e4, 1.4e7, 3e6
+    plrsearch = PLRsearch(
+        measurer=None,
+        trial_duration_per_trial=1.0,
+        packet_loss_ratio_target=1e-7,
+    )
+    trial_list = generate_trials(
+        args.trials, mrr, min_rate, max_rate, args.seed
+    )
+    for fitting_name in ("stretch", "erf"):
+        speeds = []
+        for batch_size in (0, args.batch_size):
+            average, stdev, speed = measure(
+                plrsearch,
+                fitting_name,
+                trial_list,
+                (min_rate, max_rate),
+                args.samples,
+                batch_size,
+            )
+            speeds.append(speed)
+            print(
+                f"{fitting_name:>7} batch {batch_size:4d}: "
+                f"{speed:10.1f} samples/s, critical rate {average:.6e}, "
+                f"log stdev {stdev:.3e}"
+            )
+        print(f"{fitting_name:>7} speedup: {speeds[1] / speeds[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
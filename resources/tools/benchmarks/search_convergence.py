@@ -0,0 +1,453 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of MLRsearch and PLRsearch cost on simulated SUTs.
+
+No traffic generator is needed, measurers simulate a SUT
+with given capacity [pps], the loss count of a trial is computed
+from the intended load and duration (plus noise, depending on the SUT).
+Time is virtual, the measurers return immediately and only add
+the intended duration (plus --trial-overhead) to a virtual clock.
+With --stop-interval, the measurers report partial results
+(in the given virtual interval) so MLRsearch can stop failing trials early.
+
+Simulated SUTs:
+- deterministic: Loss is exactly the load above capacity.
+- noisy: Capacity differs between trials, losses are binomial.
+- inverted: As noisy, but there is also a small loss in a band
+  of loads slightly below capacity (loss inversion).
+- drifting: As noisy, but the capacity decreases with virtual time.
+
+MLRsearch runs for each goal set, expansion coefficient and seed,
+the summary shows averages of trial count, virtual duration
+(sum of trial durations and overheads), Python overhead per trial
+(wall time of the search minus wall time of the measurer)
+and the relevant lower bound of the first goal relative to capacity.
+
+PLRsearch needs real time for its integrator workers,
+so (when enabled by --plr-timeout) its measurer sleeps
+for the virtual duration multiplied by --plr-time-scale.
+The summary shows trial count and the estimate relative to capacity.
+
+Usage:
+    python3 -m resources.tools.benchmarks.search_convergence --seeds 5
+    python3 -m resources.tools.benchmarks.search_convergence \\
+        --suts noisy --goals ndrpdr --expansions 2 4 --plr-timeout 600
+"""
+
+import time
+
+from argparse import ArgumentParser
+
+from numpy import random
+
+from resources.libraries.python.MLRsearch import (
+    AbstractMeasurer, Config, MeasurementResult, MultipleLossRatioSearch,
+    SearchGoal,
+)
+from resources.libraries.python.PLRsearch.PLRsearch import PLRsearch
+
+
+MIN_LOAD = 9001.0
+"""Minimal load [pps] for the searches, same as in CSIT."""
+MAX_LOAD = 1.4e7
+"""Maximal load [pps] for the searches, similar to 2x10GE line rate."""
+CAPACITY = 5e6
+"""Nominal capacity [pps] of all simulated SUTs."""
+
+
+class SimulatedSut(AbstractMeasurer):
+    """Measurer computing trial results from a model of SUT, in virtual time.
+
+    Subclasses override loss_ratio, this class handles the counts,
+    the virtual clock and accounting of the time spent in measure.
+    """
+
+    def __init__(
+        self, seed, trial_overhead=0.0, time_scale=0.0, stop_interval=0.0
+    ):
+        """Initialize the random generator and counters.
+
+        :param seed: Seed for the random generator.
+        :param trial_overhead: Virtual time [s] added to each trial duration.
+        :param time_scale: Real seconds to sleep per virtual second.
+        :param stop_interval: Virtual time [s] between partial results,
+            zero means the trials are never stopped early.
+        :type seed: int
+        :type trial_overhead: float
+        :type time_scale: float
+        :type stop_interval: float
+        """
+        self.rng = random.default_rng(seed)
+        self.trial_overhead = float(trial_overhead)
+        self.time_scale = float(time_scale)
+        self.stop_interval = float(stop_interval)
+        self.trials = 0
+        self.virtual_time = 0.0
+        self.measure_time = 0.0
+
+    def loss_ratio(self, load):
+        """Return average loss ratio of a trial starting now at the load.
+
+        :param load: Intended load [pps].
+        :type load: float
+        :returns: Average loss ratio, between zero and one.
+        :rtype: float
+        """
+        raise NotImplementedError
+
+    def loss_count(self, count, ratio):
+        """Return random loss count for the average loss ratio.
+
+        :param count: Number of packets offered.
+        :param ratio: Average loss ratio.
+        :type count: int
+        :type ratio: float
+        :returns: Number of packets lost.
+        :rtype: int
+        """
+        return int(self.rng.binomial(count, ratio))
+
+    def measure(self, intended_duration, intended_load):
+        """Compute the trial result, advance the virtual clock.
+
+        :param intended_duration: Intended trial duration [s].
+        :param intended_load: Intended load [pps].
+        :type intended_duration: float
+        :type intended_load: float
+        :returns: Structure containing the result of the measurement.
+        :rtype: MeasurementResult
+        """
+        time_start = time.monotonic()
+        count = int(intended_load * intended_duration)
+        ratio = min(1.0, max(0.0, self.loss_ratio(intended_load)))
+        loss = self.loss_count(count, ratio)
+        virtual_duration = intended_duration + self.trial_overhead
+        self.virtual_time += virtual_duration
+        self.trials += 1
+        if self.time_scale:
+            time.sleep(virtual_duration * self.time_scale)
+        self.measure_time += time.monotonic() - time_start
+        return MeasurementResult(
+            intended_duration=intended_duration,
+            intended_load=intended_load,
+            offered_count=count,
+            loss_count=loss,
+        )
+
+
+    def measure_with_stop(self, intended_duration, intended_load, should_stop):
+        """Compute the trial in intervals, stop if told to.
+
+        :param intended_duration: Intended trial duration [s].
+        :param intended_load: Intended load [pps].
+        :param should_stop: Callable telling whether to stop the trial now.
+        :type intended_duration: float
+        :type intended_load: float
+        :type should_stop: Callable[[MeasurementResult], bool]
+        :returns: Structure containing the result of the measurement.
+        :rtype: MeasurementResult
+        """
+        if not self.stop_interval:
+            return self.measure(intended_duration, intended_load)
+        time_start = time.monotonic()
+        ratio = min(1.0, max(0.0, self.loss_ratio(intended_load)))
+        elapsed, count, loss = 0.0, 0, 0
+        while elapsed < intended_duration:
+            elapsed = min(intended_duration, elapsed + self.stop_interval)
+            step_count = int(intended_load * elapsed) - count
+            count += step_count
+            loss += self.loss_count(step_count, ratio)
+            partial = MeasurementResult(
+                intended_duration=elapsed,
+                intended_load=intended_load,
+                offered_count=count,
+                loss_count=loss,
+            )
+            if elapsed < intended_duration and should_stop(partial):
+                break
+        self.virtual_time += elapsed + self.trial_overhead
+        self.trials += 1
+        self.measure_time += time.monotonic() - time_start
+        return MeasurementResult(
+            intended_duration=intended_duration,
+            intended_load=intended_load,
+            offered_count=count,
+            loss_count=loss,
+            offered_duration=elapsed,
+        )
+
+
+class DeterministicSut(SimulatedSut):
+    """SUT losing exactly the load above capacity, no randomness."""
+
+    def loss_ratio(self, load):
+        """Return the relative excess load.
+
+        :param load: Intended load [pps].
+        :type load: float
+        :returns: Average loss ratio.
+        :rtype: float
+        """
+        return max(0.0, 1.0 - CAPACITY / load)
+
+    def loss_count(self, count, ratio):
+        """Return the expected loss count, rounded.
+
+        :param count: Number of packets offered.
+        :param ratio: Average loss ratio.
+        :type count: int
+        :type ratio: float
+        :returns: Number of packets lost.
+        :rtype: int
+        """
+        return int(round(count * ratio))
+
+
+class NoisySut(SimulatedSut):
+    """SUT with capacity varying between trials, 0.4% stdev."""
+
+    noise = 0.004
+    """Relative stdev of the capacity."""
+
+    def capacity(self):
+        """Return the capacity for a trial starting now.
+
+        :returns: Capacity [pps].
+        :rtype: float
+        """
+        return CAPACITY
+
+    def loss_ratio(self, load):
+        """Return the relative excess load over the current random capacity.
+
+        :param load: Intended load [pps].
+        :type load: float
+        :returns: Average loss ratio.
+        :rtype: float
+        """
+        capacity = self.rng.normal(self.capacity(), self.noise * CAPACITY)
+        return max(0.0, 1.0 - capacity / load)
+
+
+class InvertedSut(NoisySut):
+    """Noisy SUT also losing 1e-4 of packets between 97% and 98.5% capacity.
+
+    Loads in the band are upper bounds for zero loss goals,
+    but higher loads (up to capacity) are lower bounds.
+    """
+
+    def loss_ratio(self, load):
+        """Return the noisy loss ratio, increased in the band.
+
+        :param load: Intended load [pps].
+        :type load: float
+        :returns: Average loss ratio.
+        :rtype: float
+        """
+        ratio = super().loss_ratio(load)
+        if 0.97 * CAPACITY <= load <= 0.985 * CAPACITY:
+            ratio += 1e-4
+        return ratio
+
+
+class DriftingSut(NoisySut):
+    """Noisy SUT with capacity decreasing by 1% per 100 virtual seconds."""
+
+    def capacity(self):
+        """Return the capacity decreased according to the virtual clock.
+
+        :returns: Capacity [pps].
+        :rtype: float
+        """
+        return CAPACITY * max(0.5, 1.0 - 1e-4 * self.virtual_time)
+
+
+SUT_CLASSES = {
+    "deterministic": DeterministicSut,
+    "noisy": NoisySut,
+    "inverted": InvertedSut,
+    "drifting": DriftingSut,
+}
+"""Simulated SUT classes by command line name."""
+
+
+def make_goals(name, expansion):
+    """Return search goals for a named goal set, mostly as in CSIT tests.
+
+    :param name: One of "ndrpdr", "ndrpdr-long", "ndr" or "many".
+    :param expansion: Expansion coefficient to use in all goals.
+    :type name: str
+    :type expansion: int
+    :returns: The search goals.
+    :rtype: Tuple[SearchGoal]
+    :raises ValueError: If the name is not known.
+    """
+    width = 0.005
+    if name == "ndrpdr":
+        ratios, final_duration, duration_sum = (0.0, 0.005), 1.0, 21.0
+    elif name == "ndrpdr-long":
+        ratios, final_duration, duration_sum = (0.0, 0.005), 10.0, 60.0
+    elif name == "ndr":
+        ratios, final_duration, duration_sum = (0.0,), 1.0, 21.0
+    elif name == "many":
+        ratios = (0.0, 1e-6, 1e-4, 1e-3, 0.005, 0.01, 0.02, 0.05)
+        final_duration, duration_sum, width = 1.0, 61.0, 0.001
+    else:
+        raise ValueError(f"Unknown goal set: {name!r}")
+    return tuple(
+        SearchGoal(
+            loss_ratio=ratio,
+            exceed_ratio=0.5 if len(ratios) > 1 else 0.0,
+            relative_width=width,
+            initial_trial_duration=1.0,
+            final_trial_duration=final_duration,
+            duration_sum=duration_sum,
+            preceding_targets=2,
+            expansion_coefficient=expansion,
+        )
+        for ratio in ratios
+    )
+
+
+def run_mlrsearch(sut, goals):
+    """Run MLRsearch, return relative lower bound of the first goal.
+
+    :param sut: The simulated SUT to search with.
+    :param goals: Search goals to use.
+    :type sut: SimulatedSut
+    :type goals: Tuple[SearchGoal]
+    :returns: Relevant lower bound of the first goal divided by capacity,
+        and Python overhead [s] of the whole search.
+    :rtype: Tuple[float, float]
+    """
+    config = Config(
+        goals=goals,
+        min_load=MIN_LOAD,
+        max_load=MAX_LOAD,
+        search_duration_max=3600.0,
+        warmup_duration=0.0,
+    )
+    time_start = time.monotonic()
+    results = MultipleLossRatioSearch(config).search(
+        measurer=sut, debug=lambda _: None
+    )
+    overhead = time.monotonic() - time_start - sut.measure_time
+    lower_bound = results[goals[0]].relevant_lower_bound
+    return (float(lower_bound) if lower_bound else 0.0) / CAPACITY, overhead
+
+
+def run_plrsearch(sut, timeout):
+    """Run PLRsearch, return the estimate relative to capacity.
+
+    :param sut: The simulated SUT to search with, it has to sleep.
+    :param timeout: Virtual duration of the search [s].
+    :type sut: SimulatedSut
+    :type timeout: float
+    :returns: Estimate average divided by capacity, relative stdev
+        and Python overhead [s] of the whole search.
+    :rtype: Tuple[float, float, float]
+    """
+    search = PLRsearch(
+        measurer=sut,
+        trial_duration_per_trial=1.0,
+        packet_loss_ratio_target=1e-7,
+        trial_number_offset=2,
+        timeout=timeout * sut.time_scale,
+    )
+    time_start = time.monotonic()
+    average, stdev = search.search(MIN_LOAD, MAX_LOAD)
+    overhead = time.monotonic() - time_start - sut.measure_time
+    return average / CAPACITY, stdev / average, overhead
+
+
+def main():
+    """Parse arguments, run the matrix of searches, print a summary."""
+    parser = ArgumentParser(description="Search convergence benchmark.")
+    parser.add_argument(
+        "--suts", nargs="+", choices=sorted(SUT_CLASSES),
+        default=list(SUT_CLASSES), help="Simulated SUTs to search on."
+    )
+    parser.add_argument(
+        "--goals", nargs="+",
+        choices=("ndrpdr", "ndrpdr-long", "ndr", "many"),
+        default=["ndrpdr", "ndrpdr-long"], help="MLRsearch goal sets."
+    )
+    parser.add_argument(
+        "--expansions", nargs="+", type=int, default=[2],
+        help="MLRsearch expansion coefficients to try."
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=5, help="Runs per matrix cell."
+    )
+    parser.add_argument(
+        "--trial-overhead", type=float, default=0.0,
+        help="Virtual seconds added to each trial, e.g. for TG setup."
+    )
+    parser.add_argument(
+        "--stop-interval", type=float, default=0.0,
+        help="Virtual seconds between partial results, zero disables."
+    )
+    parser.add_argument(
+        "--plr-timeout", type=float, default=0.0,
+        help="Virtual duration of PLRsearch, zero skips PLRsearch."
+    )
+    parser.add_argument(
+        "--plr-time-scale", type=float, default=0.02,
+        help="Real seconds PLRsearch measurer sleeps per virtual second."
+    )
+    args = parser.parse_args()
+    print(
+        f"{'sut':>13} {'goals':>11} {'exp':>3} {'trials':>7} "
+        f"{'virtual s':>9} {'ms/trial':>8} {'lo/cap':>7}"
+    )
+    for sut_name in args.suts:
+        sut_class = SUT_CLASSES[sut_name]
+        seeds = 1 if sut_class is DeterministicSut else args.seeds
+        for goal_name in args.goals:
+            for expansion in args.expansions:
+                goals = make_goals(goal_name, expansion)
+                trials, virtual, overhead, ratio = 0, 0.0, 0.0, 0.0
+                for seed in range(seeds):
+                    sut = sut_class(
+                        seed, args.trial_overhead,
+                        stop_interval=args.stop_interval,
+                    )
+                    seed_ratio, seed_overhead = run_mlrsearch(sut, goals)
+                    trials += sut.trials
+                    virtual += sut.virtual_time
+                    overhead += seed_overhead
+                    ratio += seed_ratio
+                print(
+                    f"{sut_name:>13} {goal_name:>11} {expansion:3d} "
+                    f"{trials / seeds:7.1f} {virtual / seeds:9.1f} "
+                    f"{1e3 * overhead / trials:8.3f} {ratio / seeds:7.4f}"
+                )
+    if not args.plr_timeout:
+        return
+    print(
+        f"{'sut':>13} {'trials':>7} {'ms/trial':>8} "
+        f"{'avg/cap':>7} {'stdev':>9}"
+    )
+    for sut_name in args.suts:
+        sut = SUT_CLASSES[sut_name](0, args.trial_overhead, args.plr_time_scale)
+        ratio, stdev, overhead = run_plrsearch(sut, args.plr_timeout)
+        print(
+            f"{sut_name:>13} {sut.trials:7d} "
+            f"{1e3 * overhead / sut.trials:8.3f} {ratio:7.4f} "
+            f"{stdev:9.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
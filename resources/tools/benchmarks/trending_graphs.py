@@ -0,0 +1,221 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of trending graph callback latency versus series length.
+
+Synthetic trending data (one MRR and one NDRPDR series per test, one run
+per day) is generated for each series length. Then the trending graphs
+for all the tests (MRR, and PDR with bandwidth and latency) are generated
+as in the callback of the trending application. Times are reported for
+the graph generation and for the serialization of the figures to JSON
+(done by dash when sending the response).
+Trend classification states are kept between repetitions, as they are
+in the running application, so repeated draws classify no new samples.
+
+The dashboard requirements (csit.infra.dash/app/requirements.txt) must be
+installed. The cdash package is imported without running its __init__,
+which would start the application and read all data from S3.
+
+Usage:
+    python3 -m resources.tools.benchmarks.trending_graphs --lengths 100 1000
+"""
+
+import importlib
+import statistics
+import sys
+import time
+import types
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from yaml import load, FullLoader
+
+
+APP_DIR = Path(__file__).resolve().parents[3] / "csit.infra.dash" / "app"
+JOB = "csit-vpp-perf-mrr-daily-master-2n-icx"
+NIC = "10ge2p1x710"
+
+
+def import_graphs():
+    """Import the module with trending graphs of the dashboard.
+
+    :returns: The cdash.trending.graphs module.
+    :rtype: module
+    """
+    if "cdash" not in sys.modules:
+        package = types.ModuleType("cdash")
+        package.__path__ = [str(APP_DIR / "cdash")]
+        sys.modules["cdash"] = package
+    return importlib.import_module("cdash.trending.graphs")
+
+
+def generate_data(tests, length, seed):
+    """Return synthetic trending data and the selection of all its tests.
+
+    :param tests: Number of tests, each with an MRR and an NDRPDR series.
+    :param length: Number of runs (days) in each series.
+    :param seed: Seed for the random generator.
+    :type tests: int
+    :type length: int
+    :type seed: int
+    :returns: Data frame as read by the dashboard and the selected items.
+    :rtype: Tuple[pandas.DataFrame, List[dict]]
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2026-01-01")
+    hdrh = "HISTFAAAACR4nJNpmSzMwMDAzgABzFCaEUzKfJ/dAGEJMi8A"
+    rows = list()
+    items = list()
+    for test_idx in range(tests):
+        test = f"ethip4-ip4base{test_idx}"
+        for ttype, testtype in (("mrr", "mrr"), ("ndrpdr", "pdr")):
+            test_id = (
+                f"tests.vpp.perf.ip4.2n1l-{NIC}-avf-{test}-{ttype}."
+                f"64b-1c-avf-{test}-{ttype}"
+            )
+            levels = 1e7 * (1.0 + 0.1 * np.cumsum(rng.random(length) < 0.02))
+            for run in range(length):
+                rate = float(levels[run] * (1.0 + 0.01 * rng.standard_normal()))
+                trials = (rate * (1.0 + 0.01 * rng.standard_normal(10)))
+                rows.append({
+                    "job": JOB,
+                    "build": str(run + 1),
+                    "dut_type": "vpp",
+                    "dut_version": f"26.06-rc0~{run}-g0123456",
+                    "hosts": ["10.30.51.1", "10.30.51.2"],
+                    "tg_type": "trex",
+                    "start_time": start + pd.Timedelta(days=run, hours=2),
+                    "passed": True,
+                    "test_id": test_id,
+                    "test_type": ttype,
+                    "result_receive_rate_rate_avg": rate,
+                    "result_receive_rate_rate_stdev": 0.01 * rate,
+                    "result_receive_rate_rate_unit": "pps",
+                    "result_receive_rate_rate_values": trials.tolist(),
+                    "result_receive_rate_bandwidth_avg": rate * 672.0,
+                    "result_receive_rate_bandwidth_stdev": rate * 6.72,
+                    "result_receive_rate_bandwidth_unit": "bps",
+                    "result_receive_rate_bandwidth_values":
+                        (trials * 672.0).tolist(),
+                    "result_ndr_lower_rate_value": 0.9 * rate,
+                    "result_ndr_lower_rate_unit": "pps",
+                    "result_ndr_lower_bandwidth_value": 0.9 * rate * 672.0,
+                    "result_ndr_lower_bandwidth_unit": "bps",
+                    "result_pdr_lower_rate_value": rate,
+                    "result_pdr_lower_rate_unit": "pps",
+                    "result_pdr_lower_bandwidth_value": rate * 672.0,
+                    "result_pdr_lower_bandwidth_unit": "bps",
+                    "result_latency_forward_pdr_50_avg": 1e8 / rate,
+                    "result_latency_forward_pdr_50_unit": "us",
+                    **{
+                        f"result_latency_{direction}_pdr_{load}_hdrh": hdrh
+                        for direction in ("forward", "reverse")
+                        for load in (0, 10, 50, 90)
+                    },
+                })
+            items.append({
+                "id": f"vpp-2n-icx-{NIC}-avf-64b-1c-{test}-{testtype}",
+                "dut": "vpp",
+                "phy": f"2n-icx-{NIC}-avf",
+                "area": "ip4",
+                "test": test,
+                "framesize": "64b",
+                "core": "1c",
+                "testtype": testtype,
+            })
+    data = pd.DataFrame(rows)
+    data["test_type"] = data["test_type"].astype("category")
+    return data, items
+
+
+def measure(graphs, data, items, layout, repeats, trials):
+    """Time graph generation and serialization, return the median times.
+
+    :param graphs: The module with trending graphs.
+    :param data: Trending data.
+    :param items: Selected tests.
+    :param layout: Layout of plot.ly graphs.
+    :param repeats: Number of repetitions.
+    :param trials: If True, MRR trials are displayed.
+    :type graphs: module
+    :type data: pandas.DataFrame
+    :type items: List[dict]
+    :type layout: dict
+    :type repeats: int
+    :type trials: bool
+    :returns: Median graph generation time and serialization time [s].
+    :rtype: Tuple[float, float]
+    """
+    index = graphs.index_trending_data(data)
+    graph_times = list()
+    json_times = list()
+    for _ in range(repeats):
+        graph_layout = deepcopy(layout)
+        time_start = time.monotonic()
+        figures = graphs.graph_trending(
+            data, items, graph_layout, trials=trials, index=index
+        )
+        time_graph = time.monotonic()
+        for figure in figures:
+            if figure is not None:
+                figure.to_json()
+        graph_times.append(time_graph - time_start)
+        json_times.append(time.monotonic() - time_graph)
+    return statistics.median(graph_times), statistics.median(json_times)
+
+
+def main():
+    """Parse arguments, time the graphs for each length, print a summary."""
+    parser = ArgumentParser(description="Trending graphs benchmark.")
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=[100, 365, 1000, 3000],
+        help="Numbers of runs in each series."
+    )
+    parser.add_argument(
+        "--tests", type=int, default=10,
+        help="Number of tests, each selected as MRR and PDR."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Repetitions per length."
+    )
+    parser.add_argument(
+        "--trials", action="store_true", help="Display MRR trials."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    args = parser.parse_args()
+    graphs = import_graphs()
+    layout_file = APP_DIR / "cdash" / "trending" / "layout.yaml"
+    with open(layout_file, "r", encoding="utf-8") as f_in:
+        layout = load(f_in, Loader=FullLoader)
+    print(f"{'length':>8} {'samples':>8} {'graph ms':>10} {'json ms':>10} "
+          f"{'us/sample':>10}")
+    for length in args.lengths:
+        data, items = generate_data(args.tests, length, args.seed)
+        graph_time, json_time = measure(
+            graphs, data, items, layout, args.repeats, args.trials
+        )
+        samples = len(items) * length
+        print(
+            f"{length:8d} {samples:8d} {graph_time * 1e3:10.1f} "
+            f"{json_time * 1e3:10.1f} "
+            f"{(graph_time + json_time) * 1e6 / samples:10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
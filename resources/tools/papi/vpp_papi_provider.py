@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-# Copyright (c) 2021 Cisco and/or its affiliates.
+# Copyright (c) 2026 Cisco and/or its affiliates.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at:
@@ -31,17 +31,46 @@ VPP-stats:
     vpp_papi_provider.py \
         --method stats \
         --data '[["^/if", "/err/ip4-input", "/sys/node/ip4-input"], ["^/if"]]'
+
+VPP-stats agent (one JSON request per stdin line, one reply per stdout line):
+
+    vpp_papi_provider.py --method stats_agent
+
+Framed mode (any method except stats_agent):
+
+    vpp_papi_provider.py --method dump --framed
+
+    Instead of --data, the input is read from stdin as a sequence of frames,
+    each frame is a 4-byte big-endian length followed by UTF-8 JSON.
+    For request and dump, each input frame is one API call
+    (an item of the --data list), strings are not hex-encoded.
+    For stats and stats_request, the only input frame holds what --data
+    would hold.
+
+    The output is also a sequence of frames, each a JSON list
+    [kind, value], written as soon as the value is known:
+    - ["item", value] appends value to the reply list,
+    - ["detail", value] appends value to "api_reply" of the last item,
+    - ["entry", [key, value]] sets key of the last item to value.
+    Reassembled, the reply list is equal to the non-framed output,
+    except strings in request and dump replies are not hex-encoded.
+    So big dumps are neither limited by command line length,
+    nor serialized into a single huge JSON string.
 """
 
 import argparse
 import json
 import os
+import struct
 import sys
 
 
 # Client name
 CLIENT_NAME = u"csit_papi"
 
+# Header of framed input and output, the length of the JSON payload.
+FRAME_HEADER = struct.Struct(u"!I")
+
 
 # Sphinx creates auto-generated documentation by importing the python source
 # files and collecting the docstrings from them. The NO_VPP_PAPI flag allows
@@ -73,18 +102,20 @@ if do_import:
         raise RuntimeError(u"vpp_papi module not found")
 
 
-def _convert_reply(api_r):
+def _convert_reply(api_r, hex_strings=True):
     """Process API reply / a part of API reply for smooth converting to
     JSON string.
 
     It is used only with 'request' and 'dump' methods.
 
-    Apply binascii.hexlify() method for string values.
+    Apply binascii.hexlify() method for string values (unless disabled).
 
     TODO: Implement complex solution to process of replies.
 
     :param api_r: API reply.
+    :param hex_strings: Whether to hex-encode string values.
     :type api_r: Vpp_serializer reply object (named tuple)
+    :type hex_strings: bool
     :returns: Processed API reply / a part of API reply.
     :rtype: dict
     """
@@ -111,6 +142,8 @@ def _convert_reply(api_r):
         elif hasattr(val, u"__int__"):
             return int(val)
         elif hasattr(val, "__str__"):
+            if not hex_strings:
+                return str(val)
             return str(val).encode(encoding=u"utf-8").hex()
         # Next handles parameters not supporting preferred integer or string
         # representation to get it logged
@@ -233,6 +266,167 @@ def process_stats(args):
         raise RuntimeError(f"PAPI reply {reply} error:\n{err!r}")
 
 
+def process_stats_agent(args):
+    """Serve VPP Stats requests from stdin until EOF.
+
+    The stats segment stays mapped for the whole lifetime of the agent,
+    and the list of counter names matching given paths is computed
+    again only when the stats segment epoch has changed
+    (a counter has been added or removed) since it was last computed.
+
+    First line written is a readiness notification.
+    Each request line is a JSON object with "data" field,
+    with the same meaning as --data argument of stats method.
+    Each reply line is a JSON object with either "reply" field
+    (the same as stats method output) or "error" field.
+
+    :param args: Command line arguments passed to VPP PAPI Provider.
+    :type args: ArgumentParser
+    :returns: Empty string, as everything has been written already.
+    :rtype: str
+    :raises RuntimeError: If PAPI init error occurs.
+    """
+
+    try:
+        stats = VPPStats(args.socket)
+    except Exception as err:
+        raise RuntimeError(f"PAPI init failed:\n{err!r}")
+
+    def write_line(obj):
+        """Write the object as a single line of JSON and flush.
+
+        :param obj: Object to write.
+        :type obj: dict
+        """
+        sys.stdout.write(json.dumps(obj) + u"\n")
+        sys.stdout.flush()
+
+    names_cache = dict()
+    write_line(dict(ready=True))
+    while 1:
+        line = sys.stdin.readline()
+        if not line:
+            return u""
+        try:
+            paths = json.loads(line)[u"data"]
+            key = json.dumps(paths)
+            epoch = stats.epoch
+            epoch_names = names_cache.get(key, None)
+            if epoch_names is None or epoch_names[0] != epoch:
+                epoch_names = names_cache[key] = (epoch, stats.ls(paths))
+            try:
+                reply = [stats.dump(epoch_names[1])]
+            except KeyError:
+                # Directory has changed since the epoch was read.
+                names_cache[key] = (stats.epoch, stats.ls(paths))
+                reply = [stats.dump(names_cache[key][1])]
+            write_line(dict(reply=reply))
+        except (KeyError, OSError, RuntimeError, TypeError, ValueError) as err:
+            # VPPStatsIOError is OSError, VPPStatsClientLockError
+            # is RuntimeError, malformed requests raise the others.
+            write_line(dict(error=repr(err)))
+
+
+def read_frames(stream):
+    """Yield objects decoded from frames read from the binary stream.
+
+    :param stream: Binary stream to read from, e.g. stdin buffer.
+    :type stream: io.BufferedIOBase
+    :yields: Decoded JSON values, until EOF.
+    :ytype: object
+    :raises RuntimeError: If the stream ends inside a frame.
+    """
+    while 1:
+        header = stream.read(FRAME_HEADER.size)
+        if not header:
+            return
+        if len(header) < FRAME_HEADER.size:
+            raise RuntimeError(u"Truncated frame header.")
+        size = FRAME_HEADER.unpack(header)[0]
+        payload = stream.read(size)
+        if len(payload) < size:
+            raise RuntimeError(u"Truncated frame payload.")
+        yield json.loads(payload)
+
+
+def write_frame(stream, kind, value):
+    """Encode [kind, value] as a frame and write it to the binary stream.
+
+    :param stream: Binary stream to write to, e.g. stdout buffer.
+    :param kind: Frame kind, one of "item", "detail" or "entry".
+    :param value: JSON serializable value.
+    :type stream: io.BufferedIOBase
+    :type kind: str
+    :type value: object
+    """
+    payload = json.dumps([kind, value]).encode(encoding=u"utf-8")
+    stream.write(FRAME_HEADER.pack(len(payload)))
+    stream.write(payload)
+
+
+def process_framed(args):
+    """Process any method (except stats_agent) with framed stdin and stdout.
+
+    See module docstring for the frame format.
+
+    :param args: Command line arguments passed to VPP PAPI Provider.
+    :type args: ArgumentParser
+    :returns: Empty string, as everything has been written already.
+    :rtype: str
+    :raises RuntimeError: If PAPI init or PAPI command error occurs.
+    """
+    frames = read_frames(sys.stdin.buffer)
+    out = sys.stdout.buffer
+    if args.method in (u"request", u"dump"):
+        try:
+            vpp = VPPApiClient()
+        except Exception as err:
+            raise RuntimeError(f"PAPI init failed:\n{err!r}")
+        vpp.connect(CLIENT_NAME)
+        try:
+            for data in frames:
+                api_name = data[u"api_name"]
+                api_args = {str(k): v for k, v in data[u"api_args"].items()}
+                try:
+                    rep = getattr(vpp.api, api_name)(**api_args)
+                except Exception as err:
+                    raise RuntimeError(
+                        f"PAPI command {api_name}({api_args}) error:\n{err!r}"
+                    )
+                if isinstance(rep, list):
+                    write_frame(
+                        out, u"item", dict(api_name=api_name, api_reply=list())
+                    )
+                    for r in rep:
+                        write_frame(
+                            out, u"detail", _convert_reply(r, hex_strings=False)
+                        )
+                else:
+                    write_frame(out, u"item", dict(
+                        api_name=api_name,
+                        api_reply=_convert_reply(rep, hex_strings=False)
+                    ))
+        finally:
+            vpp.disconnect()
+    else:
+        try:
+            stats = VPPStats(args.socket)
+        except Exception as err:
+            raise RuntimeError(f"PAPI init failed:\n{err!r}")
+        for data in frames:
+            if args.method == u"stats":
+                write_frame(out, u"item", dict())
+                for key, value in stats.dump(stats.ls(data)).items():
+                    write_frame(out, u"entry", [key, value])
+            else:
+                papi_fn = getattr(stats, data[u"api_name"])
+                write_frame(
+                    out, u"item", papi_fn(**data.get(u"api_args", {}))
+                )
+    out.flush()
+    return u""
+
+
 def process_stats_request(args):
     """Process the VPP Stats requests.
 
@@ -268,6 +462,7 @@ def main():
         request=process_json_request,
         dump=process_json_request,
         stats=process_stats,
+        stats_agent=process_stats_agent,
         stats_request=process_stats_request
     )
 
@@ -281,15 +476,21 @@ def main():
         help=u"Specifies the VPP API methods: "
              u"1. request - simple request / reply; "
              u"2. dump - dump function;"
-             u"3. stats - VPP statistics."
+             u"3. stats - VPP statistics; "
+             u"4. stats_agent - VPP statistics, requests read from stdin."
     )
     parser.add_argument(
-        u"-d", u"--data", required=True,
+        u"-d", u"--data", default=u"[]",
         help=u"If the method is 'request' or 'dump', data is a JSON string "
              u"(list) containing API name(s) and its/their input argument(s). "
              u"If the method is 'stats', data is a JSON string containing t"
              u"he list of path(s) to the required data."
     )
+    parser.add_argument(
+        u"-f", u"--framed", action=u"store_true",
+        help=u"Read input from stdin and write output to stdout as frames "
+             u"of JSON (see module docstring). The --data is ignored."
+    )
     parser.add_argument(
         u"-s", u"--socket", default=u"/var/run/vpp/stats.sock",
         help=u"A file descriptor over the VPP stats Unix domain socket. "
@@ -298,6 +499,8 @@ def main():
 
     args = parser.parse_args()
 
+    if args.framed and args.method != u"stats_agent":
+        return process_framed(args)
     return process_request[args.method](args)
 
 